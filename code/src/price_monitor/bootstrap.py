@@ -1,8 +1,19 @@
 import json
 from pathlib import Path
 
-from src.price_monitor.utils.adls import AzureDataLakeStorage
+import click
+
+from src.price_monitor.utils.adls import (
+    AzureDataLakeStorage,
+    DataRequirement,
+    register_lazy_fetch,
+)
+from src.price_monitor.utils.browser_pool import get_browser_pool, init_browser_pool
+from src.price_monitor.utils.http_recorder import get_recorder, init_recorder
 from src.price_monitor.utils.logger import init_logging_handler
+from src.price_monitor.utils.metrics import init_metrics, write_reports
+from src.price_monitor.utils.parse_pool import get_parse_pool, init_parse_pool
+from src.price_monitor.utils.scheduler import init_scheduler
 
 
 def __init_config(
@@ -36,6 +47,7 @@ def initialize(
     market: str = None,
     output: str = None,
     directory: str = None,
+    requirements: list[DataRequirement] = None,
 ):
     # Initialising config
     config = __init_config(
@@ -48,21 +60,41 @@ def initialize(
     )
     # Initialising logging handlers(GCP/File Based)
     init_logging_handler(config)
+    # Metrics of the command are written to the output directory by finalize
+    init_metrics(config)
+    # Worker cap shared by all the scrapers of the run
+    init_scheduler(config)
+    # Processes the fetched pages are parsed in, when configured
+    init_parse_pool(config)
+    # Browser sessions shared by the scrapers driving the vendor sites
+    init_browser_pool(config)
+    # Vendor requests are recorded into or replayed from cassettes when configured
+    init_recorder(config)
 
-    adls = initialize_adls(config)
+    adls = initialize_adls(config, requirements)
 
     return config, adls
 
 
-def initialize_adls(config):
+def initialize_adls(config, requirements: list[DataRequirement] = None):
     adls = None
     if config.get("adls", {}).get("enabled", False):
         adls = AzureDataLakeStorage(config)
-        adls.download_folder_from_adls()
+        # Commands declaring the data they read only get that, the rest is fetched when loaded
+        if requirements is None:
+            adls.download_folder_from_adls()
+        else:
+            adls.prefetch(requirements)
+    register_lazy_fetch(adls)
 
     return adls
 
 
 def finalize(adls):
+    context = click.get_current_context(silent=True)
+    write_reports(context.info_name if context else "price-monitor")
+    get_recorder().save()
+    get_parse_pool().shutdown()
+    get_browser_pool().shutdown()
     if adls:
         adls.upload_folder_to_adls()
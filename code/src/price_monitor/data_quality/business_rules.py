@@ -9,6 +9,7 @@ from src.price_monitor.data_quality.dqutils import (
     get_column_mapping,
     iterate_df_append_rules,
 )
+from src.price_monitor.utils.logger import SampledLog
 
 
 class BusinessRules:
@@ -421,13 +422,19 @@ def apply_rule_to_dataframe(
     """
     total_rows = len(dataframe)
     violations = 0
+    sampled_warning = SampledLog(logger)
 
     for index, row in dataframe.iterrows():
         if not rule_function(row, column_mapping):
             violations += 1
-            logger.warning(
-                f"[{market}-{vendor}] Rule '{rule_name}' violated at row {index}."
+            sampled_warning(
+                "[{}-{}] Rule '{}' violated at row {}.",
+                market,
+                vendor,
+                rule_name,
+                index,
             )
+    sampled_warning.summarize(f"[{market}-{vendor}] ")
 
     success_percentage = (
         ((total_rows - violations) / total_rows) * 100 if total_rows > 0 else 0
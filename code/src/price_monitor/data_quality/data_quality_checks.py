@@ -8,12 +8,15 @@ from src.price_monitor.repository.line_item_repository import (
     FileSystemLineItemRepository,
 )
 from src.price_monitor.utils.clock import today_dashed_str_with_key
+from src.price_monitor.utils.logger import SampledLog
 
 
 class DataQualityCheck:
     def __init__(self, line_item_repository: FileSystemLineItemRepository):
         self.line_item_repository = line_item_repository
         self.NEW_LINE_CHARACTER = "\n"
+        # Checks run per line item and per option, a bad dataset would flood the logs otherwise
+        self.sampled_warning = SampledLog(logger)
         self.market = ""
         self.vendor = ""
 
@@ -51,45 +54,79 @@ class DataQualityCheck:
                 self._check_for_included_and_excluded_option_count(line_item)
                 if self.vendor != Vendor.BMW:
                     self._check_for_included_options_with_non_zero_price(line_item)
+            self.sampled_warning.summarize(f"[{self.market}-{self.vendor}] ")
 
     def _check_for_included_and_excluded_option_count(self, line_item):
         number_options_included = 0
         number_options_excluded = 0
         for option in line_item.line_option_codes:
             if not isinstance(option.included, bool):
-                logger.warning(
-                    f"[{self.market}-{self.vendor}] Expected to be Boolean but Found {type(option.included)}"
+                self.sampled_warning(
+                    "[{}-{}] Expected to be Boolean but Found {}",
+                    self.market,
+                    self.vendor,
+                    type(option.included),
                 )
             if bool(option.included):
                 number_options_included += 1
             else:
                 number_options_excluded += 1
         if number_options_included == 0:
-            logger.warning(
-                f"[{self.market}-{self.vendor}] Zero count of options included for options in model_range:{line_item.model_range_description} model_description:{line_item.model_description} line_description:{line_item.line_description}"
+            self.sampled_warning(
+                "[{}-{}] Zero count of options included for options in model_range:{} model_description:{} line_description:{}",
+                self.market,
+                self.vendor,
+                line_item.model_range_description,
+                line_item.model_description,
+                line_item.line_description,
             )
         if number_options_excluded == 0:
-            logger.warning(
-                f"[{self.market}-{self.vendor}] Zero count of options excluded for options in model_range:{line_item.model_range_description} model_description:{line_item.model_description} line_description:{line_item.line_description}"
+            self.sampled_warning(
+                "[{}-{}] Zero count of options excluded for options in model_range:{} model_description:{} line_description:{}",
+                self.market,
+                self.vendor,
+                line_item.model_range_description,
+                line_item.model_description,
+                line_item.line_description,
             )
 
     def _check_for_new_line_character_in_descriptions(self, line_item):
         if self._check_for_new_line_character(line_item.model_range_description):
-            logger.warning(
-                f"[{self.market}-{self.vendor}] New Line Character Error in Model_Range_Description for model_range:{line_item.model_range_description} model_description:{line_item.model_description} line_description:{line_item.line_description}"
+            self.sampled_warning(
+                "[{}-{}] New Line Character Error in Model_Range_Description for model_range:{} model_description:{} line_description:{}",
+                self.market,
+                self.vendor,
+                line_item.model_range_description,
+                line_item.model_description,
+                line_item.line_description,
             )
         if self._check_for_new_line_character(line_item.model_description):
-            logger.warning(
-                f"[{self.market}-{self.vendor}] New Line Character Error in Model_Description for model_range:{line_item.model_range_description} model_description:{line_item.model_description} line_description:{line_item.line_description}"
+            self.sampled_warning(
+                "[{}-{}] New Line Character Error in Model_Description for model_range:{} model_description:{} line_description:{}",
+                self.market,
+                self.vendor,
+                line_item.model_range_description,
+                line_item.model_description,
+                line_item.line_description,
             )
         if self._check_for_new_line_character(line_item.line_description):
-            logger.warning(
-                f"[{self.market}-{self.vendor}] New Line Character Error in Line_Description for model_range:{line_item.model_range_description} model_description:{line_item.model_description} line_description:{line_item.line_description}"
+            self.sampled_warning(
+                "[{}-{}] New Line Character Error in Line_Description for model_range:{} model_description:{} line_description:{}",
+                self.market,
+                self.vendor,
+                line_item.model_range_description,
+                line_item.model_description,
+                line_item.line_description,
             )
         for option in line_item.line_option_codes:
             if self._check_for_new_line_character(option.description):
-                logger.warning(
-                    f"[{self.market}-{self.vendor}] New Line Character Error in Option_Description for model_range:{line_item.model_range_description} model_description:{line_item.model_description} line_description:{line_item.line_description}"
+                self.sampled_warning(
+                    "[{}-{}] New Line Character Error in Option_Description for model_range:{} model_description:{} line_description:{}",
+                    self.market,
+                    self.vendor,
+                    line_item.model_range_description,
+                    line_item.model_description,
+                    line_item.line_description,
                 )
 
     def _check_for_new_line_character(self, description):
@@ -112,12 +149,12 @@ class DataQualityCheck:
         if self.vendor == Vendor.AUDI and self.market == Market.DE:
             return
         if float(gross_list_price) < 0:
-            logger.warning(
-                f"[{self.market}-{self.vendor}] {source} Negative Gross List Price"
+            self.sampled_warning(
+                "[{}-{}] {} Negative Gross List Price", self.market, self.vendor, source
             )
         if float(net_list_price) < 0:
-            logger.warning(
-                f"[{self.market}-{self.vendor}] {source} Negative Net List Price"
+            self.sampled_warning(
+                "[{}-{}] {} Negative Net List Price", self.market, self.vendor, source
             )
 
     def _check_for_included_options_with_non_zero_price(self, line_item):
@@ -131,8 +168,13 @@ class DataQualityCheck:
                     or self.vendor is Vendor.BMW
                 )
             ):
-                logger.warning(
-                    f"[{self.market}-{self.vendor}] Option Included has Non-Zero Price for model_range:{line_item.model_range_description} model_description:{line_item.model_description} line_description:{line_item.line_description}"
+                self.sampled_warning(
+                    "[{}-{}] Option Included has Non-Zero Price for model_range:{} model_description:{} line_description:{}",
+                    self.market,
+                    self.vendor,
+                    line_item.model_range_description,
+                    line_item.model_description,
+                    line_item.line_description,
                 )
 
     def _check_for_model_duplication(self, line_items: list[LineItem]):
@@ -8,6 +8,7 @@ from src.price_monitor.repository.finance_item_repository import (
     FileSystemFinanceLineItemRepository,
 )
 from src.price_monitor.utils.clock import today_dashed_str_with_key
+from src.price_monitor.utils.logger import SampledLog
 
 
 class DataQualityCheckFinance:
@@ -16,6 +17,8 @@ class DataQualityCheckFinance:
     ):
         self.finance_line_item_repository = finance_line_item_repository
         self.NEW_LINE_CHARACTER = "\n"
+        # Checks run per line item and per option, a bad dataset would flood the logs otherwise
+        self.sampled_warning = SampledLog(logger)
         self.market = ""
         self.vendor = ""
 
@@ -56,21 +59,37 @@ class DataQualityCheckFinance:
                     self._check_for_no_of_installments_not_higher_than_contract_duration(
                         finance_line_item
                     )
+            self.sampled_warning.summarize(f"[{self.market}-{self.vendor}] ")
 
     def _check_for_new_line_character_in_descriptions(self, finance_line_item):
         if self._check_for_new_line_character(
             finance_line_item.model_range_description
         ):
-            logger.warning(
-                f"[{self.market}-{self.vendor}] New Line Character Error in Model_Range_Description for model_range:{finance_line_item.model_range_description} model_description:{finance_line_item.model_description} line_description:{finance_line_item.line_description}"
+            self.sampled_warning(
+                "[{}-{}] New Line Character Error in Model_Range_Description for model_range:{} model_description:{} line_description:{}",
+                self.market,
+                self.vendor,
+                finance_line_item.model_range_description,
+                finance_line_item.model_description,
+                finance_line_item.line_description,
             )
         if self._check_for_new_line_character(finance_line_item.model_description):
-            logger.warning(
-                f"[{self.market}-{self.vendor}] New Line Character Error in Model_Description for model_range:{finance_line_item.model_range_description} model_description:{finance_line_item.model_description} line_description:{finance_line_item.line_description}"
+            self.sampled_warning(
+                "[{}-{}] New Line Character Error in Model_Description for model_range:{} model_description:{} line_description:{}",
+                self.market,
+                self.vendor,
+                finance_line_item.model_range_description,
+                finance_line_item.model_description,
+                finance_line_item.line_description,
             )
         if self._check_for_new_line_character(finance_line_item.line_description):
-            logger.warning(
-                f"[{self.market}-{self.vendor}] New Line Character Error in Line_Description for model_range:{finance_line_item.model_range_description} model_description:{finance_line_item.model_description} line_description:{finance_line_item.line_description}"
+            self.sampled_warning(
+                "[{}-{}] New Line Character Error in Line_Description for model_range:{} model_description:{} line_description:{}",
+                self.market,
+                self.vendor,
+                finance_line_item.model_range_description,
+                finance_line_item.model_description,
+                finance_line_item.line_description,
             )
 
     def _check_for_new_line_character(self, description):
@@ -78,12 +97,22 @@ class DataQualityCheckFinance:
 
     def _check_for_negative_price_for_line(self, finance_line_item: FinanceLineItem):
         if float(finance_line_item.monthly_rental_glp) < 0:
-            logger.warning(
-                f"[{self.market}-{self.vendor}] Negative Monthly Rental GLP for model_range:{finance_line_item.model_range_description} model_description:{finance_line_item.model_description} line_description:{finance_line_item.line_description}"
+            self.sampled_warning(
+                "[{}-{}] Negative Monthly Rental GLP for model_range:{} model_description:{} line_description:{}",
+                self.market,
+                self.vendor,
+                finance_line_item.model_range_description,
+                finance_line_item.model_description,
+                finance_line_item.line_description,
             )
         if float(finance_line_item.monthly_rental_nlp) < 0:
-            logger.warning(
-                f"[{self.market}-{self.vendor}] Negative Monthly Rental NLP for model_range:{finance_line_item.model_range_description} model_description:{finance_line_item.model_description} line_description:{finance_line_item.line_description}"
+            self.sampled_warning(
+                "[{}-{}] Negative Monthly Rental NLP for model_range:{} model_description:{} line_description:{}",
+                self.market,
+                self.vendor,
+                finance_line_item.model_range_description,
+                finance_line_item.model_description,
+                finance_line_item.line_description,
             )
 
     def _check_for_model_duplication(self, finance_line_items: list[FinanceLineItem]):
@@ -112,14 +141,19 @@ class DataQualityCheckFinance:
             logger.warning(f"[{self.market}-{self.vendor}] Duplication of Models Found")
             for item, count in collections.Counter(finance_line_item_list).items():
                 if count > 1:
-                    logger.warning(f"{item}\n")
+                    self.sampled_warning("{}\n", item)
 
     def _check_for_number_of_instalments_higher_than_zero(
         self, finance_line_item: FinanceLineItem
     ):
         if finance_line_item.number_of_installments <= 0:
-            logger.warning(
-                f"[{self.market}-{self.vendor}] No. of Installments Zero for model_range:{finance_line_item.model_range_description} model_description:{finance_line_item.model_description} line_description:{finance_line_item.line_description}"
+            self.sampled_warning(
+                "[{}-{}] No. of Installments Zero for model_range:{} model_description:{} line_description:{}",
+                self.market,
+                self.vendor,
+                finance_line_item.model_range_description,
+                finance_line_item.model_description,
+                finance_line_item.line_description,
             )
 
     def _check_for_no_of_installments_not_higher_than_contract_duration(
@@ -130,6 +164,11 @@ class DataQualityCheckFinance:
             int(finance_line_item.term_of_agreement)
             < finance_line_item.number_of_installments
         ):
-            logger.warning(
-                f"[{self.market}-{self.vendor}] No. of installments is greater then contract duration for model_range:{finance_line_item.model_range_description} model_description:{finance_line_item.model_description} line_description:{finance_line_item.line_description}"
+            self.sampled_warning(
+                "[{}-{}] No. of installments is greater then contract duration for model_range:{} model_description:{} line_description:{}",
+                self.market,
+                self.vendor,
+                finance_line_item.model_range_description,
+                finance_line_item.model_description,
+                finance_line_item.line_description,
             )
@@ -55,7 +55,7 @@ class ScraperVerificationSample:
                 if self.current_index >= num_columns:
                     self.current_index = 0
             logger.debug(
-                f"Selected columns for car at index {car_index}: {selected_columns}"
+                "Selected columns for car at index {}: {}", car_index, selected_columns
             )
             return selected_columns
 
@@ -95,8 +95,10 @@ class ScraperVerificationSample:
             sample_length = len(self.df)
             # Ensure we don't exceed the available cars in the data
             logger.debug(
-                f"Total Cars: {num_cars}, Additional Columns: {num_additional_columns}, "
-                f"Number of Cars Needed: {cars_needed_to_cover_columns}"
+                "Total Cars: {}, Additional Columns: {}, Number of Cars Needed: {}",
+                num_cars,
+                num_additional_columns,
+                cars_needed_to_cover_columns,
             )
 
             sampled_data = []  # List to collect sampled data
@@ -135,7 +137,7 @@ class ScraperVerificationSample:
             self.sampled_cars = pd.concat(
                 sampled_data, ignore_index=True
             )  # Use pd.concat to combine data
-            logger.debug(f"Sampled results: {self.sampled_cars}")
+            logger.debug("Sampled results: {}", self.sampled_cars)
             return self.sampled_cars
 
         except Exception as e:
@@ -64,7 +64,7 @@ class BusinessInsights:
         :param parameter: the name of the cofig-file key to be obtained from config file
         :param log_statement: what is to be checked for eg. zero, null or special character
         """
-        logger.debug(f"Starting {log_statement} completeness check.")
+        logger.debug("Starting {} completeness check.", log_statement)
         acceptable_columns = self._get_acceptable_columns(
             parameter=parameter, log_statement=log_statement
         )
@@ -92,7 +92,10 @@ class BusinessInsights:
                     overall_score -= row_weight
                 else:
                     logger.debug(
-                        f"Column {column_name} passed {log_statement} check with 0% {log_statement}."
+                        "Column {} passed {} check with 0% {}.",
+                        column_name,
+                        log_statement,
+                        log_statement,
                     )
 
         self.append_overall_result(
@@ -103,7 +106,7 @@ class BusinessInsights:
             metric="Completeness",
             insight_type=f"{log_statement} check",
         )
-        logger.debug(f"{log_statement} completeness check completed.")
+        logger.debug("{} completeness check completed.", log_statement)
 
     def check_column_equality(self, data: pd.DataFrame):
         logger.debug("Starting equality checks for specified column pairs")
@@ -239,7 +242,9 @@ class BusinessInsights:
             # Check if all detected types are within the allowed types
             if all(detected_type in allowed_types for detected_type in data_type_list):
                 logger.debug(
-                    f"Column {column_name} passed data type consistency check with types: {data_type_list}."
+                    "Column {} passed data type consistency check with types: {}.",
+                    column_name,
+                    data_type_list,
                 )
             else:
                 # Identify any data types that are not allowed
@@ -380,7 +385,7 @@ class BusinessInsights:
         acceptable_columns = self.config["data_quality_finance"][
             "acceptable_columns_check"
         ]["field_requirements"][parameter]
-        logger.debug(f"{log_statement} acceptable columns: {acceptable_columns}")
+        logger.debug("{} acceptable columns: {}", log_statement, acceptable_columns)
         return acceptable_columns
 
     def check_standard_deviation(self, data: pd.DataFrame):
@@ -408,7 +413,7 @@ class BusinessInsights:
 
         if unique_vendor_str not in vendor_std_devs:
             logger.debug(
-                f"Vendor {unique_vendor_str} is not in the config. Skipping checks."
+                "Vendor {} is not in the config. Skipping checks.", unique_vendor_str
             )
             return
 
@@ -459,8 +464,12 @@ class BusinessInsights:
 
                 if not (lower_bound <= std_dev_value <= upper_bound):
                     logger.debug(
-                        f"Column {column_name} for vendor {vendor} has an out-of-range standard deviation. "
-                        f"Actual: {std_dev_value}, Expected: {config_std_dev} ± {tolerance}%."
+                        "Column {} for vendor {} has an out-of-range standard deviation. Actual: {}, Expected: {} ± {}%.",
+                        column_name,
+                        vendor,
+                        std_dev_value,
+                        config_std_dev,
+                        tolerance,
                     )
                     self.append_overall_failures(
                         vendor,
@@ -495,7 +504,7 @@ class BusinessInsights:
         row_weight = 100.0 / (num_rows - len(acceptable_columns))
         overall_score = 100.0
         logger.debug(
-            f"Initialized overall score: {overall_score}, row weight: {row_weight}."
+            "Initialized overall score: {}, row weight: {}.", overall_score, row_weight
         )
         return overall_score, row_weight
 
@@ -508,7 +517,9 @@ class BusinessInsights:
         unique_market = data["market"].unique()
         unique_market_str = ", ".join(map(str, unique_market))
         logger.debug(
-            f"Unique vendors: {unique_vendor_str}, Unique markets: {unique_market_str}."
+            "Unique vendors: {}, Unique markets: {}.",
+            unique_vendor_str,
+            unique_market_str,
         )
         return unique_vendor_str, unique_market_str
 
@@ -524,7 +535,7 @@ class BusinessInsights:
         """
         Append the overall result after all rows have been checked.
         """
-        logger.debug(f"Appending overall result with score: {overall_score}%.")
+        logger.debug("Appending overall result with score: {}%.", overall_score)
         self.results.append(
             QualityMetricsOutput(
                 vendor=unique_vendor_str,
@@ -549,7 +560,7 @@ class BusinessInsights:
         """
         Append the overall result after all rows have been checked.
         """
-        logger.debug(f"Appending overall failures with score: {overall_score}%.")
+        logger.debug("Appending overall failures with score: {}%.", overall_score)
         self.failures.append(
             QualityRulesOutput(
                 vendor=unique_vendor_str,
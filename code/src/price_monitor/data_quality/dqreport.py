@@ -16,7 +16,7 @@ class DataQualityChecker:
         self.config = config
         self.recorded_at = current_timestamp_dashed_str_with_timezone()
         logger.debug(
-            f"Initialized DataQualityChecker for vendor: {vendor}, market: {market}"
+            "Initialized DataQualityChecker for vendor: {}, market: {}", vendor, market
         )
 
     def run_all_checks(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -129,7 +129,7 @@ class DataQualityChecker:
             )
         else:
             logger.debug(
-                f"Column '{column_name}' is consistent with type: {unique_types}"
+                "Column '{}' is consistent with type: {}", column_name, unique_types
             )
 
         return QualityReportOutput(
@@ -184,7 +184,7 @@ class DataQualityChecker:
             )
         else:
             logger.debug(
-                f"Column '{series.name}' is consistent with type: {unique_types}"
+                "Column '{}' is consistent with type: {}", series.name, unique_types
             )
         return QualityReportOutput(
             total_count=total_count,
@@ -211,14 +211,18 @@ class DataQualityChecker:
             else 0
         )
         if null_percentage > 0:
-            logger.debug(f"Column '{column_name}' has '{null_percentage}'% null values")
+            logger.debug(
+                "Column '{}' has '{}'% null values", column_name, null_percentage
+            )
         zero_percentage = self.round_to_two_decimals(
             (report.zero_count / report.total_count) * 100
             if report.total_count > 0
             else 0
         )
         if zero_percentage > 0:
-            logger.debug(f"Column '{column_name}' has '{zero_percentage}'% zero values")
+            logger.debug(
+                "Column '{}' has '{}'% zero values", column_name, zero_percentage
+            )
         distinct_percentage = self.round_to_two_decimals(
             (report.distinct_count / report.total_count) * 100
             if report.total_count > 0
@@ -242,11 +246,15 @@ class DataQualityChecker:
         )
         if special_char_percentage > 0:
             logger.debug(
-                f"Column '{column_name}' has '{special_char_percentage}'% special character present"
+                "Column '{}' has '{}'% special character present",
+                column_name,
+                special_char_percentage,
             )
         if special_char_count > 0:
             logger.debug(
-                f"Column '{column_name}' contains special characters in {special_char_count} rows."
+                "Column '{}' contains special characters in {} rows.",
+                column_name,
+                special_char_count,
             )
         result = {
             "vendor": self.vendor,
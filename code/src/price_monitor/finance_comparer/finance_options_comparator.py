@@ -7,6 +7,7 @@ from src.price_monitor.finance_comparer.finance_line_difference_checker import (
 from src.price_monitor.finance_comparer.difference_finance_item_repository import (
     DifferenceFinanceItemRepository,
 )
+from src.price_monitor.model.finance_line_item import FinanceLineItem
 from src.price_monitor.repository.finance_item_repository import (
     FileSystemFinanceLineItemRepository,
 )
@@ -14,33 +15,53 @@ from src.price_monitor.utils.clock import (
     today_dashed_str_with_key,
     yesterday_dashed_str_with_key,
 )
+from src.price_monitor.utils.profiler import profile_stage
 
 
 class FinanceOptionsComparator:
-    def __init__(self, config) -> None:
+    def __init__(
+        self,
+        config,
+        finance_item_repository: FileSystemFinanceLineItemRepository | None = None,
+    ) -> None:
         self.differences_finance_item_repository = DifferenceFinanceItemRepository(
             config=config
         )
-        self.finance_item_repository = FileSystemFinanceLineItemRepository(
-            config=config
+        self.finance_item_repository = (
+            finance_item_repository
+            or FileSystemFinanceLineItemRepository(config=config)
         )
 
-    def compare(self):
+    def compare(
+        self,
+        today_line_items: list[FinanceLineItem] | None = None,
+        prev_day_line_items: list[FinanceLineItem] | None = None,
+    ) -> list[DifferenceFinanceItem]:
 
-        differences = self._load_differences()
+        differences = self._load_differences(today_line_items, prev_day_line_items)
 
         self.differences_finance_item_repository.save(
             differences, DifferenceFinanceItem
         )
+        return differences
 
-    def _load_differences(self) -> list[DifferenceFinanceItem]:
-        prev_day_line_items = self.finance_item_repository.load(
-            date=yesterday_dashed_str_with_key()
-        )
-        today_line_items = self.finance_item_repository.load(
-            date=today_dashed_str_with_key()
-        )
+    def _load_differences(
+        self,
+        today_line_items: list[FinanceLineItem] | None = None,
+        prev_day_line_items: list[FinanceLineItem] | None = None,
+    ) -> list[DifferenceFinanceItem]:
+        # Snapshots already in memory are only read from disk when they are not provided
+        with profile_stage("load"):
+            if prev_day_line_items is None:
+                prev_day_line_items = self.finance_item_repository.load(
+                    date=yesterday_dashed_str_with_key()
+                )
+            if today_line_items is None:
+                today_line_items = self.finance_item_repository.load(
+                    date=today_dashed_str_with_key()
+                )
 
-        return check_item_differences(
-            current=today_line_items, previous=prev_day_line_items
-        )
+        with profile_stage("compare"):
+            return check_item_differences(
+                current=today_line_items, previous=prev_day_line_items
+            )
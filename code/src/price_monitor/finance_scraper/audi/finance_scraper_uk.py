@@ -1,7 +1,6 @@
 import json
 import urllib
-from asyncio import Future
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future
 from typing import List
 
 from loguru import logger
@@ -34,7 +33,9 @@ from src.price_monitor.repository.finance_item_repository import (
 )
 from src.price_monitor.price_scraper.constants import E2E_TEST_LIST_SIZE
 from src.price_monitor.utils.caller import execute_request
+from src.price_monitor.utils.catalog_cache import CatalogKind, fetch_catalog
 from src.price_monitor.utils.clock import yesterday_dashed_str_with_key
+from src.price_monitor.utils.scheduler import TaskPriority, get_scheduler
 
 
 def find_available_finance_model_ranges(session: Session) -> list[dict]:
@@ -66,22 +67,22 @@ class FinanceScraperAudiUk:
                 :E2E_TEST_LIST_SIZE
             ]
         jobs: List[Future] = []
-        with ThreadPoolExecutor(
-            thread_name_prefix="audi_uk_finance_scraper",
-            max_workers=len(finance_able_model_ranges),
-        ) as ex:
-            for model_range in finance_able_model_ranges:
-                logger.debug(
-                    f"Fetching finance options for {model_range['model_range_code']}  {model_range['model_range_description']}"
-                )
-                scraped_line_jobs = ex.submit(
-                    self._scrape_finance_option_for_model, model_range
-                )
-                jobs.append(scraped_line_jobs)
-            for job in jobs:
-                finance_line_item = job.result()
-                if finance_line_item is not None:
-                    response.extend(job.result())
+        scheduler = get_scheduler()
+        for model_range in finance_able_model_ranges:
+            logger.debug(
+                "Fetching finance options for {}  {}",
+                model_range["model_range_code"],
+                model_range["model_range_description"],
+            )
+            scraped_line_jobs = scheduler.submit(
+                self._scrape_finance_option_for_model,
+                model_range,
+                priority=TaskPriority.HIGH,
+            )
+            jobs.append(scraped_line_jobs)
+        for finance_line_item in scheduler.gather(jobs):
+            if finance_line_item is not None:
+                response.extend(finance_line_item)
         logger.info(f"[{self.market}] scraped {len(response)} Finance Items for Audi")
         return response
 
@@ -179,10 +180,19 @@ class FinanceScraperAudiUk:
 
         finance_line_items = []
 
-        for model_code, alt_key in alt_keys.items():
-            finance_line_items.extend(
-                self._get_available_finance_options(alt_key, model_details[model_code])
+        # The finance options of the trims are independent requests, they are fetched concurrently
+        scheduler = get_scheduler()
+        jobs = [
+            scheduler.submit(
+                self._get_available_finance_options,
+                alt_key,
+                model_details[model_code],
+                priority=TaskPriority.HIGH,
             )
+            for model_code, alt_key in alt_keys.items()
+        ]
+        for available_finance_options in scheduler.gather(jobs):
+            finance_line_items.extend(available_finance_options)
 
         return finance_line_items
 
@@ -217,21 +227,23 @@ class FinanceScraperAudiUk:
         headers = {
             "content-type": "application/json",
         }
-        finance_options_json = execute_request(
-            "post", url, self.session, body=payload, headers=headers
+        finance_options_json = self._post_finance_request(
+            CatalogKind.FINANCE_PRODUCTS, url, payload, headers
         )
         finance_options = parse_finance_options(finance_options_json)
 
-        finance_line_items = []
-
-        for finance_option in finance_options:
-            finance_line_items.append(
-                self._get_finance_details_for_finance_option(
-                    finance_option, alt_key, model
-                )
+        scheduler = get_scheduler()
+        jobs = [
+            scheduler.submit(
+                self._get_finance_details_for_finance_option,
+                finance_option,
+                alt_key,
+                model,
+                priority=TaskPriority.HIGH,
             )
-
-        return finance_line_items
+            for finance_option in finance_options
+        ]
+        return scheduler.gather(jobs)
 
     def _get_finance_details_for_finance_option(
         self, finance_option: dict, alt_key: str, model: dict
@@ -276,8 +288,8 @@ class FinanceScraperAudiUk:
             parameters.append({"@ID": "FcmLevels", "#text": "None"})
         payload["Request"]["Product"]["Parameter"] = parameters
 
-        finance_option_details_json = execute_request(
-            "post", url, self.session, body=payload, headers=headers
+        finance_option_details_json = self._post_finance_request(
+            CatalogKind.FINANCE_PRODUCT_DETAILS, url, payload, headers
         )
 
         if is_pcp:
@@ -296,3 +308,17 @@ class FinanceScraperAudiUk:
             )
 
         return finance_line_item
+
+    def _post_finance_request(
+        self, kind: CatalogKind, url: str, payload: dict, headers: dict
+    ) -> dict:
+        # Trims sharing a cap code, price and year send identical requests, each one is sent once per run
+        return fetch_catalog(
+            kind,
+            self.vendor,
+            self.market,
+            f"{url} {json.dumps(payload, sort_keys=True)}",
+            lambda: execute_request(
+                "post", url, self.session, body=payload, headers=headers
+            ),
+        )
@@ -1 +1,4 @@
 BMW_UK_FINANCE_OPTION_URL = "https://sf-mco.aws.bmw.cloud/online-calculation-service/calculation/brands/bmwCar/countries/GB/languages/en?version=1"
+
+# Finance products of a line are detailed with at most this many requests in flight
+MAX_CONCURRENT_FINANCE_PRODUCT_REQUESTS = 3
@@ -1,7 +1,13 @@
+import math
+from concurrent.futures import Future
+
 import requests
 from loguru import logger
 
-from src.price_monitor.finance_scraper.bmw.constants import BMW_UK_FINANCE_OPTION_URL
+from src.price_monitor.finance_scraper.bmw.constants import (
+    BMW_UK_FINANCE_OPTION_URL,
+    MAX_CONCURRENT_FINANCE_PRODUCT_REQUESTS,
+)
 from src.price_monitor.finance_scraper.bmw.finance_parser import (
     parse_finance_line_item,
     parse_finance_line_item_for_pcp,
@@ -30,7 +36,9 @@ from src.price_monitor.price_scraper.bmw.scraper import (
 )
 from src.price_monitor.price_scraper.constants import E2E_TEST_LIST_SIZE
 from src.price_monitor.utils.caller import execute_request
+from src.price_monitor.utils.catalog_cache import CatalogKind, fetch_catalog
 from src.price_monitor.utils.clock import yesterday_dashed_str_with_key
+from src.price_monitor.utils.scheduler import TaskPriority, get_scheduler
 
 
 def get_available_options(
@@ -184,8 +192,11 @@ def get_lowest_price_metallic_paint(
 
     for paint in metallic_paints:
         if paint["paint_code"] == metallic_paint_prices[0]["paint_code"]:
-            paint["paint_price"] = metallic_paint_prices[0]["paint_price"]
-            lowest_price_metallic_paint = paint
+            # The paints are shared by the lines of the model, the price goes on a copy
+            lowest_price_metallic_paint = {
+                **paint,
+                "paint_price": metallic_paint_prices[0]["paint_price"],
+            }
 
     return lowest_price_metallic_paint
 
@@ -229,13 +240,29 @@ class FinanceScraperBMWUk:
 
         self.token = get_updated_token()
 
+        jobs: list[Future] = []
+        scheduler = get_scheduler()
         for line_item in parsed_line_items:
             logger.debug(
-                f"Fetching finance options for line item {line_item.series, line_item.model_range_code, line_item.model_range_description, line_item.model_code, line_item.model_description, line_item.line_description}"
+                "Fetching finance options for line item {}",
+                (
+                    line_item.series,
+                    line_item.model_range_code,
+                    line_item.model_range_description,
+                    line_item.model_code,
+                    line_item.model_description,
+                    line_item.line_description,
+                ),
             )
-            finance_line_items = self.get_finance_option_for_line(
-                line_item, model_matrix
+            jobs.append(
+                scheduler.submit(
+                    self.get_finance_option_for_line,
+                    line_item,
+                    model_matrix,
+                    priority=TaskPriority.HIGH,
+                )
             )
+        for finance_line_items in scheduler.gather(jobs):
             response.extend(finance_line_items)
 
         logger.info(f"[UK] scraped {len(response)} Finance Items for BMW")
@@ -277,30 +304,46 @@ class FinanceScraperBMWUk:
 
             is_volt_48_variant = parse_is_volt_48(state_and_is_volt_48_content)
 
+            # The paints are requested for the trim of the line and priced with its selected options,
+            # only the lines sending the same requests share them
+            paints_key = f"{line_item.model_code}/{line_item.line_description}/{tax_date}/{effect_date}"
+
             # Get metallic paint list and non-metallic paint list
-            metallic_paints, non_metallic_paints = get_metallic_paints(
-                model_matrix,
-                line_item,
-                tax_date,
-                effect_date,
+            metallic_paints, non_metallic_paints = fetch_catalog(
+                CatalogKind.METALLIC_PAINTS,
+                self.vendor,
                 self.market,
-                self.session,
-                headers,
-                self.IX_MODELS,
+                paints_key,
+                lambda: get_metallic_paints(
+                    model_matrix,
+                    line_item,
+                    tax_date,
+                    effect_date,
+                    self.market,
+                    self.session,
+                    headers,
+                    self.IX_MODELS,
+                ),
             )
 
             # Get the lowest price metallic paint details
-            lowest_price_metallic_paint = get_lowest_price_metallic_paint(
-                metallic_paints,
-                line_item,
-                tax_date,
-                effect_date,
+            lowest_price_metallic_paint = fetch_catalog(
+                CatalogKind.LOWEST_PRICE_METALLIC_PAINT,
+                self.vendor,
                 self.market,
-                self.session,
-                headers,
-                selected_line_option_codes,
-                is_volt_48_variant,
-                self.IX_MODELS,
+                f"{paints_key}/{is_volt_48_variant}/{','.join(selected_line_option_codes)}",
+                lambda: get_lowest_price_metallic_paint(
+                    metallic_paints,
+                    line_item,
+                    tax_date,
+                    effect_date,
+                    self.market,
+                    self.session,
+                    headers,
+                    selected_line_option_codes,
+                    is_volt_48_variant,
+                    self.IX_MODELS,
+                ),
             )
 
             # Update selected line option codes with the lowest price metallic paint
@@ -343,19 +386,13 @@ class FinanceScraperBMWUk:
             request_response = execute_request(
                 "post", url, headers=headers, body=payload
             )
-            for finance_option in request_response["financeProductList"]:
-                finance_line_item = self.get_finance_line_item_for_finance_option(
-                    line_item,
-                    payload,
-                    finance_option["productId"],
-                    lowest_price_metallic_paint,
-                )
-                if finance_line_item is None:
-                    logger.error(
-                        f"Unable to fetch finance option details for {finance_option['productId']} for line item {line_item.series, line_item.model_range_code, line_item.model_range_description, line_item.model_code, line_item.model_description, line_item.line_description}"
-                    )
-                else:
-                    response.append(finance_line_item)
+            product_ids = [
+                finance_option["productId"]
+                for finance_option in request_response["financeProductList"]
+            ]
+            response = self._get_finance_line_items_for_products(
+                line_item, payload, product_ids, lowest_price_metallic_paint
+            )
             logger.info(
                 f"Got {len(response)} finance options for line item {line_item.series, line_item.model_range_code, line_item.model_range_description, line_item.model_code, line_item.model_description, line_item.line_description}"
             )
@@ -392,16 +429,65 @@ class FinanceScraperBMWUk:
             )
         return response
 
+    def _get_finance_line_items_for_products(
+        self, line_item, payload, product_ids, lowest_price_metallic_paint
+    ):
+        if len(product_ids) == 0:
+            return []
+
+        # The products are split in contiguous chunks detailed one after the other, so the requests of a line
+        # in flight are bounded and the finance line items keep the order of the products
+        chunk_size = math.ceil(
+            len(product_ids) / MAX_CONCURRENT_FINANCE_PRODUCT_REQUESTS
+        )
+        scheduler = get_scheduler()
+        jobs = [
+            scheduler.submit(
+                self._get_finance_line_items_for_product_chunk,
+                line_item,
+                payload,
+                product_ids[index : index + chunk_size],
+                lowest_price_metallic_paint,
+                priority=TaskPriority.HIGH,
+            )
+            for index in range(0, len(product_ids), chunk_size)
+        ]
+        return [
+            finance_line_item
+            for finance_line_items in scheduler.gather(jobs)
+            for finance_line_item in finance_line_items
+        ]
+
+    def _get_finance_line_items_for_product_chunk(
+        self, line_item, payload, product_ids, lowest_price_metallic_paint
+    ):
+        response = []
+        for product_id in product_ids:
+            finance_line_item = self.get_finance_line_item_for_finance_option(
+                line_item, payload, product_id, lowest_price_metallic_paint
+            )
+            if finance_line_item is None:
+                logger.error(
+                    f"Unable to fetch finance option details for {product_id} for line item {line_item.series, line_item.model_range_code, line_item.model_range_description, line_item.model_code, line_item.model_description, line_item.line_description}"
+                )
+            else:
+                response.append(finance_line_item)
+        return response
+
     def get_finance_line_item_for_finance_option(
         self, line_item, payload, product_id, lowest_price_metallic_paint
     ):
-        payload["financeProduct"] = {
-            "productId": product_id,
-            "parameters": [
-                {"id": "annualMileage", "value": 10000},
-                {"id": "downPaymentAmount/grossAmount", "value": 4999},
-                {"id": "term", "value": 48},
-            ],
+        # The payload of the line is shared by the requests of its products
+        payload = {
+            **payload,
+            "financeProduct": {
+                "productId": product_id,
+                "parameters": [
+                    {"id": "annualMileage", "value": 10000},
+                    {"id": "downPaymentAmount/grossAmount", "value": 4999},
+                    {"id": "term", "value": 48},
+                ],
+            },
         }
         headers = {
             "content-type": "application/json",
@@ -26,6 +26,8 @@ from src.price_monitor.utils.clock import yesterday_dashed_str_with_key
 
 
 class BMWFinanceScraper(FinanceVendorScraper):
+    vendor = Vendor.BMW
+
     def __init__(
         self,
         finance_line_item_repository: FileSystemFinanceLineItemRepository,
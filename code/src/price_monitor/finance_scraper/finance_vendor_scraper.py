@@ -1,11 +1,14 @@
-from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import Future
 
 from src.price_monitor.model.finance_line_item import FinanceLineItem
 from src.price_monitor.model.line_item import LineItem
-from src.price_monitor.model.vendor import Market
+from src.price_monitor.model.vendor import Market, Vendor
+from src.price_monitor.utils.scheduler import get_scheduler
 
 
 class FinanceVendorScraper:
+    vendor: Vendor | None = None
+
     def __init__(self, finance_line_item_repository, config):
         self.markets = None
         self.finance_line_item_repository = finance_line_item_repository
@@ -19,23 +22,22 @@ class FinanceVendorScraper:
 
         if len(self.get_markets_to_scrape()) > 0:
             scraper_market_jobs: list[Future] = []
-
-            with ThreadPoolExecutor(
-                thread_name_prefix="finance_scraper",
-                max_workers=len(self.get_markets_to_scrape()),
-            ) as ex:
-                for market in self.get_markets_to_scrape():
-                    scraper = self.__class__(
-                        self.finance_line_item_repository,
-                        self.config,
-                    )
-                    job_scrape_market = ex.submit(
-                        scraper.scrape_finance_options, market
-                    )
-                    scraper_market_jobs.append(job_scrape_market)
-
-            for job in scraper_market_jobs:
-                finance_line_item = job.result()
+            scheduler = get_scheduler()
+
+            for market in self.get_markets_to_scrape():
+                scraper = self.__class__(
+                    self.finance_line_item_repository,
+                    self.config,
+                )
+                job_scrape_market = scheduler.submit(
+                    scraper.scrape_finance_options,
+                    market,
+                    vendor=self.vendor,
+                    market=market,
+                )
+                scraper_market_jobs.append(job_scrape_market)
+
+            for finance_line_item in scheduler.gather(scraper_market_jobs):
                 if finance_line_item is not None:
                     finance_line_items_all_markets.extend(finance_line_item)
         return finance_line_items_all_markets
@@ -1,4 +1,4 @@
-from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import Future
 from typing import List
 
 from loguru import logger
@@ -15,6 +15,7 @@ from src.price_monitor.repository.finance_item_repository import (
     FileSystemFinanceLineItemRepository,
 )
 from src.price_monitor.utils.clock import today_dashed_str_with_key
+from src.price_monitor.utils.scheduler import TaskPriority, get_scheduler
 
 
 def scrape_finance(
@@ -57,16 +58,17 @@ def _start_scraper_jobs(scrapers: list[FinanceVendorScraper]):
     all_finance_options: List[FinanceLineItem] = []
 
     if len(scrapers) > 0:
-        with ThreadPoolExecutor(
-            thread_name_prefix="finance_scraper", max_workers=len(scrapers)
-        ) as ex:
-            for scraper_instance in scrapers:
-                job = ex.submit(_run_finance_scraper, scraper_instance)
-                scraper_jobs.append(job)
-
-        for job in scraper_jobs:
-            finance_line_item = job.result()
+        scheduler = get_scheduler()
+        for scraper_instance in scrapers:
+            job = scheduler.submit(
+                _run_finance_scraper,
+                scraper_instance,
+                vendor=scraper_instance.vendor,
+                priority=TaskPriority.LOW,
+            )
+            scraper_jobs.append(job)
 
+        for finance_line_item in scheduler.gather(scraper_jobs):
             if finance_line_item is not None:
                 all_finance_options.extend(finance_line_item)
 
@@ -1,3 +1,4 @@
+from concurrent.futures import Future
 from typing import List
 
 from loguru import logger
@@ -7,7 +8,7 @@ from src.price_monitor.finance_scraper.tesla.finance_parser import (
     parse_finance_line_items,
 )
 from src.price_monitor.finance_scraper.tesla.selenium import (
-    get_finance_details_for_model,
+    get_model_page_and_finance_details,
 )
 from src.price_monitor.model.finance_line_item import FinanceLineItem
 from src.price_monitor.model.vendor import Market, Vendor
@@ -15,12 +16,15 @@ from src.price_monitor.repository.finance_item_repository import (
     FileSystemFinanceLineItemRepository,
 )
 from src.price_monitor.price_scraper.tesla.parser import (
-    parse_line_items,
+    parse_lexicon,
     parse_model_and_series,
+    parse_trim_line_items,
 )
 from src.price_monitor.price_scraper.tesla.scraper import _find_available_models
+from src.price_monitor.utils.catalog_cache import CatalogKind, fetch_catalog
 from src.price_monitor.utils.clock import yesterday_dashed_str_with_key
-from src.price_monitor.utils.selenium_caller import selenium_execute_request
+from src.price_monitor.utils.parse_pool import parse_in_pool
+from src.price_monitor.utils.scheduler import TaskPriority, get_scheduler
 
 
 class FinanceScraperTeslaUk:
@@ -44,9 +48,19 @@ class FinanceScraperTeslaUk:
         if self.config.get("e2e_tests"):
             models = models[:1]
 
+        # The models are driven concurrently, as many at a time as the browser pool has sessions
+        jobs: List[Future] = []
+        scheduler = get_scheduler()
         for model in models:
-            logger.debug(f"Fetching finance options for model {model}")
-            finance_line_items = self.scrape_finance_option_for_model(model)
+            logger.debug("Fetching finance options for model {}", model)
+            jobs.append(
+                scheduler.submit(
+                    self.scrape_finance_option_for_model,
+                    model,
+                    priority=TaskPriority.HIGH,
+                )
+            )
+        for finance_line_items in scheduler.gather(jobs):
             response.extend(finance_line_items)
 
         logger.info(f"[UK] scraped {len(response)} Finance Items for Tesla")
@@ -56,10 +70,22 @@ class FinanceScraperTeslaUk:
         response = []
         url = f"{BASE_URL}{model}#overview"
         try:
-            model_page = selenium_execute_request(url=url, response_format="text")
-            line_items = parse_line_items(model_page, self.market)
-            finance_line_details = get_finance_details_for_model(url)
-            response = parse_finance_line_items(line_items, finance_line_details)
+            # One browser session loads the page the trim lines are parsed from and clicks through their finance
+            model_page_and_finance_details = get_model_page_and_finance_details(url)
+            # The price scraper of the same run may already have parsed this page
+            lexicon = fetch_catalog(
+                CatalogKind.MODEL_LEXICON,
+                Vendor.TESLA,
+                self.market,
+                url,
+                lambda: parse_in_pool(
+                    parse_lexicon, model_page_and_finance_details["model_page"]
+                ),
+            )
+            line_items = parse_trim_line_items(lexicon, self.market)
+            response = parse_finance_line_items(
+                line_items, model_page_and_finance_details["finance_details"]
+            )
 
         except Exception as e:
             model, series = parse_model_and_series(model, Market.UK)
@@ -18,6 +18,8 @@ from src.price_monitor.utils.clock import yesterday_dashed_str_with_key
 
 
 class TeslaFinanceScraper(FinanceVendorScraper):
+    vendor = Vendor.TESLA
+
     def __init__(
         self,
         finance_line_item_repository: FileSystemFinanceLineItemRepository,
@@ -2,33 +2,34 @@ import time
 
 from loguru import logger
 from retry import retry
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support.wait import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
 from src.price_monitor.finance_scraper.tesla.constants import METALLIC_PAINT_CODE
-from src.price_monitor.price_scraper.constants import USER_AGENT
+from src.price_monitor.utils.browser_pool import get_browser_pool
+from src.price_monitor.utils.http_recorder import replayable
 from selenium.webdriver.support import expected_conditions as ec
 
 
+@replayable("selenium")
 @retry(tries=3, delay=3, backoff=2)
-def get_finance_details_for_model(
+def get_model_page_and_finance_details(
     url: str,
-):
-    response = {}
-    chrome_options = Options()
-    chrome_options.add_argument("--headless=new")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument(f"user-agent={USER_AGENT}")
-    driver = webdriver.Chrome(
-        options=chrome_options, service=ChromeService(ChromeDriverManager().install())
-    )
-    driver.maximize_window()
+) -> dict:
+    """
+    Loads the model page in a browser of the pool and clicks through its variants, so the page the trim lines
+    are parsed from and their finance details come from the same session.
+    """
+    with get_browser_pool().browser() as driver:
+        model_page = load_model_page(driver, url)
+        finance_details = get_finance_details_for_model(driver)
+    return {"model_page": model_page, "finance_details": finance_details}
+
+
+def load_model_page(driver: WebDriver, url: str) -> str:
     driver.get(url=url)
+    model_page = driver.page_source
 
     try:
         button = driver.find_element(By.CLASS_NAME, "tds-modal-close")
@@ -51,6 +52,11 @@ def get_finance_details_for_model(
     except Exception:
         pass
 
+    return model_page
+
+
+def get_finance_details_for_model(driver: WebDriver) -> dict:
+    response = {}
     variants = driver.find_elements(By.CLASS_NAME, "group--options_block--container")
     for variant in variants:
         line_item_code = variant.get_attribute("data-id")
@@ -76,9 +82,8 @@ def get_finance_details_for_model(
             )
 
         response[line_item_code] = get_finance_details_for_trimline(driver)
-    driver.close()
     if len(response) == 0:
-        raise "Unable to Scrape Finance Option for Tesla UK"
+        raise ValueError("Unable to Scrape Finance Option for Tesla UK")
     return response
 
 
@@ -4,37 +4,37 @@ from typing import Annotated, Optional
 import typer
 
 from src.price_monitor.bootstrap import initialize, finalize
-from src.price_monitor.finance_scraper.main_finance_scraper import scrape_finance
-from src.price_monitor.model.difference_item import DifferenceItem
 from src.price_monitor.model.vendor import Market, Vendor
-from src.price_monitor.price_comparer.comparator import Comparator
-from src.price_monitor.data_quality.data_quality_checks import DataQualityCheck
-from src.price_monitor.data_quality.data_quality_checks_finance import (
-    DataQualityCheckFinance,
+from src.price_monitor.utils.adls import DataRequirement, Dataset
+from src.price_monitor.utils.clock import (
+    today_dashed_str_with_key,
+    yesterday_dashed_str_with_key,
 )
-from src.price_monitor.data_quality.finance_data_quality_processor import (
-    FinanceDataQualityProcessor,
-)
-from src.price_monitor.finance_comparer.finance_options_comparator import (
-    FinanceOptionsComparator,
-)
-from src.price_monitor.notifier.notifier import Notifier
-from src.price_monitor.repository.difference_item_repository import (
-    DifferenceItemRepository,
-)
-from src.price_monitor.repository.finance_item_repository import (
-    FileSystemFinanceLineItemRepository,
-)
-from src.price_monitor.repository.line_item_repository import (
-    FileSystemLineItemRepository,
-)
-from src.price_monitor.price_scraper.main_scraper import scrape
-from src.price_monitor.utils.clock import today_dashed_str_with_key
 from src.price_monitor.utils.output_format import OutputFormat
+from src.price_monitor.utils.profiler import profile_stage, profiling
 
+# Every command imports its own subsystem, so a command doesn't pay for the dependencies of the others
 app = typer.Typer(no_args_is_help=True, help="Price Monitor CLI Application")
 
 
+ProfileOption = Annotated[
+    bool,
+    typer.Option(
+        help="Profile the command, writing its pstats, collapsed stacks and stage memory peaks to the logs directory",
+        rich_help_panel="Profiling",
+    ),
+]
+
+
+def _today_and_yesterday(*datasets: Dataset) -> list[DataRequirement]:
+    # Today's data is merged with the newly scraped data or compared against yesterday's
+    return [
+        DataRequirement(dataset, date)
+        for dataset in datasets
+        for date in [yesterday_dashed_str_with_key(), today_dashed_str_with_key()]
+    ]
+
+
 @app.command(rich_help_panel="Scrapers")
 def run_scraper(
     config_file: Annotated[
@@ -65,22 +65,39 @@ def run_scraper(
         Optional[str],
         typer.Option(help="Set the output file directory", rich_help_panel="Output"),
     ] = None,
+    resume: Annotated[
+        bool,
+        typer.Option(
+            help="Resume an interrupted run, reusing the vendor/market results checkpointed today"
+        ),
+    ] = False,
+    profile: ProfileOption = False,
 ):
     """
     Runs the price scraper and saves the scraped data to a local directory in the specified file format.
     """
+    from src.price_monitor.price_scraper.main_scraper import scrape
+    from src.price_monitor.repository.line_item_repository import (
+        FileSystemLineItemRepository,
+    )
+    from src.price_monitor.utils.catalog_cache import catalog_cache_scope
+
     config, adls = initialize(
         config_file=config_file,
         directory=directory,
         market=market,
         output=output,
         scraper=scraper,
+        requirements=_today_and_yesterday(Dataset.PRICES),
     )
 
-    scrape(
-        config,
-        FileSystemLineItemRepository(config=config),
-    )
+    with profiling(config, "run-scraper", enabled=profile):
+        with catalog_cache_scope():
+            scrape(
+                config,
+                FileSystemLineItemRepository(config=config),
+                resume=resume,
+            )
 
     finalize(adls)
 
@@ -115,22 +132,32 @@ def run_finance_scraper(
         Optional[str],
         typer.Option(help="Set the output file directory", rich_help_panel="Output"),
     ] = None,
+    profile: ProfileOption = False,
 ):
     """
     Runs the finance scraper and saves the scraped data to a local directory in the specified file format.
     """
+    from src.price_monitor.finance_scraper.main_finance_scraper import scrape_finance
+    from src.price_monitor.repository.finance_item_repository import (
+        FileSystemFinanceLineItemRepository,
+    )
+    from src.price_monitor.utils.catalog_cache import catalog_cache_scope
+
     config, adls = initialize(
         config_file=config_file,
         directory=directory,
         market=market,
         output=output,
         finance_scraper=scraper,
+        requirements=_today_and_yesterday(Dataset.FINANCE_OPTIONS),
     )
 
-    scrape_finance(
-        config,
-        FileSystemFinanceLineItemRepository(config=config),
-    )
+    with profiling(config, "run-finance-scraper", enabled=profile):
+        with catalog_cache_scope():
+            scrape_finance(
+                config,
+                FileSystemFinanceLineItemRepository(config=config),
+            )
 
     finalize(adls)
 
@@ -151,15 +178,22 @@ def run_compare(
         Optional[str],
         typer.Option(help="Set the output file directory", rich_help_panel="Output"),
     ] = None,
+    profile: ProfileOption = False,
 ):
     """
     Runs the price comparator and produces a changelog of differences between today and yesterday's data.
     """
+    from src.price_monitor.price_comparer.comparator import Comparator
+
     config, adls = initialize(
-        config_file=config_file, directory=directory, output=output
+        config_file=config_file,
+        directory=directory,
+        output=output,
+        requirements=_today_and_yesterday(Dataset.PRICES),
     )
 
-    Comparator(config).compare()
+    with profiling(config, "run-compare", enabled=profile):
+        Comparator(config).compare()
 
     finalize(adls)
 
@@ -180,15 +214,24 @@ def run_finance_compare(
         Optional[str],
         typer.Option(help="Set the output file directory", rich_help_panel="Output"),
     ] = None,
+    profile: ProfileOption = False,
 ):
     """
     Runs the Finance comparator and produces a changelog of differences between today and yesterday's data.
     """
+    from src.price_monitor.finance_comparer.finance_options_comparator import (
+        FinanceOptionsComparator,
+    )
+
     config, adls = initialize(
-        config_file=config_file, directory=directory, output=output
+        config_file=config_file,
+        directory=directory,
+        output=output,
+        requirements=_today_and_yesterday(Dataset.FINANCE_OPTIONS),
     )
 
-    FinanceOptionsComparator(config).compare()
+    with profiling(config, "run-finance-compare", enabled=profile):
+        FinanceOptionsComparator(config).compare()
 
     finalize(adls)
 
@@ -202,21 +245,101 @@ def notify(
         Optional[str],
         typer.Option(help="Set the output file directory", rich_help_panel="Output"),
     ] = None,
+    profile: ProfileOption = False,
 ):
     """
     Sends a notification to the configured destinations if a changelog is detected for the current day.
     """
-    config, adls = initialize(config_file=config_file, directory=directory)
+    from src.price_monitor.model.difference_item import DifferenceItem
+    from src.price_monitor.notifier.notifier import Notifier
+    from src.price_monitor.repository.difference_item_repository import (
+        DifferenceItemRepository,
+    )
+
+    config, adls = initialize(
+        config_file=config_file,
+        directory=directory,
+        requirements=[
+            DataRequirement(Dataset.DIFFERENCES, today_dashed_str_with_key())
+        ],
+    )
     if "notification" not in config:
         return
 
-    notifier = Notifier(config=config)
-    difference_repository = DifferenceItemRepository(config=config)
-    differences = difference_repository.load(
-        date=today_dashed_str_with_key(), difference_item_class=DifferenceItem
+    with profiling(config, "notify", enabled=profile):
+        notifier = Notifier(config=config)
+        difference_repository = DifferenceItemRepository(config=config)
+        with profile_stage("load"):
+            differences = difference_repository.load(
+                date=today_dashed_str_with_key(), difference_item_class=DifferenceItem
+            )
+
+        notifier.notify(differences=differences)
+
+    finalize(adls)
+
+
+@app.command(rich_help_panel="Pipelines")
+def run_pipeline(
+    config_file: Annotated[
+        Path, typer.Option(help="File path to a json config", exists=True)
+    ],
+    scraper: Annotated[
+        Optional[Vendor],
+        typer.Option(
+            help="Run one scraper from the supported scrapers",
+            rich_help_panel="Filters",
+        ),
+    ] = None,
+    market: Annotated[
+        Optional[Market],
+        typer.Option(
+            help="Scrape one market from the supported markets",
+            rich_help_panel="Filters",
+        ),
+    ] = None,
+    output: Annotated[
+        Optional[OutputFormat],
+        typer.Option(
+            help="Set the output file format",
+            rich_help_panel="Output",
+        ),
+    ] = None,
+    directory: Annotated[
+        Optional[str],
+        typer.Option(help="Set the output file directory", rich_help_panel="Output"),
+    ] = None,
+    resume: Annotated[
+        bool,
+        typer.Option(
+            help="Resume an interrupted run, reusing the vendor/market results checkpointed today"
+        ),
+    ] = False,
+    profile: ProfileOption = False,
+):
+    """
+    Runs the scrapers, comparators, data quality checks and notifier in one process, syncing ADLS once.
+    """
+    from src.price_monitor.pipeline import run_pipeline as run_all_stages
+
+    config, adls = initialize(
+        config_file=config_file,
+        directory=directory,
+        market=market,
+        output=output,
+        scraper=scraper,
+        finance_scraper=scraper,
+        requirements=_today_and_yesterday(Dataset.PRICES, Dataset.FINANCE_OPTIONS),
     )
 
-    notifier.notify(differences=differences)
+    with profiling(config, "run-pipeline", enabled=profile):
+        timings = run_all_stages(config, resume=resume)
+
+    finalize(adls)
+
+    for stage, seconds in timings.items():
+        typer.echo(f"{stage:<16}{seconds:>10.2f}s")
+    typer.echo(f"{'total':<16}{sum(timings.values()):>10.2f}s")
 
 
 @app.command(rich_help_panel="Processors")
@@ -228,20 +351,45 @@ def check_data_quality(
         Optional[str],
         typer.Option(help="Set the output file directory", rich_help_panel="Output"),
     ] = None,
+    profile: ProfileOption = False,
 ):
     """
     Checks for data quality issues and logs its findings.
     """
-    config, adls = initialize(config_file=config_file, directory=directory)
-    line_item_repository = FileSystemLineItemRepository(config=config)
-    finance_line_item_repository = FileSystemFinanceLineItemRepository(config=config)
-    data_quality = DataQualityCheck(line_item_repository)
-    finance_data_quality = DataQualityCheckFinance(finance_line_item_repository)
-    data_quality.run_quality_checks_all_vendors(config)
-    finance_data_quality.run_quality_checks_all_vendors(config)
-    # Data quality checks are triggered below
-    loader = FinanceDataQualityProcessor(finance_line_item_repository, config=config)
-    loader.run_quality_checks_all_vendors(config)
+    from src.price_monitor.data_quality.data_quality_checks import DataQualityCheck
+    from src.price_monitor.data_quality.data_quality_checks_finance import (
+        DataQualityCheckFinance,
+    )
+    from src.price_monitor.data_quality.finance_data_quality_processor import (
+        FinanceDataQualityProcessor,
+    )
+    from src.price_monitor.repository.finance_item_repository import (
+        FileSystemFinanceLineItemRepository,
+    )
+    from src.price_monitor.repository.line_item_repository import (
+        FileSystemLineItemRepository,
+    )
+
+    config, adls = initialize(
+        config_file=config_file,
+        directory=directory,
+        requirements=_today_and_yesterday(Dataset.PRICES, Dataset.FINANCE_OPTIONS),
+    )
+    with profiling(config, "check-data-quality", enabled=profile):
+        line_item_repository = FileSystemLineItemRepository(config=config)
+        finance_line_item_repository = FileSystemFinanceLineItemRepository(
+            config=config
+        )
+        data_quality = DataQualityCheck(line_item_repository)
+        finance_data_quality = DataQualityCheckFinance(finance_line_item_repository)
+        with profile_stage("data_quality"):
+            data_quality.run_quality_checks_all_vendors(config)
+            finance_data_quality.run_quality_checks_all_vendors(config)
+            # Data quality checks are triggered below
+            loader = FinanceDataQualityProcessor(
+                finance_line_item_repository, config=config
+            )
+            loader.run_quality_checks_all_vendors(config)
 
     finalize(adls)
 
@@ -0,0 +1,36 @@
+from typing import Iterable
+
+from src.price_monitor.model.finance_line_item import (
+    FINANCE_LINE_ITEM_REQUIRED_FIELDS,
+    FinanceLineItem,
+)
+from src.price_monitor.model.line_item import LINE_ITEM_REQUIRED_FIELDS, LineItem
+from src.price_monitor.utils.clock import ClockSnapshot, batch_clock
+from src.price_monitor.utils.utils import validate_not_blank_or_empty
+
+
+def build_line_items(
+    records: Iterable[dict], clock: ClockSnapshot | None = None
+) -> list[LineItem]:
+    with batch_clock(clock):
+        line_items = [LineItem(**record) for record in records]
+
+    validate_required_fields(line_items, LINE_ITEM_REQUIRED_FIELDS)
+    return line_items
+
+
+def build_finance_line_items(
+    records: Iterable[dict], clock: ClockSnapshot | None = None
+) -> list[FinanceLineItem]:
+    with batch_clock(clock):
+        finance_line_items = [FinanceLineItem(**record) for record in records]
+
+    validate_required_fields(finance_line_items, FINANCE_LINE_ITEM_REQUIRED_FIELDS)
+    return finance_line_items
+
+
+def validate_required_fields(items: list, required_fields: list[str]):
+    # Values such as vendor, market or series repeat across a batch, so only distinct values are validated
+    for field_name in required_fields:
+        for value in {getattr(item, field_name) for item in items}:
+            validate_not_blank_or_empty(value, field_name)
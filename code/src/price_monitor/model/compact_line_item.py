@@ -0,0 +1,202 @@
+import sys
+from array import array
+from dataclasses import dataclass
+
+from src.price_monitor.model.line_item import LineItem
+from src.price_monitor.model.line_item_option_code import LineItemOptionCode
+from src.price_monitor.model.vendor import Market, Vendor
+from src.price_monitor.price_scraper.constants import NOT_AVAILABLE
+
+# Options are shared by all the lines of a model in a market, so their table is keyed by vendor, market and model
+OptionTableKey = tuple[Vendor | None, Market | None, str | None]
+
+
+def _intern(value: str | None) -> str | None:
+    # Enum members are already shared, only plain strings can be interned
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(frozen=True, slots=True)
+class CompactLineItemOptionCode:
+    code: str
+    description: str
+    type: str
+    included: bool
+    net_list_price: float = 0.0
+    gross_list_price: float = 0.0
+    predicted_category: str = ""
+
+    @classmethod
+    def from_line_item_option_code(
+        cls, option: LineItemOptionCode
+    ) -> "CompactLineItemOptionCode":
+        return cls(
+            code=_intern(option.code),
+            description=_intern(option.description),
+            type=_intern(option.type),
+            included=option.included,
+            net_list_price=option.net_list_price,
+            gross_list_price=option.gross_list_price,
+            predicted_category=_intern(option.predicted_category),
+        )
+
+    def to_line_item_option_code(self) -> LineItemOptionCode:
+        return LineItemOptionCode(
+            code=self.code,
+            description=self.description,
+            type=self.type,
+            included=self.included,
+            net_list_price=self.net_list_price,
+            gross_list_price=self.gross_list_price,
+            predicted_category=self.predicted_category,
+        )
+
+
+class OptionTable:
+    """
+    Unique options of one model. Lines reference options by their index in the table,
+    so an option repeated across the lines of a model is only stored once.
+    """
+
+    __slots__ = ("options", "_indexes")
+
+    def __init__(self):
+        self.options: list[CompactLineItemOptionCode] = []
+        self._indexes: dict[CompactLineItemOptionCode, int] = {}
+
+    def index_of(self, option: CompactLineItemOptionCode) -> int:
+        index = self._indexes.get(option)
+        if index is None:
+            index = len(self.options)
+            self.options.append(option)
+            self._indexes[option] = index
+        return index
+
+    def __len__(self) -> int:
+        return len(self.options)
+
+
+@dataclass(slots=True)
+class CompactLineItem:
+    vendor: Vendor | None
+    series: str | None
+    model_range_code: str | None
+    model_range_description: str | None
+    model_code: str | None
+    model_description: str | None
+    line_code: str | None
+    line_description: str | None
+    option_table: OptionTable | None
+    option_indexes: array | None
+    currency: str | None
+    net_list_price: float | None
+    gross_list_price: float | None
+    on_the_road_price: float = 0.0
+    market: Market = Market.UK
+    engine_performance_kw: str = NOT_AVAILABLE
+    engine_performance_hp: str = NOT_AVAILABLE
+    last_scraped_on: str | None = None
+
+    @property
+    def line_option_codes(self) -> list[CompactLineItemOptionCode] | None:
+        if self.option_indexes is None:
+            return None
+        return [self.option_table.options[index] for index in self.option_indexes]
+
+    def to_line_item(self) -> LineItem:
+        line_option_codes = self.line_option_codes
+        return LineItem(
+            last_scraped_on=self.last_scraped_on,
+            vendor=self.vendor,
+            series=self.series,
+            model_range_code=self.model_range_code,
+            model_range_description=self.model_range_description,
+            model_code=self.model_code,
+            model_description=self.model_description,
+            line_code=self.line_code,
+            line_description=self.line_description,
+            line_option_codes=(
+                None
+                if line_option_codes is None
+                else [option.to_line_item_option_code() for option in line_option_codes]
+            ),
+            currency=self.currency,
+            net_list_price=self.net_list_price,
+            gross_list_price=self.gross_list_price,
+            on_the_road_price=self.on_the_road_price,
+            market=self.market,
+            engine_performance_kw=self.engine_performance_kw,
+            engine_performance_hp=self.engine_performance_hp,
+        )
+
+
+class CompactLineItemSnapshot:
+    """
+    Memory compact view of the line items of a snapshot: slotted classes, interned strings
+    and one option table per model.
+    """
+
+    def __init__(self):
+        self.line_items: list[CompactLineItem] = []
+        self.option_tables: dict[OptionTableKey, OptionTable] = {}
+
+    @classmethod
+    def from_line_items(cls, line_items: list[LineItem]) -> "CompactLineItemSnapshot":
+        snapshot = cls()
+        for line_item in line_items:
+            snapshot.add(line_item)
+        return snapshot
+
+    def add(self, line_item: LineItem) -> CompactLineItem:
+        option_table = None
+        option_indexes = None
+        if line_item.line_option_codes is not None:
+            option_table = self.option_tables.setdefault(
+                (
+                    _intern(line_item.vendor),
+                    _intern(line_item.market),
+                    _intern(line_item.model_code),
+                ),
+                OptionTable(),
+            )
+            option_indexes = array(
+                "I",
+                [
+                    option_table.index_of(
+                        CompactLineItemOptionCode.from_line_item_option_code(option)
+                    )
+                    for option in line_item.line_option_codes
+                ],
+            )
+
+        compact_line_item = CompactLineItem(
+            vendor=_intern(line_item.vendor),
+            series=_intern(line_item.series),
+            model_range_code=_intern(line_item.model_range_code),
+            model_range_description=_intern(line_item.model_range_description),
+            model_code=_intern(line_item.model_code),
+            model_description=_intern(line_item.model_description),
+            line_code=_intern(line_item.line_code),
+            line_description=_intern(line_item.line_description),
+            option_table=option_table,
+            option_indexes=option_indexes,
+            currency=_intern(line_item.currency),
+            net_list_price=line_item.net_list_price,
+            gross_list_price=line_item.gross_list_price,
+            on_the_road_price=line_item.on_the_road_price,
+            market=_intern(line_item.market),
+            engine_performance_kw=_intern(line_item.engine_performance_kw),
+            engine_performance_hp=_intern(line_item.engine_performance_hp),
+            last_scraped_on=_intern(line_item.last_scraped_on),
+        )
+        self.line_items.append(compact_line_item)
+        return compact_line_item
+
+    def to_line_items(self) -> list[LineItem]:
+        return [line_item.to_line_item() for line_item in self.line_items]
+
+    def __len__(self) -> int:
+        return len(self.line_items)
+
+    def __iter__(self):
+        return iter(self.line_items)
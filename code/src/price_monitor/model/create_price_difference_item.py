@@ -1,5 +1,3 @@
-import itertools
-
 from src.price_monitor.model.difference_item import DifferenceItem, DifferenceReason
 from src.price_monitor.model.price_difference_item import (
     PriceDifferenceItem,
@@ -7,40 +5,89 @@ from src.price_monitor.model.price_difference_item import (
     _create_price_difference_item_from_difference,
 )
 
+PRICE_DIFFERENCE_REASONS: frozenset[DifferenceReason] = frozenset(
+    [
+        DifferenceReason.PRICE_CHANGE,
+        DifferenceReason.OPTION_INCLUDED,
+        DifferenceReason.OPTION_EXCLUDED,
+    ]
+)
+
+# (reasons that must all be present in a line group, reason of the option change
+# that gets merged, merged reason). Order matters: a later rule overrides an earlier
+# one applied to the same option change.
+MERGED_REASON_RULES: list[
+    tuple[
+        frozenset[PriceDifferenceReason], PriceDifferenceReason, PriceDifferenceReason
+    ]
+] = [
+    (
+        frozenset(
+            [
+                PriceDifferenceReason.OPTION_INCLUDED,
+                PriceDifferenceReason.PRICE_INCREASE,
+            ]
+        ),
+        PriceDifferenceReason.OPTION_INCLUDED,
+        PriceDifferenceReason.PRICE_INCREASE_OPTION_INCLUDED,
+    ),
+    (
+        frozenset(
+            [
+                PriceDifferenceReason.OPTION_EXCLUDED,
+                PriceDifferenceReason.PRICE_DECREASE,
+            ]
+        ),
+        PriceDifferenceReason.OPTION_EXCLUDED,
+        PriceDifferenceReason.PRICE_DECREASE_OPTION_EXCLUDED,
+    ),
+    (
+        frozenset(
+            [
+                PriceDifferenceReason.OPTION_EXCLUDED,
+                PriceDifferenceReason.PRICE_INCREASE,
+            ]
+        ),
+        PriceDifferenceReason.OPTION_EXCLUDED,
+        PriceDifferenceReason.PRICE_INCREASE_OPTION_EXCLUDED,
+    ),
+    (
+        frozenset(
+            [
+                PriceDifferenceReason.OPTION_INCLUDED,
+                PriceDifferenceReason.PRICE_DECREASE,
+            ]
+        ),
+        PriceDifferenceReason.OPTION_INCLUDED,
+        PriceDifferenceReason.PRICE_DECREASE_OPTION_INCLUDED,
+    ),
+]
+
+ONLY_OPTION_CHANGE_REASONS: frozenset[PriceDifferenceReason] = frozenset(
+    [PriceDifferenceReason.OPTION_INCLUDED, PriceDifferenceReason.OPTION_EXCLUDED]
+)
+
 
 def create_price_difference_item(
     differences: list[DifferenceItem],
 ) -> list[PriceDifferenceItem]:
-    price_differences: list[PriceDifferenceItem] = []
-    price_difference_list = list(
-        filter(
-            lambda diff_item: diff_item.reason == DifferenceReason.PRICE_CHANGE
-            or diff_item.reason == DifferenceReason.OPTION_INCLUDED
-            or diff_item.reason == DifferenceReason.OPTION_EXCLUDED,
-            differences,
-        ),
-    )
+    # Groups are keyed per line item, so the result does not depend on the order of the differences
+    grouped_price_differences: dict[tuple, list[PriceDifferenceItem]] = {}
+    grouped_reasons: dict[tuple, set[PriceDifferenceReason]] = {}
 
-    line_item_group = itertools.groupby(
-        price_difference_list,
-        key=(
-            lambda price_difference: (
-                price_difference.series,
-                price_difference.model_range_code,
-                price_difference.model_range_description,
-                price_difference.model_code,
-                price_difference.model_description,
-                price_difference.line_code,
-                price_difference.line_description,
-            )
-        ),
-    )
+    for difference in differences:
+        if difference.reason not in PRICE_DIFFERENCE_REASONS:
+            continue
+
+        key = _line_item_key(difference)
+        price_difference = _create_price_difference_item_from_difference(difference)
+        grouped_price_differences.setdefault(key, []).append(price_difference)
+        grouped_reasons.setdefault(key, set()).add(price_difference.reason)
 
-    for group, list_of_grouped_line_item in line_item_group:
+    price_differences: list[PriceDifferenceItem] = []
+    for key, list_of_price_difference in grouped_price_differences.items():
         price_differences.extend(
-            create_price_difference_item_with_merged_reason(
-                list(list_of_grouped_line_item)
-            )
+            _merge_reasons(list_of_price_difference, grouped_reasons[key])
         )
 
     return price_differences
@@ -49,125 +96,59 @@ def create_price_difference_item(
 def create_price_difference_item_with_merged_reason(
     list_of_difference_item: list[DifferenceItem],
 ) -> list[PriceDifferenceItem]:
-    if len(list_of_difference_item) == 1:
-        return [
-            _create_price_difference_item_from_difference(list_of_difference_item[0])
-        ]
-
     list_of_price_difference = list(
         map(_create_price_difference_item_from_difference, list_of_difference_item)
     )
-    list_of_reasons = set(
-        [price_difference.reason for price_difference in list_of_price_difference]
+    list_of_reasons = {
+        price_difference.reason for price_difference in list_of_price_difference
+    }
+
+    return _merge_reasons(list_of_price_difference, list_of_reasons)
+
+
+def _line_item_key(difference: DifferenceItem) -> tuple:
+    return (
+        difference.vendor,
+        difference.market,
+        difference.series,
+        difference.model_range_code,
+        difference.model_range_description,
+        difference.model_code,
+        difference.model_description,
+        difference.line_code,
+        difference.line_description,
     )
 
-    list_of_option_included = _filter_by_reason(
-        list_of_price_difference, PriceDifferenceReason.OPTION_INCLUDED
-    )
-    list_of_option_excluded = _filter_by_reason(
-        list_of_price_difference, PriceDifferenceReason.OPTION_EXCLUDED
-    )
 
-    if sorted(list_of_reasons) == [
-        PriceDifferenceReason.OPTION_EXCLUDED,
-        PriceDifferenceReason.OPTION_INCLUDED,
-    ]:
+def _merge_reasons(
+    list_of_price_difference: list[PriceDifferenceItem],
+    list_of_reasons: set[PriceDifferenceReason],
+) -> list[PriceDifferenceItem]:
+    if len(list_of_price_difference) == 1:
         return list_of_price_difference
 
-    map_list_of_reasons_to_merged_reason = _create_map_reasons(
-        list_of_option_included, list_of_option_excluded
-    )
-
-    for (
-        reasons_list_map,
-        list_to_change,
-        merged_reason,
-    ) in map_list_of_reasons_to_merged_reason:
-        if set(reasons_list_map).issubset(list_of_reasons):
-            _set_reason_to_price_diff(list_to_change, merged_reason)
-
-    price_differences: list[PriceDifferenceItem] = []
-    price_differences.extend(list_of_option_included)
-    price_differences.extend(list_of_option_excluded)
-
-    return _filter_only_combined_reasons(price_differences)
-
-
-def _create_map_reasons(
-    list_of_option_included: list[PriceDifferenceItem],
-    list_of_option_excluded: list[PriceDifferenceItem],
-) -> list[
-    (list[PriceDifferenceReason], list[PriceDifferenceItem], PriceDifferenceReason)
-]:
-    price_increase_option_included = [
-        PriceDifferenceReason.OPTION_INCLUDED,
-        PriceDifferenceReason.PRICE_INCREASE,
-    ]
-    price_increase_option_excluded = [
-        PriceDifferenceReason.OPTION_EXCLUDED,
-        PriceDifferenceReason.PRICE_INCREASE,
-    ]
-    price_decrease_option_included = [
-        PriceDifferenceReason.OPTION_INCLUDED,
-        PriceDifferenceReason.PRICE_DECREASE,
-    ]
-    price_decrease_option_excluded = [
-        PriceDifferenceReason.OPTION_EXCLUDED,
-        PriceDifferenceReason.PRICE_DECREASE,
-    ]
-
-    return [
-        (
-            price_increase_option_included,
-            list_of_option_included,
-            PriceDifferenceReason.PRICE_INCREASE_OPTION_INCLUDED,
-        ),
-        (
-            price_decrease_option_excluded,
-            list_of_option_excluded,
-            PriceDifferenceReason.PRICE_DECREASE_OPTION_EXCLUDED,
-        ),
-        (
-            price_increase_option_excluded,
-            list_of_option_excluded,
-            PriceDifferenceReason.PRICE_INCREASE_OPTION_EXCLUDED,
-        ),
-        (
-            price_decrease_option_included,
-            list_of_option_included,
-            PriceDifferenceReason.PRICE_DECREASE_OPTION_INCLUDED,
-        ),
-    ]
+    if list_of_reasons == ONLY_OPTION_CHANGE_REASONS:
+        return list_of_price_difference
 
+    option_changes: dict[PriceDifferenceReason, list[PriceDifferenceItem]] = {
+        PriceDifferenceReason.OPTION_INCLUDED: [],
+        PriceDifferenceReason.OPTION_EXCLUDED: [],
+    }
+    for price_difference in list_of_price_difference:
+        if price_difference.reason in option_changes:
+            option_changes[price_difference.reason].append(price_difference)
 
-def _set_reason_to_price_diff(
-    price_differences: list[PriceDifferenceItem], reason: PriceDifferenceReason
-):
-    for price_difference in price_differences:
-        price_difference.reason = reason
-
-
-def _filter_only_combined_reasons(list_of_price_difference: list[PriceDifferenceItem]):
-    return list(
-        filter(
-            lambda price_difference: price_difference.reason
-            in [
-                PriceDifferenceReason.PRICE_INCREASE_OPTION_INCLUDED,
-                PriceDifferenceReason.PRICE_DECREASE_OPTION_EXCLUDED,
-                PriceDifferenceReason.PRICE_INCREASE_OPTION_EXCLUDED,
-                PriceDifferenceReason.PRICE_DECREASE_OPTION_INCLUDED,
-            ],
-            list_of_price_difference,
-        )
-    )
+    merged_reasons: dict[PriceDifferenceReason, PriceDifferenceReason] = {}
+    for required_reasons, option_change_reason, merged_reason in MERGED_REASON_RULES:
+        if required_reasons <= list_of_reasons:
+            merged_reasons[option_change_reason] = merged_reason
 
+    price_differences: list[PriceDifferenceItem] = []
+    for option_change_reason, list_to_change in option_changes.items():
+        if option_change_reason not in merged_reasons:
+            continue
+        for price_difference in list_to_change:
+            price_difference.reason = merged_reasons[option_change_reason]
+        price_differences.extend(list_to_change)
 
-def _filter_by_reason(
-    list_of_price_difference: list[PriceDifferenceItem], reason: PriceDifferenceReason
-) -> list[PriceDifferenceItem]:
-    return list(
-        filter(
-            lambda price_difference_alias: price_difference_alias.reason == reason,
-            list_of_price_difference,
-        )
-    )
+    return price_differences
@@ -1,4 +1,5 @@
 import dataclasses
+import functools
 import hashlib
 from dataclasses import dataclass
 
@@ -13,9 +14,47 @@ from src.price_monitor.model.vendor import Currency, Market, Vendor
 from src.price_monitor.utils.clock import (
     today_dashed_str,
     current_timestamp_dashed_str_with_timezone,
+    current_batch_clock,
 )
 from src.price_monitor.utils.utils import validate_not_blank_or_empty
 
+FINANCE_LINE_ITEM_REQUIRED_FIELDS: list[str] = [
+    "recorded_at",
+    "vehicle_id",
+    "market",
+    "vendor",
+    "series",
+    "model_range_code",
+    "model_range_description",
+    "model_code",
+    "model_description",
+    "line_code",
+    "line_description",
+    "contract_type",
+]
+
+
+@functools.lru_cache(maxsize=8192)
+def compute_vehicle_id(
+    vendor: Vendor,
+    market: Market,
+    series: str,
+    model_range_description: str,
+    model_description: str,
+    line_description: str,
+) -> str:
+    # Concatenate relevant attributes
+    data = f"{vendor}_{market}_{series}_{model_range_description}_{model_description}_{line_description}"
+
+    # Calculate the hash using a chosen algorithm (Blake2b)
+    hash_object = hashlib.blake2b(digest_size=4)
+    hash_object.update(data.encode("utf-8"))
+    hex_dig = hash_object.hexdigest()
+    # limiting vendor name to 3 digits ex: aud, tes, bmw
+    prefix_vendor = f"{vendor}"[:3]
+    # Create the final identifier
+    return f"{market}_{prefix_vendor}_{hex_dig}".lower()
+
 
 @dataclass(eq=True)
 class FinanceLineItem(AvroModel):
@@ -56,47 +95,40 @@ class FinanceLineItem(AvroModel):
     is_current: bool | None = dataclasses.field(compare=False, default=None)
 
     def __post_init__(self):
+        clock = current_batch_clock()
+        if clock is not None:
+            # Built by a batch builder, which validates the required fields of the whole batch
+            self.recorded_at = clock.timestamp
+            self.is_current = self._calculate_is_current(today=clock.today)
+            self.vehicle_id = self.calculate_vehicle_id()
+            return
+
         self.recorded_at = current_timestamp_dashed_str_with_timezone()
         self.is_current = self._calculate_is_current()
         self.vehicle_id = self.calculate_vehicle_id()
 
         # validate required fields
-        validate_not_blank_or_empty(self.recorded_at, "recorded_at")
-        validate_not_blank_or_empty(self.vehicle_id, "vehicle_id")
-        validate_not_blank_or_empty(self.market, "market")
-        validate_not_blank_or_empty(self.vendor, "vendor")
-        validate_not_blank_or_empty(self.series, "series")
-        validate_not_blank_or_empty(self.model_range_code, "model_range_code")
-        validate_not_blank_or_empty(
-            self.model_range_description, "model_range_description"
-        )
-        validate_not_blank_or_empty(self.model_code, "model_code")
-        validate_not_blank_or_empty(self.model_description, "model_description")
-        validate_not_blank_or_empty(self.line_code, "line_code")
-        validate_not_blank_or_empty(self.line_description, "line_description")
-        validate_not_blank_or_empty(self.contract_type, "contract_type")
+        for field_name in FINANCE_LINE_ITEM_REQUIRED_FIELDS:
+            validate_not_blank_or_empty(getattr(self, field_name), field_name)
 
-    def _calculate_is_current(self) -> bool | None:
+    def _calculate_is_current(self, today: str | None = None) -> bool | None:
         if self.last_scraped_on:
             # Since date represents when the item was last written to disk, instead of the true current date
             # We need to rely on another source of time, so we will currently use today's date to evaluate freshness
-            return self.last_scraped_on == today_dashed_str()
+            return self.last_scraped_on == (today or today_dashed_str())
 
         return None
 
     def calculate_vehicle_id(self) -> str:
         """Calculates the unique vehicle ID based on the given attributes."""
-        # Concatenate relevant attributes
-        data = f"{self.vendor}_{self.market}_{self.series}_{self.model_range_description}_{self.model_description}_{self.line_description}"
-
-        # Calculate the hash using a chosen algorithm (Blake2b)
-        hash_object = hashlib.blake2b(digest_size=4)
-        hash_object.update(data.encode("utf-8"))
-        hex_dig = hash_object.hexdigest()
-        # limiting vendor name to 3 digits ex: aud, tes, bmw
-        prefix_vendor = f"{self.vendor}"[:3]
-        # Create the final identifier
-        return f"{self.market}_{prefix_vendor}_{hex_dig}".lower()
+        return compute_vehicle_id(
+            self.vendor,
+            self.market,
+            self.series,
+            self.model_range_description,
+            self.model_description,
+            self.line_description,
+        )
 
     def pcp_difference_with(
         self, other: "FinanceLineItem"
@@ -15,9 +15,23 @@ from src.price_monitor.price_scraper.constants import NOT_AVAILABLE
 from src.price_monitor.utils.clock import (
     today_dashed_str,
     current_timestamp_dashed_str_with_timezone,
+    current_batch_clock,
 )
 from src.price_monitor.utils.utils import validate_not_blank_or_empty
 
+LINE_ITEM_REQUIRED_FIELDS: list[str] = [
+    "recorded_at",
+    "market",
+    "vendor",
+    "series",
+    "model_range_code",
+    "model_range_description",
+    "model_code",
+    "model_description",
+    "line_code",
+    "line_description",
+]
+
 
 @dataclass(eq=True)
 class LineItem(AvroModel):
@@ -44,28 +58,25 @@ class LineItem(AvroModel):
     is_current: bool | None = dataclasses.field(compare=False, default=None)
 
     def __post_init__(self):
+        clock = current_batch_clock()
+        if clock is not None:
+            # Built by a batch builder, which validates the required fields of the whole batch
+            self.recorded_at = clock.timestamp
+            self.is_current = self._calculate_is_current(today=clock.today)
+            return
+
         self.recorded_at = current_timestamp_dashed_str_with_timezone()
         self.is_current = self._calculate_is_current()
 
         # validate required fields
-        validate_not_blank_or_empty(self.recorded_at, "recorded_at")
-        validate_not_blank_or_empty(self.market, "market")
-        validate_not_blank_or_empty(self.vendor, "vendor")
-        validate_not_blank_or_empty(self.series, "series")
-        validate_not_blank_or_empty(self.model_range_code, "model_range_code")
-        validate_not_blank_or_empty(
-            self.model_range_description, "model_range_description"
-        )
-        validate_not_blank_or_empty(self.model_code, "model_code")
-        validate_not_blank_or_empty(self.model_description, "model_description")
-        validate_not_blank_or_empty(self.line_code, "line_code")
-        validate_not_blank_or_empty(self.line_description, "line_description")
+        for field_name in LINE_ITEM_REQUIRED_FIELDS:
+            validate_not_blank_or_empty(getattr(self, field_name), field_name)
 
-    def _calculate_is_current(self) -> bool | None:
+    def _calculate_is_current(self, today: str | None = None) -> bool | None:
         if self.last_scraped_on:
             # Since date represents when the item was last written to disk, instead of the true current date
             # We need to rely on another source of time, so we will currently use today's date to evaluate freshness
-            return self.last_scraped_on == today_dashed_str()
+            return self.last_scraped_on == (today or today_dashed_str())
 
         return None
 
@@ -107,19 +118,31 @@ class LineItem(AvroModel):
                 )
             )
 
-        differences.extend(self.check_differences_for_options_inclusion(other))
-        differences.extend(self.check_differences_for_option_price_change(other))
+        # Options are indexed once per side and shared by all the option checks below
+        current_options = LineOptionIndex(self)
+        previous_options = LineOptionIndex(other)
+
+        differences.extend(
+            self.check_differences_for_options_inclusion(
+                other, current_options, previous_options
+            )
+        )
+        differences.extend(
+            self.check_differences_for_option_price_change(
+                other, current_options, previous_options
+            )
+        )
 
         # Check if list of option codes has changed
-        if self.line_option_code_keys() != other.line_option_code_keys():
-            current_descriptions = self.get_line_options_description()
-            yesterday_descriptions = other.get_line_options_description()
+        if current_options.descriptions.keys() != previous_options.descriptions.keys():
+            current_descriptions = current_options.descriptions
+            yesterday_descriptions = previous_options.descriptions
 
             # Check for new option codes in self
             for option_code, option_description in current_descriptions.items():
                 if (
                     option_code not in yesterday_descriptions
-                    and option_description not in yesterday_descriptions.values()
+                    and option_description not in previous_options.description_values
                 ):
                     differences.append(
                         build_difference_for(
@@ -131,7 +154,7 @@ class LineItem(AvroModel):
             for option_code, option_description in yesterday_descriptions.items():
                 if (
                     option_code not in current_descriptions
-                    and option_description not in current_descriptions.values()
+                    and option_description not in current_options.description_values
                 ):
                     differences.append(
                         build_difference_for(
@@ -143,9 +166,18 @@ class LineItem(AvroModel):
 
         return differences
 
-    def check_differences_for_options_inclusion(self, other) -> list[DifferenceItem]:
-        today_line_options_inclusion = self.get_line_option_code_details()
-        yesterday_line_options_inclusion = other.get_line_option_code_details()
+    def check_differences_for_options_inclusion(
+        self,
+        other,
+        current_options: "LineOptionIndex | None" = None,
+        previous_options: "LineOptionIndex | None" = None,
+    ) -> list[DifferenceItem]:
+        today_line_options_inclusion = (
+            current_options or LineOptionIndex(self)
+        ).details
+        yesterday_line_options_inclusion = (
+            previous_options or LineOptionIndex(other)
+        ).details
         differences = []
         if today_line_options_inclusion != yesterday_line_options_inclusion:
             for code, option_details in yesterday_line_options_inclusion.items():
@@ -176,9 +208,18 @@ class LineItem(AvroModel):
                     )
         return differences
 
-    def check_differences_for_option_price_change(self, other) -> list[DifferenceItem]:
-        today_line_options_inclusion = self.get_line_option_code_details()
-        yesterday_line_options_inclusion = other.get_line_option_code_details()
+    def check_differences_for_option_price_change(
+        self,
+        other,
+        current_options: "LineOptionIndex | None" = None,
+        previous_options: "LineOptionIndex | None" = None,
+    ) -> list[DifferenceItem]:
+        today_line_options_inclusion = (
+            current_options or LineOptionIndex(self)
+        ).details
+        yesterday_line_options_inclusion = (
+            previous_options or LineOptionIndex(other)
+        ).details
         differences: list[DifferenceItem] = []
         if today_line_options_inclusion != yesterday_line_options_inclusion:
             for code, option_details in yesterday_line_options_inclusion.items():
@@ -207,3 +248,17 @@ class LineItem(AvroModel):
                     )
 
         return differences
+
+
+class LineOptionIndex:
+    """
+    Option lookups of a line item built in a single pass over its options,
+    so diffing two line items does not rebuild them for every check.
+    """
+
+    def __init__(self, line_item: LineItem):
+        self.details: dict = line_item.get_line_option_code_details()
+        self.descriptions: dict = {
+            code: details["description"] for code, details in self.details.items()
+        }
+        self.description_values: set = set(self.descriptions.values())
@@ -0,0 +1,87 @@
+import time
+from contextlib import contextmanager
+
+from loguru import logger
+
+from src.price_monitor.data_quality.data_quality_checks import DataQualityCheck
+from src.price_monitor.data_quality.data_quality_checks_finance import (
+    DataQualityCheckFinance,
+)
+from src.price_monitor.data_quality.finance_data_quality_processor import (
+    FinanceDataQualityProcessor,
+)
+from src.price_monitor.finance_comparer.finance_options_comparator import (
+    FinanceOptionsComparator,
+)
+from src.price_monitor.finance_scraper.main_finance_scraper import scrape_finance
+from src.price_monitor.notifier.notifier import Notifier
+from src.price_monitor.price_comparer.comparator import Comparator
+from src.price_monitor.price_scraper.main_scraper import scrape
+from src.price_monitor.repository.finance_item_repository import (
+    FileSystemFinanceLineItemRepository,
+)
+from src.price_monitor.repository.line_item_repository import (
+    FileSystemLineItemRepository,
+)
+from src.price_monitor.utils.catalog_cache import catalog_cache_scope
+from src.price_monitor.utils.profiler import profile_stage
+
+
+@contextmanager
+def _stage(timings: dict[str, float], name: str):
+    logger.info(f"Starting pipeline stage {name}")
+    start = time.perf_counter()
+    try:
+        with profile_stage(name):
+            yield
+    finally:
+        timings[name] = time.perf_counter() - start
+        logger.info(f"Pipeline stage {name} took {timings[name]:.2f}s")
+
+
+def run_pipeline(config: dict, resume: bool = False) -> dict[str, float]:
+    """
+    Runs the scrapers, comparators, data quality checks and notifier in one process.
+    Every stage works on the snapshots kept in memory by the repositories, instead of reading them back from disk.
+    Returns the duration in seconds of every stage that ran.
+    """
+    timings: dict[str, float] = {}
+    line_item_repository = FileSystemLineItemRepository(config=config)
+    finance_line_item_repository = FileSystemFinanceLineItemRepository(config=config)
+    has_finance = "finance_scraper" in config
+
+    # Price and finance scrapers share the catalog documents they both fetch
+    with catalog_cache_scope():
+        with _stage(timings, "scrape"):
+            scrape(config, line_item_repository, resume=resume)
+        if has_finance:
+            with _stage(timings, "finance_scrape"):
+                scrape_finance(config, finance_line_item_repository)
+
+    with _stage(timings, "compare"):
+        differences = Comparator(config, line_item_repository).compare(
+            line_item_repository.today_line_items,
+            line_item_repository.yesterday_line_items,
+        )
+    if has_finance:
+        with _stage(timings, "finance_compare"):
+            FinanceOptionsComparator(config, finance_line_item_repository).compare(
+                finance_line_item_repository.today_finance_line_items,
+                finance_line_item_repository.yesterday_finance_line_items,
+            )
+
+    with _stage(timings, "data_quality"):
+        DataQualityCheck(line_item_repository).run_quality_checks_all_vendors(config)
+        if has_finance:
+            DataQualityCheckFinance(
+                finance_line_item_repository
+            ).run_quality_checks_all_vendors(config)
+            FinanceDataQualityProcessor(
+                finance_line_item_repository, config=config
+            ).run_quality_checks_all_vendors(config)
+
+    if "notification" in config:
+        with _stage(timings, "notify"):
+            Notifier(config=config).notify(differences=differences)
+
+    return timings
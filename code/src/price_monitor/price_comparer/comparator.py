@@ -1,4 +1,5 @@
 from src.price_monitor.model.difference_item import DifferenceItem
+from src.price_monitor.model.line_item import LineItem
 from src.price_monitor.model.option_price_difference_item import (
     OptionPriceDifferenceItem,
 )
@@ -14,37 +15,56 @@ from src.price_monitor.utils.clock import (
     today_dashed_str_with_key,
     yesterday_dashed_str_with_key,
 )
+from src.price_monitor.utils.profiler import profile_stage
 
 
 class Comparator:
-    def __init__(self, config) -> None:
+    def __init__(
+        self,
+        config,
+        line_item_repository: FileSystemLineItemRepository | None = None,
+    ) -> None:
         self.differences_repository = DifferenceItemRepository(config=config)
-        self.line_item_repository = FileSystemLineItemRepository(config=config)
+        self.line_item_repository = (
+            line_item_repository or FileSystemLineItemRepository(config=config)
+        )
 
-    def compare(self):
+    def compare(
+        self,
+        today_line_items: list[LineItem] | None = None,
+        prev_day_line_items: list[LineItem] | None = None,
+    ) -> list[DifferenceItem]:
         (
             differences,
             price_differences,
             option_price_differences,
-        ) = self._load_differences()
+        ) = self._load_differences(today_line_items, prev_day_line_items)
         self.differences_repository.save(differences, DifferenceItem)
         self.differences_repository.save(price_differences, PriceDifferenceItem)
         self.differences_repository.save(
             option_price_differences, OptionPriceDifferenceItem
         )
+        return differences
 
     def _load_differences(
         self,
+        today_line_items: list[LineItem] | None = None,
+        prev_day_line_items: list[LineItem] | None = None,
     ) -> tuple[
         list[DifferenceItem], list[PriceDifferenceItem], list[OptionPriceDifferenceItem]
     ]:
-        prev_day_line_items = self.line_item_repository.load(
-            date=yesterday_dashed_str_with_key()
-        )
-        today_line_items = self.line_item_repository.load(
-            date=today_dashed_str_with_key()
-        )
+        # Snapshots already in memory are only read from disk when they are not provided
+        with profile_stage("load"):
+            if prev_day_line_items is None:
+                prev_day_line_items = self.line_item_repository.load(
+                    date=yesterday_dashed_str_with_key()
+                )
+            if today_line_items is None:
+                today_line_items = self.line_item_repository.load(
+                    date=today_dashed_str_with_key()
+                )
 
-        return check_item_differences(
-            current=today_line_items, previous=prev_day_line_items
-        )
+        with profile_stage("compare"):
+            return check_item_differences(
+                current=today_line_items, previous=prev_day_line_items
+            )
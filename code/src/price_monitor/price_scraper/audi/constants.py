@@ -12,6 +12,8 @@ INCLUSION_AND_TYPE_URL = (
 )
 
 REQUEST_TIMEOUT_SECONDS = 120
+# The trimline fallbacks are sent once, a fallback not answering within it is skipped
+FALLBACK_REQUEST_TIMEOUT_SECONDS = 10
 
 
 AUDI_USA_BASE_URL = "https://www.audiusa.com"
@@ -1,6 +1,5 @@
 import re
 
-from bs4 import BeautifulSoup
 
 from src.price_monitor.model.line_item import LineItem
 from src.price_monitor.model.line_item_option_code import LineItemOptionCode
@@ -16,6 +15,7 @@ from src.price_monitor.price_scraper.constants import (
     NOT_AVAILABLE,
 )
 from src.price_monitor.utils.clock import today_dashed_str
+from src.price_monitor.utils.html_parser import parse_html
 from src.price_monitor.utils.line_item_factory import (
     create_line_item,
     create_line_item_option_code,
@@ -26,7 +26,7 @@ AUDI_VENDOR = Vendor.AUDI
 
 
 def parse_available_model_links(model_homepage: str) -> tuple[list, list]:
-    html_parser = BeautifulSoup(model_homepage, "html.parser")
+    html_parser = parse_html(model_homepage)
     cars = html_parser.find_all("div", {"data-carlineid": re.compile(".*")})
     links_having_price, links_not_having_price = [], []
     for car in cars:
@@ -1,13 +1,13 @@
-from bs4 import BeautifulSoup
 from loguru import logger
 
 from src.price_monitor.model.vendor import Vendor
+from src.price_monitor.utils.html_parser import parse_html
 
 AUDI_VENDOR = Vendor.AUDI
 
 
 def parse_available_model_range_links(model_homepage: str) -> tuple[list, list]:
-    html_parser = BeautifulSoup(model_homepage, "html.parser")
+    html_parser = parse_html(model_homepage)
     links_having_price, links_not_having_price = [], []
 
     for audi_car_model in html_parser.find_all("audi-modelfinder-car-model"):
@@ -1,4 +1,4 @@
-from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import Future
 from typing import List
 
 import requests
@@ -11,6 +11,9 @@ from src.price_monitor.model.vendor import Market, Vendor
 from src.price_monitor.repository.line_item_repository import (
     FileSystemLineItemRepository,
 )
+from src.price_monitor.repository.request_fallback_repository import (
+    FileSystemRequestFallbackRepository,
+)
 from src.price_monitor.price_scraper.audi.constants import (
     AUDI_BASE_URL,
     AUDI_MARKET_MAP,
@@ -29,15 +32,19 @@ from src.price_monitor.price_scraper.audi.scraper_usa import AudiScraperUSA
 from src.price_monitor.price_scraper.vendor_scraper import VendorScraper
 from src.price_monitor.utils.caller import execute_request
 from src.price_monitor.utils.clock import yesterday_dashed_str_with_key
+from src.price_monitor.utils.parse_pool import parse_in_pool
+from src.price_monitor.utils.scheduler import TaskPriority, get_scheduler
 
 
 def _find_available_models_link(session: Session, market: str) -> tuple[list, list]:
     url = f"{AUDI_BASE_URL}/{AUDI_MARKET_MAP[market]}/brand/{AUDI_MARKET_MAP[market]}/neuwagen.html"
     model_homepage = execute_request("get", url, session, response_format="text")
-    return parse_available_model_links(model_homepage)
+    return parse_in_pool(parse_available_model_links, model_homepage)
 
 
 class AudiScraper(VendorScraper):
+    vendor = Vendor.AUDI
+
     def __init__(
         self,
         line_item_repository: FileSystemLineItemRepository,
@@ -76,7 +83,10 @@ class AudiScraper(VendorScraper):
         response: List[LineItem] = []
         if market == Market.US:
             scraper = AudiScraperUSA(
-                self.line_item_repository, self.session, self.config
+                self.line_item_repository,
+                self.session,
+                self.config,
+                FileSystemRequestFallbackRepository(self.config),
             )
             return [scraper.scrape_models_for_usa()]
         elif market == Market.UK:
@@ -84,6 +94,7 @@ class AudiScraper(VendorScraper):
                 self.line_item_repository,
                 self.session,
                 self.config,
+                FileSystemRequestFallbackRepository(self.config),
             )
             response.extend(scraper.scrape_models_for_uk())
             return response
@@ -96,29 +107,25 @@ class AudiScraper(VendorScraper):
         if self.config.get("e2e_tests"):
             links_having_price = links_having_price[:2]
 
+        # Models without a price are scraped alongside the others, they mostly fall back to the previous dataset
         jobs: List[Future] = []
-        with ThreadPoolExecutor(
-            thread_name_prefix="audi_scraper", max_workers=len(links_having_price)
-        ) as ex:
-            for model_link in links_having_price:
-                logger.debug(f"[{market}] Scraping model {model_link}")
-                scraped_line_job = ex.submit(self._scrape_models_from_link, model_link)
-                jobs.append(scraped_line_job)
+        scheduler = get_scheduler()
+        for model_link in links_having_price + link_not_having_price:
+            logger.debug("[{}] Scraping model {}", market, model_link)
+            scraped_line_job = scheduler.submit(
+                self._scrape_models_from_link, model_link, priority=TaskPriority.HIGH
+            )
+            jobs.append(scraped_line_job)
 
-        for job in jobs:
-            line_item = job.result()
+        for line_item in scheduler.gather(jobs):
             if line_item is not None:
-                response.extend(job.result())
-
-        for model_link in link_not_having_price:
-            line_items = self._scrape_models_from_link(model_link)
-            response.extend(line_items)
+                response.extend(line_item)
 
         logger.info(f"Scraped {len(response)} models for market {market}")
         return response
 
     def _scrape_models_from_link(self, model_link: str) -> List[LineItem]:
-        logger.trace(f"[{self.market}] Scraping default model {model_link}")
+        logger.trace("[{}] Scraping default model {}", self.market, model_link)
 
         carinfo_link = f"{AUDI_BASE_URL}{model_link}.carinfo.mv-0-1733.31.json"
         trimlines_link = f"{AUDI_BASE_URL}{model_link}.modelsinfo.mv-0-1733.31.json"
@@ -128,6 +135,7 @@ class AudiScraper(VendorScraper):
 
     def _scrape_line_items(self, carinfo_link, model_link, trimlines_link):
         response: List[LineItem] = []
+        carinfo = None
         try:
             trimlines_info = execute_request("get", trimlines_link, self.session)
             carinfo = execute_request("get", carinfo_link, self.session)
@@ -138,14 +146,25 @@ class AudiScraper(VendorScraper):
 
             trimlines = trimlines_info["models"]
 
-            for trimline_code, trimline_details in trimlines.items():
-                line_item = self._get_line_item_from_trim_line(
+            # The option types only depend on the carinfo, they are fetched once while the trimlines are configured
+            scheduler = get_scheduler()
+            options_type = scheduler.submit(
+                self.get_options_types, carinfo, priority=TaskPriority.HIGH
+            )
+            jobs: List[Future] = [
+                scheduler.submit(
+                    self._get_line_item_from_trim_line,
                     model_link,
                     model_code,
                     trimline_code,
                     params,
                     carinfo,
+                    options_type,
+                    priority=TaskPriority.HIGH,
                 )
+                for trimline_code in trimlines
+            ]
+            for line_item in scheduler.gather(jobs):
                 if line_item is not None:
                     response.append(line_item)
         except Exception as e:
@@ -180,6 +199,7 @@ class AudiScraper(VendorScraper):
         trimline_code: str,
         params: str,
         carinfo: dict,
+        options_type: Future,
     ):
         try:
             trimline_json = self._get_trim_line_json(model_code, trimline_code, params)
@@ -194,9 +214,14 @@ class AudiScraper(VendorScraper):
                 trimline_code=trimline_code,
                 trimline_details=trimline_json,
                 carinfo=carinfo,
+                options_type=options_type,
             )
             logger.debug(
-                f"[{self.market}] Fetched {len(line_item.line_option_codes)} options for model {model_code} with trimline {trimline_code}"
+                "[{}] Fetched {} options for model {} with trimline {}",
+                self.market,
+                len(line_item.line_option_codes),
+                model_code,
+                trimline_code,
             )
             return line_item
         except Exception as e:
@@ -227,7 +252,10 @@ class AudiScraper(VendorScraper):
     def _get_trim_line_json(self, model_code, trimline_code, params):
         model_url = f"{DE_CONFIG_URL}&ids={params}&set={trimline_code}"
         logger.trace(
-            f"[{self.market}] Scraping trimline {trimline_code} for model {model_code}"
+            "[{}] Scraping trimline {} for model {}",
+            self.market,
+            trimline_code,
+            model_code,
         )
         trim_line_json = execute_request("get", model_url, self.session)
         if "conflicts" in trim_line_json:
@@ -249,13 +277,15 @@ class AudiScraper(VendorScraper):
         trimline_code: str,
         trimline_details: str,
         carinfo: dict,
+        options_type: Future,
     ) -> list[LineItemOptionCode]:
         line_option_codes = parse_line_item_options_for_trimline(
             trimline_details, carinfo["items"], self.market
         )
         try:
-            options_type = self.get_options_types(carinfo)
-            replace_options_type(line_option_codes, options_type)
+            replace_options_type(
+                line_option_codes, get_scheduler().gather([options_type])[0]
+            )
         except Exception as e:
             logger.warning(
                 f"[{self.market}] Unable to fetch generic option type for model {model_link} trimline {trimline_code}, {e}"
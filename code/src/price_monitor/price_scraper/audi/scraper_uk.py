@@ -5,6 +5,9 @@ from src.price_monitor.model.vendor import Market, Vendor
 from src.price_monitor.repository.line_item_repository import (
     FileSystemLineItemRepository,
 )
+from src.price_monitor.repository.request_fallback_repository import (
+    FileSystemRequestFallbackRepository,
+)
 from src.price_monitor.price_scraper.audi.constants import (
     AUDI_CAR_INFO_URL,
     AUDI_UK_BASE_URL,
@@ -17,9 +20,13 @@ from src.price_monitor.price_scraper.audi.parser_helper import (
 from src.price_monitor.price_scraper.audi.parser_uk import (
     parse_available_model_range_links,
 )
+from src.price_monitor.price_scraper.audi.trimline_resolver import (
+    TrimlineConfigResolver,
+)
 from src.price_monitor.price_scraper.constants import E2E_TEST_LIST_SIZE
 from src.price_monitor.utils.caller import execute_request
 from src.price_monitor.utils.clock import yesterday_dashed_str_with_key
+from src.price_monitor.utils.parse_pool import parse_in_pool
 
 
 class AudiScraperUK:
@@ -28,11 +35,22 @@ class AudiScraperUK:
         line_item_repository: FileSystemLineItemRepository,
         session: Session,
         config: dict,
+        request_fallback_repository: FileSystemRequestFallbackRepository = None,
     ):
         self.line_item_repository = line_item_repository
         self.session = session
         self.market = Market.UK
         self.config = config
+        self.request_fallback_repository = request_fallback_repository
+        self.trimline_resolver = TrimlineConfigResolver(
+            AUDI_UK_CONFIG_URL,
+            session,
+            (
+                request_fallback_repository.load(Vendor.AUDI, self.market)
+                if request_fallback_repository
+                else {}
+            ),
+        )
 
     def scrape_models_for_uk(self):
         line_items = []
@@ -42,7 +60,9 @@ class AudiScraperUK:
             "get", model_range_url, self.session, response_format="text"
         )
 
-        model_range_links = parse_available_model_range_links(homepage_text)
+        model_range_links = parse_in_pool(
+            parse_available_model_range_links, homepage_text
+        )
 
         if self.config.get("e2e_tests"):
             model_range_links = model_range_links[:E2E_TEST_LIST_SIZE]
@@ -61,9 +81,19 @@ class AudiScraperUK:
                 line_items.extend(
                     self._load_trim_lines_from_previous_day(model_range_link)
                 )
+        self._save_request_fallbacks()
         logger.info(f"[UK] Scraped {len(line_items)} for Audi")
         return line_items
 
+    def _save_request_fallbacks(self):
+        # Saved on every run using them, so the cleanup of the data directory never finds them stale
+        if self.request_fallback_repository and (
+            self.trimline_resolver.changed or self.trimline_resolver.learned
+        ):
+            self.request_fallback_repository.save(
+                Vendor.AUDI, self.market, self.trimline_resolver.learned
+            )
+
     def _load_trim_lines_from_previous_day(self, model_range_link):
         series, model_range_code = model_range_link.split("/")[:2]
         response = self.line_item_repository.load_model_filter_by_model_range_code(
@@ -85,7 +115,8 @@ class AudiScraperUK:
         config_data = execute_request("get", common_config_link, self.session)
 
         logger.debug(
-            f"[UK] Fetching available models for {config_data['configuration']['carlineName']}"
+            "[UK] Fetching available models for {}",
+            config_data["configuration"]["carlineName"],
         )
         model_details = execute_request("get", models_link, self.session)["models"]
         return self._get_line_items_for_model(model_details, config_data, link)
@@ -134,12 +165,7 @@ class AudiScraperUK:
         link,
         main_id,
     ):
-        # Setting up a parameter 'main_id' for api calls of trimlines details.
-        # It is set up only once for each model and used by all trimlines calls of that model.
-        params = {"ids": main_id, "set": model_id}
-        models_data = execute_request(
-            "get", AUDI_UK_CONFIG_URL, self.session, body=params
-        )
+        models_data = self.trimline_resolver.resolve(link, main_id, model_id)
 
         if "configuration" not in models_data and "conflicts" not in models_data:
             logger.info(
@@ -147,32 +173,13 @@ class AudiScraperUK:
             )
             return
 
-        # For specific Launch Edition line_item, APIs fails, in that we case need to add
-        # conflicting option params to the API.
-        if "prices" in models_data["configuration"]:
-            line_item = parse_model_line_item(
-                models_data, link, self.market, model_details
-            )
-        elif "choiceIds" in models_data["conflicts"]:
-            params = {
-                "ids": f"{models_data['conflicts']['prstring']}",
-            }
-            models_data = execute_request(
-                "get", AUDI_UK_CONFIG_URL, self.session, body=params
-            )
-            if "error" in models_data["header"]:
-                params["action"] = "accept"
-                models_data = execute_request(
-                    "get", AUDI_UK_CONFIG_URL, self.session, body=params
-                )
-            line_item = parse_model_line_item(
-                models_data, link, self.market, model_details
-            )
-        else:
+        # For specific Launch Edition line_item, APIs fails, the resolver then adds the conflicting option params.
+        if "prices" not in models_data.get("configuration", {}):
             logger.error(
                 f"[UK] Unable to parse Launch Edition line for response: {models_data}, model details: {model_details}"
             )
             return
+        line_item = parse_model_line_item(models_data, link, self.market, model_details)
         line_item.line_option_codes = parse_line_option_codes(
             models_data, descriptions, option_types, Market.UK
         )
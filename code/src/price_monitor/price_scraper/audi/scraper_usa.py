@@ -5,6 +5,9 @@ from src.price_monitor.model.vendor import Market, Vendor
 from src.price_monitor.repository.line_item_repository import (
     FileSystemLineItemRepository,
 )
+from src.price_monitor.repository.request_fallback_repository import (
+    FileSystemRequestFallbackRepository,
+)
 from src.price_monitor.price_scraper.audi.constants import (
     AUDI_USA_BASE_URL,
     AUDI_USA_CONFIG_URL,
@@ -16,9 +19,13 @@ from src.price_monitor.price_scraper.audi.parser_helper import (
 from src.price_monitor.price_scraper.audi.parser_usa import (
     parse_available_model_range_links,
 )
+from src.price_monitor.price_scraper.audi.trimline_resolver import (
+    TrimlineConfigResolver,
+)
 from src.price_monitor.price_scraper.constants import E2E_TEST_LIST_SIZE
 from src.price_monitor.utils.caller import execute_request
 from src.price_monitor.utils.clock import yesterday_dashed_str_with_key
+from src.price_monitor.utils.parse_pool import parse_in_pool
 
 
 class AudiScraperUSA:
@@ -27,11 +34,22 @@ class AudiScraperUSA:
         line_item_repository: FileSystemLineItemRepository,
         session: Session,
         config: dict,
+        request_fallback_repository: FileSystemRequestFallbackRepository = None,
     ):
         self.line_item_repository = line_item_repository
         self.session = session
         self.market = Market.US
         self.config = config
+        self.request_fallback_repository = request_fallback_repository
+        self.trimline_resolver = TrimlineConfigResolver(
+            AUDI_USA_CONFIG_URL,
+            session,
+            (
+                request_fallback_repository.load(Vendor.AUDI, self.market)
+                if request_fallback_repository
+                else {}
+            ),
+        )
 
     def scrape_models_for_usa(self):
         line_items = []
@@ -41,8 +59,8 @@ class AudiScraperUSA:
             "get", model_range_url, self.session, response_format="text"
         )
 
-        links_having_price, links_not_having_price = parse_available_model_range_links(
-            homepage_text
+        links_having_price, links_not_having_price = parse_in_pool(
+            parse_available_model_range_links, homepage_text
         )
 
         if self.config.get("e2e_tests"):
@@ -65,8 +83,18 @@ class AudiScraperUSA:
                 f"[{self.market}] model {model_range_link} doesn't have price. Loading previous day price."
             )
             line_items.extend(self._load_trim_lines_from_previous_day(model_range_link))
+        self._save_request_fallbacks()
         return line_items
 
+    def _save_request_fallbacks(self):
+        # Saved on every run using them, so the cleanup of the data directory never finds them stale
+        if self.request_fallback_repository and (
+            self.trimline_resolver.changed or self.trimline_resolver.learned
+        ):
+            self.request_fallback_repository.save(
+                Vendor.AUDI, self.market, self.trimline_resolver.learned
+            )
+
     def _load_trim_lines_from_previous_day(self, model_range_link):
         series, model_range_code = model_range_link.split("/")[5:7]
         response = self.line_item_repository.load_model_filter_by_model_range_code(
@@ -88,7 +116,8 @@ class AudiScraperUSA:
         config_data = execute_request("get", common_config_link, self.session)
 
         logger.debug(
-            f"[US] Fetching available models for {config_data['configuration']['carlineName']}"
+            "[US] Fetching available models for {}",
+            config_data["configuration"]["carlineName"],
         )
         model_details = execute_request("get", models_link, self.session)["models"]
 
@@ -136,12 +165,7 @@ class AudiScraperUSA:
         link,
         main_id,
     ):
-        # Seting up a parameter 'main_id' for api calls of trimlines details. It is setup only once for each model and used by all trimlines calls of that model.
-
-        params = {"ids": main_id, "set": model_id}
-        models_data = execute_request(
-            "get", AUDI_USA_CONFIG_URL, self.session, body=params
-        )
+        models_data = self.trimline_resolver.resolve(link, main_id, model_id)
 
         if "configuration" not in models_data and "conflicts" not in models_data:
             logger.info(
@@ -149,27 +173,13 @@ class AudiScraperUSA:
             )
             return
 
-        # For specific Launch Edition lineitem, APIs fails, in that we case need to add conflicting option params to the API.
-        if "prices" in models_data["configuration"]:
-            line_item = parse_model_line_item(models_data, link, self.market, "")
-        elif "choiceIds" in models_data["conflicts"]:
-            params = {
-                "ids": f"{models_data['conflicts']['prstring']}",
-            }
-            models_data = execute_request(
-                "get", AUDI_USA_CONFIG_URL, self.session, body=params
-            )
-            if "error" in models_data["header"]:
-                params["action"] = "accept"
-                models_data = execute_request(
-                    "get", AUDI_USA_CONFIG_URL, self.session, body=params
-                )
-            line_item = parse_model_line_item(models_data, link, self.market, "")
-        else:
+        # For specific Launch Edition line_item, APIs fails, the resolver then adds the conflicting option params.
+        if "prices" not in models_data.get("configuration", {}):
             logger.error(
                 f"[US] Unable to parse Launch Edition line for response: {models_data}, model details: {model_details}"
             )
             return
+        line_item = parse_model_line_item(models_data, link, self.market, "")
         line_item.line_option_codes = parse_line_option_codes(
             models_data, descriptions, Market.US
         )
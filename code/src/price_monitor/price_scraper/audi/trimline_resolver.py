@@ -0,0 +1,91 @@
+from loguru import logger
+from requests import RequestException, Session
+
+from src.price_monitor.price_scraper.audi.constants import (
+    FALLBACK_REQUEST_TIMEOUT_SECONDS,
+)
+from src.price_monitor.utils.caller import execute_request, execute_request_once
+
+
+def _has_prices(models_data: dict) -> bool:
+    return "prices" in models_data.get("configuration", {})
+
+
+class TrimlineConfigResolver:
+    """
+    Requests the configuration of a trimline. Launch editions answer with conflicts instead, which are resolved by
+    requesting the conflicting options, then by accepting them when still rejected.
+    The fallbacks are sent once with a short timeout instead of being retried, and the one answering is learned per
+    model range and trimline, so it is sent first the next time.
+    """
+
+    def __init__(
+        self,
+        config_url: str,
+        session: Session,
+        learned: dict[str, dict[str, dict]] | None = None,
+    ):
+        self.config_url = config_url
+        self.session = session
+        self.learned = learned if learned is not None else {}
+        self.changed = False
+
+    def resolve(self, model_range: str, main_id: str, model_id: str) -> dict:
+        learned_params = self.learned.get(model_range, {}).get(model_id)
+        if learned_params is not None:
+            models_data = self._request_fallback(learned_params)
+            if _has_prices(models_data):
+                return models_data
+            logger.info(
+                "Learned fallback of trimline {} for {} no longer answers, resolving it again",
+                model_id,
+                model_range,
+            )
+            self._forget(model_range, model_id)
+
+        # Setting up a parameter 'main_id' for api calls of trimlines details.
+        # It is set up only once for each model and used by all trimlines calls of that model.
+        models_data = execute_request(
+            "get",
+            self.config_url,
+            self.session,
+            body={"ids": main_id, "set": model_id},
+        )
+        if _has_prices(models_data) or "choiceIds" not in models_data.get(
+            "conflicts", {}
+        ):
+            return models_data
+
+        prstring = models_data["conflicts"]["prstring"]
+        for params in ({"ids": prstring}, {"ids": prstring, "action": "accept"}):
+            models_data = self._request_fallback(params)
+            if _has_prices(models_data):
+                self._learn(model_range, model_id, params)
+                return models_data
+        raise ValueError(
+            f"No fallback resolved the conflicts of trimline {model_id} for {model_range}: {models_data}"
+        )
+
+    def _request_fallback(self, params: dict) -> dict:
+        try:
+            return execute_request_once(
+                "get",
+                self.config_url,
+                self.session,
+                body=params,
+                timeout=FALLBACK_REQUEST_TIMEOUT_SECONDS,
+            )
+        except (RequestException, ValueError) as e:
+            logger.debug("Fallback {} failed: {}", params, e)
+            return {}
+
+    def _learn(self, model_range: str, model_id: str, params: dict):
+        if self.learned.get(model_range, {}).get(model_id) != params:
+            self.learned.setdefault(model_range, {})[model_id] = params
+            self.changed = True
+
+    def _forget(self, model_range: str, model_id: str):
+        del self.learned[model_range][model_id]
+        if len(self.learned[model_range]) == 0:
+            del self.learned[model_range]
+        self.changed = True
@@ -32,3 +32,7 @@ USA_MODEL_CONFIGURATION_URL = (
     "https://configure.bmwusa.com/UBYOConfigurator/v4/configuration"
 )
 X_API_KEY = "x-api-key"
+# Number of configurator sessions used in parallel to check the constructibility of the options of a model.
+USA_CONSTRUCTIBILITY_SESSIONS = 4
+# An extra configurator session is only opened for every this many options to check.
+USA_MIN_OPTIONS_PER_SESSION = 10
@@ -0,0 +1,167 @@
+import math
+
+import requests
+from loguru import logger
+
+from src.price_monitor.model.line_item_option_code import LineItemOptionCode
+from src.price_monitor.model.vendor import Market
+from src.price_monitor.price_scraper.bmw.constants import (
+    USA_CONSTRUCTIBILITY_SESSIONS,
+    USA_MIN_OPTIONS_PER_SESSION,
+    USA_MODEL_CONFIGURATION_URL,
+)
+from src.price_monitor.price_scraper.bmw.parser_usa import (
+    is_option_constructible_with_added_items,
+    parse_added_items,
+)
+from src.price_monitor.utils.caller import execute_request
+from src.price_monitor.utils.scheduler import TaskPriority, get_scheduler
+
+# Adding an option to the configuration and rolling it back
+ROUND_TRIPS_PER_CHECK = 2
+
+
+class USAConstructibilityEngine:
+    """
+    Checks the constructibility of the options of the lines of one BMW USA model.
+    Options are sharded across several configurator sessions, each one with its own cmId, and checked in parallel.
+    Every check is rolled back to the base configuration of the model, so the response for an option is the same
+    for all the lines of the model: it is requested once per run and reused for the other lines.
+    """
+
+    def __init__(
+        self,
+        model_details: dict,
+        session,
+        max_sessions: int = USA_CONSTRUCTIBILITY_SESSIONS,
+    ):
+        self.model_details = model_details
+        self.max_sessions = max_sessions
+        # (cmId, session) pairs, the first one is the base session of the model
+        self.sessions: list[tuple[str, requests.Session]] = [
+            (model_details["cmId"], session)
+        ]
+        self.added_items: dict[str, frozenset] = {}
+        self.results: dict[tuple[str, str, str], bool] = {}
+        self.round_trips = 0
+        self.round_trips_saved = 0
+
+    def get_constructible_options(
+        self,
+        line_code: str,
+        extra_designs_list: list,
+        options: list[LineItemOptionCode],
+    ) -> list[LineItemOptionCode]:
+        option_codes = dict.fromkeys(option.code for option in options)
+        missing_option_codes = [
+            option_code
+            for option_code in option_codes
+            if option_code not in self.added_items
+        ]
+        self.round_trips_saved += ROUND_TRIPS_PER_CHECK * (
+            len(option_codes) - len(missing_option_codes)
+        )
+        self._fetch_added_items(missing_option_codes)
+
+        constructible_options = []
+        for option in options:
+            key = (self.model_details["model"]["code"], line_code, option.code)
+            if key not in self.results:
+                self.results[key] = is_option_constructible_with_added_items(
+                    extra_designs_list, self.added_items[option.code]
+                )
+            if self.results[key]:
+                constructible_options.append(option)
+        return constructible_options
+
+    def log_summary(self, market: Market):
+        logger.info(
+            f"[{market}] Checked constructibility of {len(self.added_items)} options for model "
+            f"{self.model_details['model']['code']} over {len(self.sessions)} configurator sessions with "
+            f"{self.round_trips} round trips, {self.round_trips_saved} round trips saved by reusing results"
+        )
+
+    def _fetch_added_items(self, option_codes: list[str]):
+        if len(option_codes) == 0:
+            return
+
+        self._open_sessions(
+            min(
+                self.max_sessions,
+                math.ceil(len(option_codes) / USA_MIN_OPTIONS_PER_SESSION),
+            )
+        )
+        shards = [
+            option_codes[index :: len(self.sessions)]
+            for index in range(len(self.sessions))
+        ]
+        # A configurator session is stateful, so the options of a shard are checked one after the other
+        scheduler = get_scheduler()
+        jobs = [
+            scheduler.submit(
+                self._check_shard,
+                model_key,
+                session,
+                shard,
+                priority=TaskPriority.HIGH,
+            )
+            for (model_key, session), shard in zip(self.sessions, shards)
+        ]
+        for added_items, round_trips in scheduler.gather(jobs):
+            self.added_items.update(added_items)
+            self.round_trips += round_trips
+
+    def _open_sessions(self, count: int):
+        while len(self.sessions) < count:
+            session = requests.Session()
+            try:
+                model_details = execute_request(
+                    "get",
+                    f"{USA_MODEL_CONFIGURATION_URL}/start/{self.model_details['model']['code']}",
+                    session,
+                )
+            except Exception as e:
+                logger.debug(
+                    "[{}] Unable to open another configurator session for model {}, continuing with {}. Reason: {}",
+                    Market.US,
+                    self.model_details["model"]["code"],
+                    len(self.sessions),
+                    e,
+                )
+                return
+            finally:
+                self.round_trips += 1
+            self.sessions.append((model_details["cmId"], session))
+
+    def _check_shard(
+        self, model_key: str, session, option_codes: list[str]
+    ) -> tuple[dict[str, frozenset], int]:
+        added_items = {}
+        round_trips = 0
+        for option_code in option_codes:
+            added_items[option_code], option_round_trips = self._check_option(
+                model_key, session, option_code
+            )
+            round_trips += option_round_trips
+        return added_items, round_trips
+
+    def _check_option(
+        self, model_key: str, session, option_code: str
+    ) -> tuple[frozenset, int]:
+        url = f"{USA_MODEL_CONFIGURATION_URL}/{model_key}/{option_code}"
+        added_items = parse_added_items(execute_request("put", url, session))
+        try:
+            undo_url = f"{USA_MODEL_CONFIGURATION_URL}/{model_key}/undo"
+            execute_request("get", undo_url, session)
+        except Exception:
+            try:
+                execute_request("delete", url, session)
+                return added_items, ROUND_TRIPS_PER_CHECK + 1
+            except Exception:
+                logger.debug(
+                    "[{}] Unable to undo operation for model_key {} for option {}",
+                    Market.US,
+                    model_key,
+                    option_code,
+                )
+        return added_items, ROUND_TRIPS_PER_CHECK
@@ -5,7 +5,6 @@ import re
 import urllib
 from typing import List
 
-from bs4 import BeautifulSoup
 from loguru import logger
 
 from src.price_monitor.model.line_item import LineItem
@@ -25,6 +24,7 @@ from src.price_monitor.price_scraper.constants import (
     NOT_AVAILABLE,
 )
 from src.price_monitor.utils.clock import today_dashed_str
+from src.price_monitor.utils.html_parser import parse_html
 from src.price_monitor.utils.line_item_factory import (
     create_line_item,
     create_line_item_option_code,
@@ -218,7 +218,7 @@ def _get_available_language(series: dict, market: Market) -> str:
 
 
 def parse_api_token(token_content: str) -> str:
-    soup = BeautifulSoup(token_content, "html.parser")
+    soup = parse_html(token_content)
     # API Token is stored in the script tag in the form of base64 encoded string stored in JSON,
     # further, it is encoded in the form URI component.
     """
@@ -138,16 +138,22 @@ def parse_extra_designs_list(line_details):
 def parse_is_option_constructible(
     extra_designs_list: list, options_constructability_json: dict
 ) -> bool:
-    for extra_design in extra_designs_list:
-        # So, after adding that option to our line, if that option require different line,
-        # then different line code will also be added in the changeInfo, so on that basis we can check whether
-        # it is constructible or not.
-        if (
-            "changeInfo" in options_constructability_json["configuration"]
-            and extra_design
-            in options_constructability_json["configuration"]["changeInfo"][
-                "addItems"
-            ].keys()
-        ):
-            return False
-    return True
+    return is_option_constructible_with_added_items(
+        extra_designs_list, parse_added_items(options_constructability_json)
+    )
+
+
+def parse_added_items(options_constructability_json: dict) -> frozenset:
+    configuration = options_constructability_json["configuration"]
+    if "changeInfo" not in configuration:
+        return frozenset()
+    return frozenset(configuration["changeInfo"]["addItems"].keys())
+
+
+def is_option_constructible_with_added_items(
+    extra_designs_list: list, added_items: frozenset
+) -> bool:
+    # So, after adding that option to our line, if that option require different line,
+    # then different line code will also be added in the changeInfo, so on that basis we can check whether
+    # it is constructible or not.
+    return not any(extra_design in added_items for extra_design in extra_designs_list)
@@ -40,17 +40,20 @@ from src.price_monitor.price_scraper.bmw.scraper_usa import scrape_models_for_us
 from src.price_monitor.price_scraper.constants import NOT_AVAILABLE, E2E_TEST_LIST_SIZE
 from src.price_monitor.price_scraper.vendor_scraper import VendorScraper
 from src.price_monitor.utils.caller import execute_request
+from src.price_monitor.utils.catalog_cache import CatalogKind, fetch_catalog
 from src.price_monitor.utils.clock import (
     today_dashed_str,
     yesterday_dashed_str_with_key,
 )
+from src.price_monitor.utils.parse_pool import parse_in_pool
 
 
 def get_updated_token():
     api_token: str
     try:
-        token_content = execute_request("get", API_KEY_URL, response_format="text")
-        api_token = parse_api_token(token_content)
+        api_token = fetch_catalog(
+            CatalogKind.API_TOKEN, Vendor.BMW, None, API_KEY_URL, _fetch_api_token
+        )
     except Exception as e:
         api_token = NOT_AVAILABLE
         logger.error(
@@ -59,6 +62,11 @@ def get_updated_token():
     return api_token
 
 
+def _fetch_api_token() -> str:
+    token_content = execute_request("get", API_KEY_URL, response_format="text")
+    return parse_in_pool(parse_api_token, token_content)
+
+
 def get_model_matrix(market, session, headers, req=None) -> dict:
     """Wrapper function to generate a request.
     Creates a get-request for the website as input, returns the information about all lines.
@@ -68,8 +76,14 @@ def get_model_matrix(market, session, headers, req=None) -> dict:
             f"{BASE_URL}{MODEL_MATRICES_PATH}/{MARKET_MAP[market]}/effect-dates/{today_dashed_str()}"
             f"/order-dates/{today_dashed_str()}?closest-fallback=true"
         )
-    logger.trace(f"[{market}] Fetching available models at: {req}")
-    return execute_request("get", url=req, session=session, headers=headers)
+    logger.trace("[{}] Fetching available models at: {}", market, req)
+    return fetch_catalog(
+        CatalogKind.MODEL_MATRIX,
+        Vendor.BMW,
+        market,
+        req,
+        lambda: execute_request("get", url=req, session=session, headers=headers),
+    )
 
 
 def get_ix_models(market, req_header, session=requests.Session()):
@@ -92,19 +106,33 @@ def get_configuration_state_and_is_volt_48(
     url = f"{BASE_URL}{CONFIGURATION_STATE_PATH}/{MARKET_MAP[market]}/effect-dates/{effect_date}/order-dates/{today_dashed_str()}/models/{model_code}?included-elements={included_options_str}&mandatory-elements=&add-rules-for-mandatory-element-classes=fabric,paint,rim&debug=false"
     if model_code in ix_models:
         url = url.replace("bmwCar", "bmwi")
-    state_and_is_volt_48_json = execute_request("get", url, session, headers=headers)
-    if "classifiedConfiguration" not in state_and_is_volt_48_json:
-        raise ValueError(
-            f"[{market}] Failed to find configuration state and is_volt_48 flag for model {model_code}, "
-            f"{state_and_is_volt_48_json}"
+
+    def fetch_configuration_state():
+        state_and_is_volt_48_json = execute_request(
+            "get", url, session, headers=headers
         )
-    return state_and_is_volt_48_json
+        if "classifiedConfiguration" not in state_and_is_volt_48_json:
+            raise ValueError(
+                f"[{market}] Failed to find configuration state and is_volt_48 flag for model {model_code}, "
+                f"{state_and_is_volt_48_json}"
+            )
+        return state_and_is_volt_48_json
+
+    return fetch_catalog(
+        CatalogKind.CONFIGURATION_STATE,
+        Vendor.BMW,
+        market,
+        url,
+        fetch_configuration_state,
+    )
 
 
 class BMWScraper(VendorScraper):
     """This class initialises the scraper functionality for the BMW car prices.
     The best way to initialise this class is with a configuration dict or .ini file."""
 
+    vendor = Vendor.BMW
+
     def __init__(self, line_item_repository, config: dict = None) -> None:
         self.req_header = {
             "Content-Type": "application/json",
@@ -164,7 +192,7 @@ class BMWScraper(VendorScraper):
         )
 
         logger.debug(
-            f"[{self.market}] Found {len(parsed_line_items)} potential line items"
+            "[{}] Found {} potential line items", self.market, len(parsed_line_items)
         )
 
         if self.config.get("e2e_tests"):
@@ -226,8 +254,12 @@ class BMWScraper(VendorScraper):
         self, market, line_item, model_matrix
     ) -> LineItem:
         logger.debug(
-            f"[{self.market}] Fetching available options for [{line_item.model_code}] {line_item.model_description} "
-            f"with line {line_item.line_code} {line_item.line_description}"
+            "[{}] Fetching available options for [{}] {} with line {} {}",
+            self.market,
+            line_item.model_code,
+            line_item.model_description,
+            line_item.line_code,
+            line_item.line_description,
         )
         lines_str = parse_lines_string(model_matrix, line_item)
 
@@ -253,7 +285,10 @@ class BMWScraper(VendorScraper):
             tax_date=tax_date,
         )
         logger.trace(
-            f"[{self.market}] Found {len(available_options)} available options for model {line_item.model_description}"
+            "[{}] Found {} available options for model {}",
+            self.market,
+            len(available_options),
+            line_item.model_description,
         )
 
         # List of default/included options, it will be needed when we fetch extra options and their prices.
@@ -437,7 +472,9 @@ class BMWScraper(VendorScraper):
             },
         }
         logger.trace(
-            f"Generating option prices request for model {model_code} with body: {body}"
+            "Generating option prices request for model {} with body: {}",
+            model_code,
+            body,
         )
         url = f"{BASE_URL}{PUBLIC_PRICING_PATH}/{MARKET_MAP[self.market]}"
         if model_code in self.IX_MODELS:
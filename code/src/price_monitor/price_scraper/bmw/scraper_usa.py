@@ -1,4 +1,4 @@
-from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import Future
 
 import requests
 from loguru import logger
@@ -13,6 +13,9 @@ from src.price_monitor.price_scraper.bmw.constants import (
     USA_MODEL_CONFIGURATION_URL,
     USA_MODEL_LIST_URL,
 )
+from src.price_monitor.price_scraper.bmw.constructibility_usa import (
+    USAConstructibilityEngine,
+)
 from src.price_monitor.price_scraper.bmw.parser_usa import (
     extract_price,
     parse_all_available_options,
@@ -24,6 +27,7 @@ from src.price_monitor.price_scraper.bmw.parser_usa import (
 from src.price_monitor.price_scraper.constants import E2E_TEST_LIST_SIZE
 from src.price_monitor.utils.caller import execute_request
 from src.price_monitor.utils.clock import yesterday_dashed_str_with_key
+from src.price_monitor.utils.scheduler import TaskPriority, get_scheduler
 
 
 def scrape_models_for_usa(
@@ -42,45 +46,41 @@ def scrape_models_for_usa(
         model_code_list = list(model_code_list)[:E2E_TEST_LIST_SIZE]
 
     per_model_jobs: list[Future] = []
-    with ThreadPoolExecutor(
-        thread_name_prefix="scraper",
-        max_workers=len(model_code_list),
-    ) as ex:
-        for model_code in model_code_list:
-            try:
-                model_details = get_model_details(model_code, session)
-                job_for_a_model = ex.submit(
-                    get_line_items_for_model,
-                    market,
-                    model_details,
-                    session,
-                    line_item_repository,
-                )
-                per_model_jobs.append(job_for_a_model)
-            except Exception as e:
-                logger.error(
-                    f"[{market}] Failed to scrape model for {Vendor.BMW}, for model code : {model_code}. Reason : {e}, "
-                    f"Loading previous data...."
-                )
-                list_of_line_item = (
-                    line_item_repository.load_model_filter_by_model_code(
-                        date=yesterday_dashed_str_with_key(),
-                        market=market,
-                        vendor=Vendor.BMW,
-                        model_code=model_code,
-                    )
+    scheduler = get_scheduler()
+    for model_code in model_code_list:
+        try:
+            model_details = get_model_details(model_code, session)
+            job_for_a_model = scheduler.submit(
+                get_line_items_for_model,
+                market,
+                model_details,
+                session,
+                line_item_repository,
+                priority=TaskPriority.HIGH,
+            )
+            per_model_jobs.append(job_for_a_model)
+        except Exception as e:
+            logger.error(
+                f"[{market}] Failed to scrape model for {Vendor.BMW}, for model code : {model_code}. Reason : {e}, "
+                f"Loading previous data...."
+            )
+            list_of_line_item = line_item_repository.load_model_filter_by_model_code(
+                date=yesterday_dashed_str_with_key(),
+                market=market,
+                vendor=Vendor.BMW,
+                model_code=model_code,
+            )
+            if len(list_of_line_item) > 0:
+                line_items.extend(list_of_line_item)
+                logger.info(
+                    f"[{market}] Loaded {len(list_of_line_item)} trim lines for model: "
+                    f"{list_of_line_item[0].series} {list_of_line_item[0].model_range_description} "
+                    f"{list_of_line_item[0].model_description} {list_of_line_item[0].line_description}"
                 )
-                if len(list_of_line_item) > 0:
-                    line_items.extend(list_of_line_item)
-                    logger.info(
-                        f"[{market}] Loaded {len(list_of_line_item)} trim lines for model: "
-                        f"{list_of_line_item[0].series} {list_of_line_item[0].model_range_description} "
-                        f"{list_of_line_item[0].model_description} {list_of_line_item[0].line_description}"
-                    )
-
-    for job in per_model_jobs:
-        if job.result() is not None:
-            line_items.extend(job.result())
+
+    for model_line_items in scheduler.gather(per_model_jobs):
+        if model_line_items is not None:
+            line_items.extend(model_line_items)
 
     logger.info(f"[US] Found {len(line_items)} line items")
     return line_items
@@ -95,6 +95,7 @@ def get_model_details(model_code, session):
 def get_line_items_for_model(market, model_details, session, line_item_repository):
     # Basic Session key, used for getting the constructability of the option for a line.
     model_key = model_details["cmId"]
+    constructibility_engine = USAConstructibilityEngine(model_details, session)
     line_items = parse_line_items(model_details)
     for line_item in line_items:
         try:
@@ -111,6 +112,7 @@ def get_line_items_for_model(market, model_details, session, line_item_repositor
                 model_details,
                 model_key,
                 session,
+                constructibility_engine,
             )
         except Exception as e:
             logger.error(
@@ -133,6 +135,8 @@ def get_line_items_for_model(market, model_details, session, line_item_repositor
                 )
             else:
                 continue
+    if len(constructibility_engine.results) > 0:
+        constructibility_engine.log_summary(market)
     return line_items
 
 
@@ -144,10 +148,16 @@ def _scrape_line_options(
     model_details,
     model_key,
     session,
+    constructibility_engine: USAConstructibilityEngine | None = None,
 ):
     try:
         line_item.line_option_codes = get_line_options(
-            line_details, model_details, model_key, session
+            line_details,
+            model_details,
+            model_key,
+            session,
+            constructibility_engine,
+            line_item.line_code,
         )
     except Exception as e:
         logger.error(
@@ -175,8 +185,12 @@ def get_line_specific_details(
     model_details: dict, line_item: LineItem, model_key: str, session
 ):
     logger.debug(
-        f"[{Market.US}] Fetching line options for {model_details['model']['series']}, "
-        f"{model_details['model']['bodyStyle']}, {model_details['model']['name']} line {line_item.line_description}"
+        "[{}] Fetching line options for {}, {}, {} line {}",
+        Market.US,
+        model_details["model"]["series"],
+        model_details["model"]["bodyStyle"],
+        model_details["model"]["name"],
+        line_item.line_description,
     )
     if line_item.line_code == "BASIC_LINE":
         return model_details
@@ -193,12 +207,18 @@ def get_line_options(
     model_details: dict,
     model_key: str,
     session,
+    constructibility_engine: USAConstructibilityEngine | None = None,
+    line_code: str | None = None,
 ) -> list:
     line_options = []
     extra_designs_list = parse_extra_designs_list(line_details)
     all_available_options = parse_all_available_options(
         line_details, model_details["optionDetails"]
     )
+    if constructibility_engine is not None:
+        return constructibility_engine.get_constructible_options(
+            line_code, extra_designs_list, all_available_options
+        )
     for option in all_available_options:
         is_constructible = is_option_constructible_for_line(
             extra_designs_list, model_key, option, session
@@ -224,6 +244,9 @@ def is_option_constructible_for_line(
             execute_request("delete", url, session)
         except Exception:
             logger.debug(
-                f"[US] Unable to undo operation for model_key {model_key} for option {option.code}-{option.description}"
+                "[US] Unable to undo operation for model_key {} for option {}-{}",
+                model_key,
+                option.code,
+                option.description,
             )
     return is_constructible
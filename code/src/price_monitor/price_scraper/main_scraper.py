@@ -1,10 +1,13 @@
-from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import Future
 from typing import List
 
 from loguru import logger
 
 from src.price_monitor.model.line_item import LineItem
 from src.price_monitor.model.vendor import Vendor
+from src.price_monitor.repository.checkpoint_repository import (
+    FileSystemCheckpointRepository,
+)
 from src.price_monitor.repository.line_item_repository import (
     FileSystemLineItemRepository,
 )
@@ -14,15 +17,22 @@ from src.price_monitor.price_scraper.mercedes_benz.scraper import MercedesBenzSc
 from src.price_monitor.price_scraper.tesla.scraper import TeslaScraper
 from src.price_monitor.price_scraper.vendor_scraper import VendorScraper
 from src.price_monitor.utils.clock import today_dashed_str_with_key
+from src.price_monitor.utils.scheduler import TaskPriority, get_scheduler
 
 
 def scrape(
     config: dict,
     line_item_repository: FileSystemLineItemRepository,
+    resume: bool = False,
 ):
+    checkpoint_repository = FileSystemCheckpointRepository(config=config)
+    if not resume:
+        checkpoint_repository.clear()
+
     scrapers = _init_scrapers(
         config=config,
         line_item_repository=line_item_repository,
+        checkpoint_repository=checkpoint_repository,
     )
     scraped_line_items = _start_scraper_jobs(scrapers=scrapers)
     existing_line_items = line_item_repository.load(today_dashed_str_with_key())
@@ -33,8 +43,13 @@ def scrape(
             existing_line_items, scraped_line_items, config
         )
 
+    # The snapshot is complete, checkpoints are only needed to recover from a crash before this point
+    checkpoint_repository.clear()
+
 
-def _init_scrapers(config: dict, line_item_repository) -> list[VendorScraper]:
+def _init_scrapers(
+    config: dict, line_item_repository, checkpoint_repository=None
+) -> list[VendorScraper]:
     scrapers_list = list()
     vendor_scraper_map = {
         Vendor.AUDI: AudiScraper,
@@ -48,6 +63,7 @@ def _init_scrapers(config: dict, line_item_repository) -> list[VendorScraper]:
             scraper_vendor_instance = vendor_scraper_map[vendor](
                 line_item_repository, config
             )
+            scraper_vendor_instance.checkpoint_repository = checkpoint_repository
             scrapers_list.append(scraper_vendor_instance)
     return scrapers_list
 
@@ -57,15 +73,17 @@ def _start_scraper_jobs(scrapers: list[VendorScraper]):
     all_line_items: List[LineItem] = []
 
     if len(scrapers) > 0:
-        with ThreadPoolExecutor(
-            thread_name_prefix="scraper", max_workers=len(scrapers)
-        ) as ex:
-            for scraper_instance in scrapers:
-                job = ex.submit(_run_scraper, scraper_instance)
-                scraper_jobs.append(job)
-
-        for job in scraper_jobs:
-            line_item = job.result()
+        scheduler = get_scheduler()
+        for scraper_instance in scrapers:
+            job = scheduler.submit(
+                _run_scraper,
+                scraper_instance,
+                vendor=scraper_instance.vendor,
+                priority=TaskPriority.LOW,
+            )
+            scraper_jobs.append(job)
+
+        for line_item in scheduler.gather(scraper_jobs):
             if line_item is not None:
                 all_line_items.extend(line_item)
 
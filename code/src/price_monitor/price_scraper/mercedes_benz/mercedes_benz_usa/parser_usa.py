@@ -3,7 +3,6 @@ import re
 from dataclasses import dataclass
 from typing import List
 
-from bs4 import BeautifulSoup
 
 from src.price_monitor.model.line_item import LineItem
 from src.price_monitor.model.line_item_option_code import LineItemOptionCode
@@ -13,6 +12,7 @@ from src.price_monitor.price_scraper.constants import (
     NOT_AVAILABLE,
 )
 from src.price_monitor.utils.clock import today_dashed_str
+from src.price_monitor.utils.html_parser import parse_html
 from src.price_monitor.utils.line_item_factory import (
     create_line_item,
     create_line_item_option_code,
@@ -152,7 +152,7 @@ class MercedesBenzUSAParser:
         prefix_arg: str = None,
         separator: str = None,
     ):
-        html_parser = BeautifulSoup(model_page, "html.parser")
+        html_parser = parse_html(model_page)
         mercedes_usa_model_pattern = re.compile(pattern, re.MULTILINE)
 
         response_json = {}
@@ -15,6 +15,7 @@ from src.price_monitor.price_scraper.mercedes_benz.mercedes_benz_usa.scraper_usa
     execute_model_request,
 )
 from src.price_monitor.utils.clock import yesterday_dashed_str
+from src.price_monitor.utils.parse_pool import parse_in_pool
 
 
 class MercedesBenzUSAScraper:
@@ -52,7 +53,9 @@ class MercedesBenzUSAScraper:
         trim_lines = []
 
         if model_page:
-            line_code_resource_list = self.parser.parse_line_codes(model_page)
+            line_code_resource_list = parse_in_pool(
+                self.parser.parse_line_codes, model_page
+            )
             for trim_code in line_code_resource_list:
                 logger.info(
                     f"[{self.market}] Scraping {trim_code.line_description} Line for model {model.model_code}"
@@ -94,7 +97,9 @@ class MercedesBenzUSAScraper:
     ) -> list[LineItem]:
         model_page = execute_model_request(path, self.session)
         if model_page:
-            return self.parser.parse_trim_line(model_page, line_description, line_code)
+            return parse_in_pool(
+                self.parser.parse_trim_line, model_page, line_description, line_code
+            )
         return []
 
     def _load_previous_day_line_items(self, model: AvailableModel) -> list[LineItem]:
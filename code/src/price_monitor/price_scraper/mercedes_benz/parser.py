@@ -1,4 +1,6 @@
+import functools
 import re
+from dataclasses import dataclass, field
 from typing import List, Set
 
 from loguru import logger
@@ -25,6 +27,10 @@ LIST_OF_CLASS_NAMES_WITH_KLASSE = [
     "G-KLASSE",
     "S-KLASSE",
 ]
+# Subcategories listing the lines themselves, only kept for the basic line
+LINE_ONLY_SUBCATEGORY_IDS = frozenset({"ZK096", "ZK017"})
+IGNORED_OPTION_CODE = "PC-PYF"
+DIGIT = re.compile(r"\d")
 
 
 def parse_available_models_links(data: dict) -> Set[str]:
@@ -179,83 +185,147 @@ def split_engine_performance(
 
 
 def get_option_codes(component_categories: dict, is_line_basic: bool) -> List[str]:
-    list_of_component_id = []
+    option_codes = set()
     # the component_id's are in nested form for a few component categories.
     # for example : category->subcategory->subcategory->component_id
-    for i in range(len(component_categories)):
-        if "standardComponentIds" in component_categories[i]:
-            component_id = component_categories[i]["standardComponentIds"]
-            _append_option_code(component_id, list_of_component_id)
-        if "subcategories" not in component_categories[i]:
-            continue
-        category = component_categories[i]["subcategories"]
-        for j in range(len(category)):
-            if "componentIds" in category[j]:
-                component_id = category[j]["componentIds"]
-                _append_option_code(component_id, list_of_component_id)
-            if "subcategories" in category[j]:
-                subcategories = category[j]["subcategories"]
-                for k in range(len(subcategories)):
-                    if not is_line_basic and (
-                        subcategories[k]["id"] == "ZK096"
-                        or subcategories[k]["id"] == "ZK017"
-                    ):
-                        continue
-                    if "componentIds" in subcategories[k]:
-                        component_id = subcategories[k]["componentIds"]
-                        _append_option_code(component_id, list_of_component_id)
-                    if "subcategories" in subcategories[k]:
-                        subcategory = subcategories[k]["subcategories"]
-                        for count in range(len(subcategory)):
-                            if "componentIds" in subcategory[count]:
-                                component_id = subcategory[count]["componentIds"]
-                                _append_option_code(component_id, list_of_component_id)
-    return sorted(list(set(list_of_component_id)))
+    for category in component_categories:
+        option_codes.update(category.get("standardComponentIds", []))
+        for subcategory in category.get("subcategories", []):
+            option_codes.update(subcategory.get("componentIds", []))
+            for nested_subcategory in subcategory.get("subcategories", []):
+                if (
+                    not is_line_basic
+                    and nested_subcategory["id"] in LINE_ONLY_SUBCATEGORY_IDS
+                ):
+                    continue
+                option_codes.update(nested_subcategory.get("componentIds", []))
+                for component_category in nested_subcategory.get("subcategories", []):
+                    option_codes.update(component_category.get("componentIds", []))
+    option_codes.discard(IGNORED_OPTION_CODE)
+    return sorted(option_codes)
 
 
 def _append_option_code(component_id, list_of_component_id):
     for id in component_id:
-        if id == "PC-PYF":
+        if id == IGNORED_OPTION_CODE:
             continue
         list_of_component_id.append(id)
 
 
-def parse_line_options(
-    is_type_hierarchy_enabled_mb, data: dict, is_line_basic: bool, line_description: str
+@dataclass(frozen=True)
+class ParsedComponent:
+    code: str
+    type: str
+    description: str
+    net_list_price: float
+    gross_list_price: float
+    included: bool
+    incompatible_with: frozenset[str]
+
+
+@dataclass(frozen=True)
+class ComponentTable:
+    """
+    The components of an options payload, with the option codes of the basic line and of the trim lines.
+    A component is parsed once, when a line listing it is first sliced, so a trim line skips the line-only components.
+    Components without a usable type are parsed to None.
+    """
+
+    is_type_hierarchy_enabled_mb: bool
+    raw_components: dict
+    basic_line_option_codes: list[str]
+    trim_line_option_codes: list[str]
+    components: dict[str, ParsedComponent | None] = field(default_factory=dict)
+
+    def component(self, code: str) -> ParsedComponent | None:
+        if code not in self.components:
+            self.components[code] = _parse_component(
+                self.is_type_hierarchy_enabled_mb, self.raw_components[code]
+            )
+        return self.components[code]
+
+
+def _parse_component(
+    is_type_hierarchy_enabled_mb, component: dict
+) -> ParsedComponent | None:
+    option_type = _option_type(
+        is_type_hierarchy_enabled_mb, tuple(component.get("path") or ())
+    )
+    if option_type is None:
+        return None
+    return ParsedComponent(
+        code=component["id"],
+        type=option_type,
+        description=remove_new_line_characters(
+            component.get("name", MISSING_LINE_OPTION_DETAILS)
+        ),
+        net_list_price=component["price"]["netPrice"],
+        gross_list_price=component["price"]["price"],
+        included=component["selected"],
+        incompatible_with=frozenset(component.get("incompatibleWith", ())),
+    )
+
+
+def parse_component_table(is_type_hierarchy_enabled_mb, data: dict) -> ComponentTable:
+    return ComponentTable(
+        is_type_hierarchy_enabled_mb=is_type_hierarchy_enabled_mb,
+        raw_components=data["components"],
+        basic_line_option_codes=get_option_codes(data["componentCategories"], True),
+        trim_line_option_codes=get_option_codes(data["componentCategories"], False),
+    )
+
+
+def slice_line_options(
+    component_table: ComponentTable, is_line_basic: bool, line_description: str
 ) -> List[LineItemOptionCode]:
-    line_option_codes: List[LineItemOptionCode] = []
-    option_codes = get_option_codes(data["componentCategories"], is_line_basic)
-    components = data["components"]
     line_description = line_description.split(" ")[0]
+    if is_line_basic:
+        option_codes = component_table.basic_line_option_codes
+    else:
+        option_codes = component_table.trim_line_option_codes
+    line_option_codes: List[LineItemOptionCode] = []
     for code in option_codes:
-        if not is_line_basic and (
-            "incompatibleWith" in components[code]
-            and line_description in components[code]["incompatibleWith"]
+        component = component_table.component(code)
+        if component is None or (
+            not is_line_basic and line_description in component.incompatible_with
         ):
             continue
-        if components[code].get("path"):
-            path = components[code].get("path")
-            split_scraped_type = [None if re.findall(r"\d", x) else x for x in path]
-            type = [i for i in split_scraped_type if i is not None]
-            if len(type) < 1:
-                continue
-        else:
-            type = [MISSING_LINE_OPTION_DETAILS]
         line_option_codes.append(
             create_line_item_option_code(
-                code=components[code]["id"],
-                type=_build_option_type(is_type_hierarchy_enabled_mb, type),
-                description=remove_new_line_characters(
-                    components[code].get("name", MISSING_LINE_OPTION_DETAILS)
-                ),
-                net_list_price=components[code]["price"]["netPrice"],
-                gross_list_price=components[code]["price"]["price"],
-                included=components[code]["selected"],
+                code=component.code,
+                type=component.type,
+                description=component.description,
+                net_list_price=component.net_list_price,
+                gross_list_price=component.gross_list_price,
+                included=component.included,
             )
         )
     return line_option_codes
 
 
+def parse_line_options(
+    is_type_hierarchy_enabled_mb, data: dict, is_line_basic: bool, line_description: str
+) -> List[LineItemOptionCode]:
+    return slice_line_options(
+        parse_component_table(is_type_hierarchy_enabled_mb, data),
+        is_line_basic,
+        line_description,
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _option_type(is_type_hierarchy_enabled_mb, path: tuple[str, ...]) -> str | None:
+    # The same paths come back in the payloads of every vehicle and trim line of a market
+    if not path:
+        return _build_option_type(
+            is_type_hierarchy_enabled_mb, [MISSING_LINE_OPTION_DETAILS]
+        )
+    option_type = [segment for segment in path if not DIGIT.search(segment)]
+    if len(option_type) < 1:
+        return None
+    return _build_option_type(is_type_hierarchy_enabled_mb, option_type)
+
+
 def _build_option_type(is_type_hierarchy_enabled_mb, path: list) -> str:
     if not is_type_hierarchy_enabled_mb:
         if len(path) > 1 and f"{path[-2]}_" in path[-1]:
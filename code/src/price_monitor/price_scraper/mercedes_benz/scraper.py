@@ -42,6 +42,8 @@ def _find_available_models(market: Market, session: Session) -> set[str]:
 
 
 class MercedesBenzScraper(VendorScraper):
+    vendor = Vendor.MERCEDES_BENZ
+
     def __init__(self, line_item_repository, config: dict = None):
         self.markets: list[Market] = []
         self.line_item_repository = line_item_repository
@@ -94,7 +96,7 @@ class MercedesBenzScraper(VendorScraper):
             models = list(models)[:E2E_TEST_LIST_SIZE]
 
         for model in models:
-            logger.debug(f"[{market}] Scraping {model}")
+            logger.debug("[{}] Scraping {}", market, model)
             line_items = self._scrape_model(model, version)
             response.extend(line_items)
         logger.info(f"Scraped {len(response)} models for market {market}")
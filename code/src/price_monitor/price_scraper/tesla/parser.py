@@ -1,8 +1,8 @@
 import json
 import re
+from dataclasses import dataclass
 from typing import Dict, List, Optional, Set
 
-from bs4 import BeautifulSoup
 from loguru import logger
 
 from src.price_monitor.model.line_item import LineItem
@@ -15,6 +15,7 @@ from src.price_monitor.price_scraper.constants import (
 )
 from src.price_monitor.price_scraper.tesla.constants import MODELS
 from src.price_monitor.utils.clock import today_dashed_str
+from src.price_monitor.utils.html_parser import parse_html
 from src.price_monitor.utils.line_item_factory import (
     create_line_item,
     create_line_item_option_code,
@@ -31,8 +32,24 @@ SKIP_TYPES = [
 ]
 
 
-def parse_line_items(model_page: str, market: Market) -> List[LineItem]:
-    line_option_for_model: list
+@dataclass(frozen=True)
+class TeslaLexicon:
+    """
+    Normalized view of the lexicon of a model page, parsed once and shared by all the trims of the model,
+    and through the catalog cache by the price and finance scrapers.
+    """
+
+    series: str
+    model_range: str
+    model_range_code: str
+    options: dict
+    sku: dict
+    trim_codes: frozenset[str]
+    # Group code of every option, an option listed in several groups belongs to the first one
+    option_groups: dict[str, str]
+
+
+def parse_lexicon(model_page: str) -> TeslaLexicon:
     tesla_object = _get_tesla_object(model_page)
     dss_services = tesla_object["DSServices"]
     lexicon_config_key = dss_services["KeyManager"]["keys"]["Lexicon"][0]["key"]
@@ -42,18 +59,19 @@ def parse_line_items(model_page: str, market: Market) -> List[LineItem]:
     model_range = series
     model_range_code = series
     options = lexicon["options"]
-    groups = lexicon["groups"]
-    sku = lexicon["sku"]
 
     trim_codes = set()
-    response = []
+    option_groups: dict[str, str] = {}
+
+    for group in lexicon["groups"]:
+        for option_code in group["options"]:
+            option_groups.setdefault(option_code, str(group["code"]))
 
-    for group in groups:
         # get the trim line codes for the model.
         if group["code"] == "TRIM":
             trim_code = group["options"]
             trim_codes.update(trim_code)
-            logger.trace(f"Added trim codes for {model_range}: {trim_code}")
+            logger.trace("Added trim codes for {}: {}", model_range, trim_code)
 
         # fetching the base model details
         if group["code"] == "MODEL":
@@ -61,25 +79,46 @@ def parse_line_items(model_page: str, market: Market) -> List[LineItem]:
             model_range = base_model_options["name"]
             model_range_code = base_model_options["code"]
 
-    for trim_code in trim_codes:
-        if "configurator" in sku["trims"][trim_code]:
+    return TeslaLexicon(
+        series=series,
+        model_range=model_range,
+        model_range_code=model_range_code,
+        options=options,
+        sku=lexicon["sku"],
+        trim_codes=frozenset(trim_codes),
+        option_groups=option_groups,
+    )
+
+
+def parse_line_items(model_page: str, market: Market) -> List[LineItem]:
+    return parse_trim_line_items(parse_lexicon(model_page), market)
+
+
+def parse_trim_line_items(lexicon: TeslaLexicon, market: Market) -> List[LineItem]:
+    line_option_for_model: list
+    response = []
+
+    for trim_code in lexicon.trim_codes:
+        if "configurator" in lexicon.sku["trims"][trim_code]:
             line_option_for_model = parse_available_options_for_model(
-                market, groups, sku, options, trim_code
+                market, lexicon, trim_code
             )
             item = _create_line_item_from_trim(
-                series=series,
+                series=lexicon.series,
                 market=market,
-                model_range=model_range,
-                model_range_code=model_range_code,
+                model_range=lexicon.model_range,
+                model_range_code=lexicon.model_range_code,
                 trim_code=trim_code,
-                options=options,
+                options=lexicon.options,
                 line_option=line_option_for_model,
             )
             if item:
                 response.append(item)
 
     logger.trace(
-        f"Parsed {len(trim_codes)} trims from for {model_range} from tesla object: {tesla_object}"
+        "Parsed {} trims from for {} from tesla lexicon",
+        len(lexicon.trim_codes),
+        lexicon.model_range,
     )
 
     return response
@@ -92,23 +131,26 @@ def parse_available_models_links(page_headers: dict) -> Set[str]:
         if item["title"].startswith("Model"):
             model_links.add(item["links"][1]["href"])
 
-    logger.trace(f"Found {len(model_links)} models")
+    logger.trace("Found {} models", len(model_links))
     return model_links
 
 
 def parse_available_options_for_model(
-    market: Market, groups: dict, sku: dict, options: dict, trim_code: str
+    market: Market, lexicon: TeslaLexicon, trim_code: str
 ) -> list[LineItemOptionCode]:
     line_option_for_model: list[LineItemOptionCode] = list()
     option_code: str
     option_type: str
     option_price: int
     option_inclusion: bool
-    option_codes = _get_line_option_codes(sku, trim_code)
+    options = lexicon.options
+    option_codes = _get_line_option_codes(lexicon.sku, trim_code)
     for code in option_codes:
         if code in options:
             option_code = code
-            option_type = _get_line_option_type(groups, option_code)
+            option_type = lexicon.option_groups.get(
+                option_code, MISSING_LINE_OPTION_DETAILS
+            )
             # check for the invalid option type
             if option_type not in SKIP_TYPES:
                 # check for availability of description
@@ -165,13 +207,6 @@ def _get_line_option_codes(sku, trim_code) -> set[str]:
     return option_codes
 
 
-def _get_line_option_type(groups, option_code) -> str:
-    for i in range(len(groups)):
-        if option_code in groups[i]["options"]:
-            return str(groups[i]["code"])
-    return MISSING_LINE_OPTION_DETAILS
-
-
 def _create_line_item_from_trim(
     series: str,
     market: Market,
@@ -252,7 +287,7 @@ def _add_extra_price_for_trim_line(gross_list_price, options, trim) -> float:
 
 # extract json from the html page of the model.
 def _get_tesla_object(model_page: str) -> Dict:
-    html_parser = BeautifulSoup(model_page, "html.parser")
+    html_parser = parse_html(model_page)
     tesla_object_pattern = re.compile(r"const dataJson = {(.*)(\s*)(.*)}", re.MULTILINE)
 
     for script in html_parser.find_all("script", {"src": False}):
@@ -10,8 +10,10 @@ from selenium.webdriver.support.wait import WebDriverWait
 from webdriver_manager.chrome import ChromeDriverManager
 
 from src.price_monitor.price_scraper.constants import USER_AGENT
+from src.price_monitor.utils.http_recorder import replayable
 
 
+@replayable("selenium")
 @retry(tries=3, delay=3, backoff=2)
 def get_otr_prices_for_model(
     url: str,
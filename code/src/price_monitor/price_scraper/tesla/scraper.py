@@ -12,12 +12,15 @@ from src.price_monitor.price_scraper.tesla.constants import BASE_URL, MARKET_MAP
 from src.price_monitor.price_scraper.tesla.parser import (
     adjust_otr_price,
     parse_available_models_links,
-    parse_line_items,
+    parse_lexicon,
     parse_model_and_series,
+    parse_trim_line_items,
 )
 from src.price_monitor.price_scraper.tesla.scrape_otr import get_otr_prices_for_model
 from src.price_monitor.price_scraper.vendor_scraper import VendorScraper
+from src.price_monitor.utils.catalog_cache import CatalogKind, fetch_catalog
 from src.price_monitor.utils.clock import yesterday_dashed_str_with_key
+from src.price_monitor.utils.parse_pool import parse_in_pool
 from src.price_monitor.utils.selenium_caller import selenium_execute_request
 
 
@@ -25,7 +28,13 @@ def _find_available_models(market: Market) -> Set[str]:
     model_links_json: dict = {}
     try:
         url = f"{BASE_URL}/{MARKET_MAP.get(market)}/api/tesla/header/megamenu/v1_2"
-        model_links_json = selenium_execute_request(url=url, response_format="json")
+        model_links_json = fetch_catalog(
+            CatalogKind.MODEL_LIST,
+            Vendor.TESLA,
+            market,
+            url,
+            lambda: selenium_execute_request(url=url, response_format="json"),
+        )
         return parse_available_models_links(model_links_json)
     except Exception as e:
         logger.error(
@@ -36,6 +45,8 @@ def _find_available_models(market: Market) -> Set[str]:
 
 
 class TeslaScraper(VendorScraper):
+    vendor = Vendor.TESLA
+
     def __init__(self, line_item_repository, config: dict = None):
         self.markets: list[Market] = []
         self.line_item_repository = line_item_repository
@@ -46,7 +57,7 @@ class TeslaScraper(VendorScraper):
         response: List[LineItem] = []
 
         for market in self.markets:
-            response.extend(self.scrape_models(market))
+            response.extend(self.scrape_market(market))
 
         return response
 
@@ -97,7 +108,7 @@ class TeslaScraper(VendorScraper):
             models = list(models)[:E2E_TEST_LIST_SIZE]
 
         for model in models:
-            logger.debug(f"[{market}] Scraping {model}")
+            logger.debug("[{}] Scraping {}", market, model)
             response.extend(self._scrape_model(model))
 
         logger.info(f"Scraped {len(response)} models for market {market}")
@@ -106,8 +117,17 @@ class TeslaScraper(VendorScraper):
     def _scrape_model(self, model: str) -> List[LineItem]:
         url = f"{BASE_URL}{model}#overview"
         try:
-            model_page = selenium_execute_request(url=url, response_format="text")
-            line_items = parse_line_items(model_page, self.market)
+            lexicon = fetch_catalog(
+                CatalogKind.MODEL_LEXICON,
+                Vendor.TESLA,
+                self.market,
+                url,
+                lambda: parse_in_pool(
+                    parse_lexicon,
+                    selenium_execute_request(url=url, response_format="text"),
+                ),
+            )
+            line_items = parse_trim_line_items(lexicon, self.market)
             if self.market == Market.UK:
                 otr_prices = get_otr_prices_for_model(url)
                 line_items = adjust_otr_price(line_items, otr_prices)
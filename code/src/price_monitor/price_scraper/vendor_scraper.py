@@ -1,10 +1,16 @@
-from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import Future
+
+from loguru import logger
 
 from src.price_monitor.model.line_item import LineItem
-from src.price_monitor.model.vendor import Market
+from src.price_monitor.model.vendor import Market, Vendor
+from src.price_monitor.utils.scheduler import get_scheduler
 
 
 class VendorScraper:
+    vendor: Vendor | None = None
+    checkpoint_repository = None
+
     def __init__(self, line_item_repository, config):
         self.markets = None
         self.line_item_repository = (line_item_repository,)
@@ -18,25 +24,48 @@ class VendorScraper:
 
         if len(self.get_markets_to_scrape()) > 0:
             scraper_market_jobs: list[Future] = []
+            scheduler = get_scheduler()
+
+            for market in self.get_markets_to_scrape():
+                scraper = self.__class__(
+                    self.line_item_repository,
+                    self.config,
+                )
+                scraper.checkpoint_repository = self.checkpoint_repository
+                job_scrape_market = scheduler.submit(
+                    scraper.scrape_market, market, vendor=self.vendor, market=market
+                )
+                scraper_market_jobs.append(job_scrape_market)
 
-            with ThreadPoolExecutor(
-                thread_name_prefix="scraper",
-                max_workers=len(self.get_markets_to_scrape()),
-            ) as ex:
-                for market in self.get_markets_to_scrape():
-                    scraper = self.__class__(
-                        self.line_item_repository,
-                        self.config,
-                    )
-                    job_scrape_market = ex.submit(scraper.scrape_models, market)
-                    scraper_market_jobs.append(job_scrape_market)
-
-            for job in scraper_market_jobs:
-                line_item = job.result()
+            for line_item in scheduler.gather(scraper_market_jobs):
                 if line_item is not None:
                     line_items_all_markets.extend(line_item)
         return line_items_all_markets
 
+    def scrape_market(self, market: Market) -> list[LineItem]:
+        if self.checkpoint_repository is None:
+            return self.scrape_models(market)
+
+        line_items = self.checkpoint_repository.load(self.vendor, market)
+        if line_items is not None:
+            logger.info(
+                f"[{market}] Resuming {self.vendor} from {len(line_items)} checkpointed line items"
+            )
+            return line_items
+
+        line_items = self.scrape_models(market)
+        if line_items is None:
+            return line_items
+        # Line items loaded from yesterday after a failure are left to the resumed run to scrape again
+        fallbacks = sum(1 for line_item in line_items if line_item.is_current is False)
+        if fallbacks > 0:
+            logger.info(
+                f"[{market}] Not checkpointing {self.vendor}, {fallbacks} line items fell back to yesterday"
+            )
+        else:
+            self.checkpoint_repository.save(self.vendor, market, line_items)
+        return line_items
+
     def scrape_models(self, market: Market) -> list[LineItem]:
         pass
 
@@ -0,0 +1,63 @@
+import glob
+import os
+
+from fastavro import reader, writer
+from loguru import logger
+
+from src.price_monitor.model.batch_builder import build_line_items
+from src.price_monitor.model.line_item import LineItem
+from src.price_monitor.model.line_item_option_code import LineItemOptionCode
+from src.price_monitor.model.vendor import Market, Vendor
+from src.price_monitor.utils.clock import today_dashed_str_with_key
+from src.price_monitor.utils.io import filter_dataclass_attributes, get_avro_schema
+
+
+class FileSystemCheckpointRepository:
+    """
+    Persists the line items of each (vendor, market) as soon as it is scraped, so a run that
+    crashes can be resumed without scraping the completed partitions again.
+    Checkpoints live outside the dated output folder, which is the one synced with ADLS.
+    """
+
+    def __init__(self, config: dict, date: str = today_dashed_str_with_key()):
+        output = config["output"]
+        checkpoint_dir = output.get(
+            "checkpoint_directory", f"{output['directory']}/checkpoints"
+        )
+
+        self.target_dir = f"{checkpoint_dir}/{date}"
+        self.filename = output["prices_filename"]
+
+    def save(self, vendor: Vendor, market: Market, line_items: list[LineItem]):
+        os.makedirs(self.target_dir, exist_ok=True)
+        path = self._path(vendor, market)
+        # Write to a temporary file first so a crash never leaves a partial checkpoint behind
+        with open(f"{path}.tmp", "wb") as file:
+            records: list[dict] = [line_item.asdict() for line_item in line_items]
+            writer(file, get_avro_schema(LineItem), records, codec="deflate")
+        os.replace(f"{path}.tmp", path)
+        logger.info(
+            f"[{market}] Checkpointed {len(line_items)} line items for {vendor} to {path}"
+        )
+
+    def load(self, vendor: Vendor, market: Market) -> list[LineItem] | None:
+        try:
+            with open(self._path(vendor, market), "rb") as file:
+                records: list[dict] = []
+                for record in reader(file):
+                    record["line_option_codes"] = [
+                        LineItemOptionCode(**x) for x in record["line_option_codes"]
+                    ]
+                    records.append(
+                        filter_dataclass_attributes(record, dataclass=LineItem)
+                    )
+                return build_line_items(records)
+        except FileNotFoundError:
+            return None
+
+    def clear(self):
+        for path in glob.glob(f"{self.target_dir}/{self.filename}_*.avro*"):
+            os.remove(path)
+
+    def _path(self, vendor: Vendor, market: Market) -> str:
+        return f"{self.target_dir}/{self.filename}_{vendor}_{market}.avro"
@@ -1,6 +1,7 @@
 from fastavro import reader
 from loguru import logger
 
+from src.price_monitor.utils.adls import fetch_from_adls
 from src.price_monitor.utils.csv_helper import load_csv_for_difference_item_loader
 from src.price_monitor.utils.io import get_timestamp_from_dir_name
 
@@ -13,6 +14,7 @@ class DifferenceItemLoader:
 
     def load(self, date: str, difference_item_class) -> list:
         target_dir = f"{self.output_dir}/{date}"
+        fetch_from_adls(date, self.differences_filename)
         output = []
 
         if self.file_type == "avro":
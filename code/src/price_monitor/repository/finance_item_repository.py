@@ -3,8 +3,10 @@ import os
 from fastavro import reader, writer
 from loguru import logger
 
+from src.price_monitor.model.batch_builder import build_finance_line_items
 from src.price_monitor.model.finance_line_item import FinanceLineItem
 from src.price_monitor.model.vendor import Market, Vendor
+from src.price_monitor.utils.adls import fetch_from_adls
 from src.price_monitor.utils.clock import (
     today_dashed_str_with_key,
     yesterday_dashed_str_with_key,
@@ -14,6 +16,10 @@ from src.price_monitor.utils.csv_helper import (  # load_csv_for_line_item_repos
     save_csv_for_finance_line_item_repository,
 )
 from src.price_monitor.utils.io import get_avro_schema, filter_dataclass_attributes
+from src.price_monitor.utils.metrics import (
+    counts_fallback_to_yesterday,
+    timed_repository,
+)
 
 
 class FileSystemFinanceLineItemRepository:
@@ -29,7 +35,10 @@ class FileSystemFinanceLineItemRepository:
         self.yesterday_finance_line_items: list[FinanceLineItem] = self.load(
             date=yesterday_dashed_str_with_key()
         )
+        # Snapshot saved for today by this repository, so later stages of a run don't read it back from disk
+        self.today_finance_line_items: list[FinanceLineItem] | None = None
 
+    @timed_repository("save")
     def save(
         self, line_items: list[FinanceLineItem], date: str = today_dashed_str_with_key()
     ):
@@ -48,6 +57,8 @@ class FileSystemFinanceLineItemRepository:
             save_csv_for_finance_line_item_repository(
                 filename=self.filename, target_dir=target_dir, line_items=line_items
             )
+        if date == today_dashed_str_with_key():
+            self.today_finance_line_items = line_items
 
     def _save_avro(self, target_dir: str, line_items: list[FinanceLineItem]):
         with open(f"{target_dir}/{self.filename}.avro", "wb") as file:
@@ -57,8 +68,10 @@ class FileSystemFinanceLineItemRepository:
                 record["term_of_agreement"] = int(record.get("term_of_agreement", 0))
             writer(file, get_avro_schema(FinanceLineItem), records, codec="deflate")
 
+    @timed_repository("load")
     def load(self, date: str) -> list[FinanceLineItem]:
         target_dir = f"{self.output_dir}/{date}"
+        fetch_from_adls(date, self.filename)
 
         if self.file_type == "avro":
             response = self._load_avro(target_dir=target_dir)
@@ -90,14 +103,10 @@ class FileSystemFinanceLineItemRepository:
         try:
             with open(f"{target_dir}/{self.filename}.avro", "rb") as file:
                 avro_reader = reader(file)
-                for record in avro_reader:
-                    response.append(
-                        FinanceLineItem(
-                            **filter_dataclass_attributes(
-                                record, dataclass=FinanceLineItem
-                            )
-                        )
-                    )
+                response = build_finance_line_items(
+                    filter_dataclass_attributes(record, dataclass=FinanceLineItem)
+                    for record in avro_reader
+                )
         except FileNotFoundError as e:
             logger.trace(f"No file found in {target_dir}", e)
 
@@ -120,11 +129,17 @@ class FileSystemFinanceLineItemRepository:
         updated_line_items = previously_scraper_line_items + new_line_items
         self.save(updated_line_items)
 
+    @counts_fallback_to_yesterday
     def load_market(
         self, date: str, market: Market, vendor: Vendor
     ) -> list[FinanceLineItem]:
         if date == yesterday_dashed_str_with_key():
             full_finance_list = self.yesterday_finance_line_items
+        elif (
+            date == today_dashed_str_with_key()
+            and self.today_finance_line_items is not None
+        ):
+            full_finance_list = self.today_finance_line_items
         else:
             full_finance_list: list[FinanceLineItem] = self.load(date=date)
         return list(
@@ -135,6 +150,7 @@ class FileSystemFinanceLineItemRepository:
             )
         )
 
+    @counts_fallback_to_yesterday
     def load_model_filter_by_model_range_description(
         self, date: str, market: str, vendor: Vendor, model_range_description: str
     ) -> list[FinanceLineItem]:
@@ -152,6 +168,7 @@ class FileSystemFinanceLineItemRepository:
             )
         )
 
+    @counts_fallback_to_yesterday
     def load_model_filter_by_line_code(
         self,
         date: str,
@@ -179,6 +196,7 @@ class FileSystemFinanceLineItemRepository:
             )
         )
 
+    @counts_fallback_to_yesterday
     def load_model_filter_by_series(
         self, date: str, market: str, vendor: Vendor, series: str
     ) -> list[FinanceLineItem]:
@@ -2,9 +2,11 @@ import os
 from fastavro import reader, writer
 from loguru import logger
 
+from src.price_monitor.model.batch_builder import build_line_items
 from src.price_monitor.model.line_item import LineItem
 from src.price_monitor.model.line_item_option_code import LineItemOptionCode
 from src.price_monitor.model.vendor import Market, Vendor
+from src.price_monitor.utils.adls import fetch_from_adls
 from src.price_monitor.utils.clock import (
     today_dashed_str_with_key,
     yesterday_dashed_str_with_key,
@@ -14,6 +16,10 @@ from src.price_monitor.utils.csv_helper import (
     load_csv_for_line_item_repository,
 )
 from src.price_monitor.utils.io import get_avro_schema, filter_dataclass_attributes
+from src.price_monitor.utils.metrics import (
+    counts_fallback_to_yesterday,
+    timed_repository,
+)
 
 
 class FileSystemLineItemRepository:
@@ -29,7 +35,10 @@ class FileSystemLineItemRepository:
         self.yesterday_line_items: list[LineItem] = self.load(
             date=yesterday_dashed_str_with_key()
         )
+        # Snapshot saved for today by this repository, so later stages of a run don't read it back from disk
+        self.today_line_items: list[LineItem] | None = None
 
+    @timed_repository("save")
     def save(self, line_items: list[LineItem], date: str = today_dashed_str_with_key()):
         target_dir = f"{self.output_dir}/{date}"
         os.makedirs(target_dir, exist_ok=True)
@@ -48,14 +57,18 @@ class FileSystemLineItemRepository:
             )
         if date == yesterday_dashed_str_with_key():
             self.yesterday_line_items = line_items
+        elif date == today_dashed_str_with_key():
+            self.today_line_items = line_items
 
     def _save_avro(self, target_dir: str, line_items: list[LineItem]):
         with open(f"{target_dir}/{self.filename}.avro", "wb") as file:
             records: list[dict] = [line_item.asdict() for line_item in line_items]
             writer(file, get_avro_schema(LineItem), records, codec="deflate")
 
+    @timed_repository("load")
     def load(self, date: str) -> list[LineItem]:
         target_dir = f"{self.output_dir}/{date}"
+        fetch_from_adls(date, self.filename)
 
         if self.file_type == "avro":
             response = self._load_avro(target_dir=target_dir)
@@ -87,23 +100,26 @@ class FileSystemLineItemRepository:
         try:
             with open(f"{target_dir}/{self.filename}.avro", "rb") as file:
                 avro_reader = reader(file)
+                records: list[dict] = []
                 for record in avro_reader:
                     record["line_option_codes"] = [
                         LineItemOptionCode(**x) for x in record["line_option_codes"]
                     ]
-                    response.append(
-                        LineItem(
-                            **filter_dataclass_attributes(record, dataclass=LineItem)
-                        )
+                    records.append(
+                        filter_dataclass_attributes(record, dataclass=LineItem)
                     )
+                response = build_line_items(records)
         except FileNotFoundError as e:
             logger.trace(f"No file found in {target_dir}", e)
 
         return response
 
+    @counts_fallback_to_yesterday
     def load_market(self, date: str, market: Market, vendor: Vendor) -> list[LineItem]:
         if date == yesterday_dashed_str_with_key():
             full_price_list = self.yesterday_line_items
+        elif date == today_dashed_str_with_key() and self.today_line_items is not None:
+            full_price_list = self.today_line_items
         else:
             full_price_list: list[LineItem] = self.load(date=date)
         return list(
@@ -114,6 +130,7 @@ class FileSystemLineItemRepository:
             )
         )
 
+    @counts_fallback_to_yesterday
     def load_model_filter_by_model_range_code(
         self, date: str, market: str, vendor: Vendor, series: str, model_range_code: str
     ) -> list[LineItem]:
@@ -131,6 +148,7 @@ class FileSystemLineItemRepository:
             )
         )
 
+    @counts_fallback_to_yesterday
     def load_model_filter_by_model_range_description(
         self, date: str, market: str, vendor: Vendor, model_range_description: str
     ) -> list[LineItem]:
@@ -148,6 +166,7 @@ class FileSystemLineItemRepository:
             )
         )
 
+    @counts_fallback_to_yesterday
     def load_model_filter_by_series(
         self, date: str, market: str, vendor: Vendor, series: str
     ) -> list[LineItem]:
@@ -180,6 +199,7 @@ class FileSystemLineItemRepository:
             return line_item_for_trim_line.line_option_codes
         return []
 
+    @counts_fallback_to_yesterday
     def load_line_item_for_trim_line(
         self,
         date: str,
@@ -206,6 +226,7 @@ class FileSystemLineItemRepository:
         if len(line_item_for_trim_line) > 0:
             return line_item_for_trim_line[0]
 
+    @counts_fallback_to_yesterday
     def load_model_filter_by_line_code(
         self, date: str, market: str, vendor: Vendor, line_code: str
     ) -> list[LineItem]:
@@ -222,6 +243,7 @@ class FileSystemLineItemRepository:
             )
         )
 
+    @counts_fallback_to_yesterday
     def load_model_filter_by_model_code(
         self, date: str, market: str, vendor: Vendor, model_code: str
     ) -> list[LineItem]:
@@ -238,6 +260,7 @@ class FileSystemLineItemRepository:
             )
         )
 
+    @counts_fallback_to_yesterday
     def load_model_filter_by_trim_line(
         self, date: str, market: str, vendor: Vendor, model_code: str, line_code: str
     ) -> list[LineItem]:
@@ -0,0 +1,46 @@
+import json
+import os
+
+from loguru import logger
+
+from src.price_monitor.model.vendor import Market, Vendor
+
+
+class FileSystemRequestFallbackRepository:
+    """
+    Persists the fallback requests that answered for each model range of a (vendor, market), so the next
+    run sends them first instead of going through the failing requests again.
+    Like the checkpoints, they live outside the dated output folder and are kept from one day to the next.
+    The scrapers save them on every run using them, the cron script deletes the files of the data directory
+    not modified for 3 days.
+    """
+
+    def __init__(self, config: dict):
+        output = config["output"]
+        self.target_dir = output.get(
+            "request_fallback_directory", f"{output['directory']}/request_fallbacks"
+        )
+
+    def load(self, vendor: Vendor, market: Market) -> dict[str, dict[str, dict]]:
+        try:
+            with open(self._path(vendor, market), "r") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+        except json.JSONDecodeError as e:
+            logger.warning(
+                f"[{market}] Ignoring unreadable request fallbacks of {vendor}, {e}"
+            )
+            return {}
+
+    def save(
+        self, vendor: Vendor, market: Market, fallbacks: dict[str, dict[str, dict]]
+    ):
+        os.makedirs(self.target_dir, exist_ok=True)
+        path = self._path(vendor, market)
+        with open(f"{path}.tmp", "w") as file:
+            json.dump(fallbacks, file, indent=2, sort_keys=True)
+        os.replace(f"{path}.tmp", path)
+
+    def _path(self, vendor: Vendor, market: Market) -> str:
+        return f"{self.target_dir}/{vendor}_{market}.json"
@@ -1,12 +1,40 @@
+import hashlib
+import json
 import os
+import posixpath
+import threading
+from concurrent.futures import Future, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
 from loguru import logger
-from azure.identity import ClientSecretCredential
-from azure.storage.filedatalake import DataLakeServiceClient
+from strenum import StrEnum
 
 from src.price_monitor.utils.clock import (
     today_dashed_str_with_key,
     yesterday_dashed_str_with_key,
 )
+from src.price_monitor.utils.scheduler import get_scheduler
+
+# Content hash of every file of a date folder, kept next to the files in the Data Lake
+MANIFEST_FILENAME = "_manifest.json"
+PARTIAL_SUFFIX = ".part"
+CHUNK_SIZE = 4 * 1024 * 1024
+# A dataset is saved in one of these formats depending on the configured file type
+FILE_EXTENSIONS = ["avro", "csv"]
+
+
+class Dataset(StrEnum):
+    # Values are the keys of the dataset filenames in the output config
+    PRICES = "prices_filename"
+    FINANCE_OPTIONS = "finance_options_filename"
+    DIFFERENCES = "differences_filename"
+
+
+@dataclass(frozen=True)
+class DataRequirement:
+    dataset: Dataset
+    date: str
 
 
 if "DATABRICKS_RUNTIME_VERSION" in os.environ:
@@ -23,6 +51,9 @@ else:
 
 class AzureDataLakeStorage:
     def __init__(self, config):
+        # Files fetched during the run, so every file is requested from ADLS at most once
+        self._fetches: dict[tuple[str, str], Future] = {}
+        self._fetches_lock = threading.Lock()
         try:
             self.config = config
             self.initialize_secrets(config)
@@ -62,11 +93,16 @@ class AzureDataLakeStorage:
         )
 
     def authenticate_with_service_principal(self, tenant_id, client_id, key):
+        # The azure SDKs are imported when ADLS is used, so the commands running without it start faster
+        from azure.identity import ClientSecretCredential
+
         logger.info("Authenticating Service Principal Client Access...")
         self.credentials = ClientSecretCredential(tenant_id, client_id, key)
         logger.info("Authentication Successful !")
 
     def initialize_datalake_client(self, account_name):
+        from azure.storage.filedatalake import DataLakeServiceClient
+
         logger.info("Initializing datalake client object")
         account_url = f"https://{account_name}.dfs.core.windows.net"
         self.service_client = DataLakeServiceClient(
@@ -87,39 +123,11 @@ class AzureDataLakeStorage:
             logger.info(
                 f"Starting to download files from {adls_folder_path} to {local_folder_path}"
             )
-            file_system_client = self.service_client.get_file_system_client(
-                self.container_name
-            )
-            paths = file_system_client.get_paths(path=adls_folder_path)
-
-            [
-                self.process_path_to_download(
-                    path, local_folder_path, file_system_client
-                )
-                for path in paths
-            ]
-
-            logger.info("All Files Downloaded !")
+            report = self._sync_engine().download(adls_folder_path, local_folder_path)
+            logger.info(f"Downloaded files from ADLS: {report}")
         except Exception as e:
             logger.error(f"Unable to download files from ADLS. Due to {e}")
 
-    def process_path_to_download(self, path, local_folder_path, file_system_client):
-        if not path.is_directory:
-            logger.info(f"Downloading: {path.name} to {local_folder_path}")
-            file_name = path.name.replace(local_folder_path, "").lstrip("/")
-            local_file_path = os.path.join(local_folder_path, file_name)
-
-            # Create directories if they don't exist
-            os.makedirs(os.path.dirname(local_file_path), exist_ok=True)
-
-            # Download file
-            file_client = file_system_client.get_file_client(path.name)
-            with open(local_file_path, "wb") as local_file:
-                download = file_client.download_file()
-                local_file.write(download.readall())
-
-            logger.info(f"Downloaded: {path.name} to {local_file_path}")
-
     def upload_folder_to_adls(
         self, local_folder_path=None, adls_folder_path=today_dashed_str_with_key()
     ):
@@ -132,24 +140,291 @@ class AzureDataLakeStorage:
             logger.info(
                 f"Starting to upload files from {local_folder_path} to {adls_folder_path}"
             )
-            directory_client = self.service_client.get_directory_client(
-                self.container_name, adls_folder_path
-            )
-            for root, dirs, files in os.walk(local_folder_path):
-                [
-                    self.process_path_to_upload(
-                        directory_client, file_name, local_folder_path
-                    )
-                    for file_name in files
-                ]
-            logger.info("All Files Uploaded !")
+            report = self._sync_engine().upload(local_folder_path, adls_folder_path)
+            logger.info(f"Uploaded files to ADLS: {report}")
         except Exception as e:
             logger.error(f"Unable to upload files to ADLS. Due to {e}")
 
-    def process_path_to_upload(self, directory_client, file_name, local_folder_path):
-        local_file_path = local_folder_path + "/" + file_name
-        file_client = directory_client.create_file(file_name)
-        # Upload the file
+    def prefetch(self, requirements: list[DataRequirement]):
+        dates = sorted({requirement.date for requirement in requirements})
+        for date in dates:
+            self.fetch(
+                date,
+                [
+                    self.config["output"][requirement.dataset]
+                    for requirement in requirements
+                    if requirement.date == date
+                ],
+            )
+
+    def fetch(self, date: str, filenames: list[str]):
+        """
+        Downloads the given datasets of a date folder, unless already fetched during the run.
+        Local copies matching the manifest of the folder are kept, so a dataset is downloaded once across runs.
+        Today's folder is written by the run itself, so only its files missing locally are downloaded.
+        The files are downloaded on the calling thread, which runs no other task while it owns their fetch, so a
+        task loading the same files can block on the fetch in progress without ever waiting for its own thread.
+        """
+        names = [
+            f"{filename}.{extension}"
+            for filename in filenames
+            for extension in FILE_EXTENSIONS
+        ]
+        owned, pending = {}, []
+        with self._fetches_lock:
+            for name in names:
+                fetch = self._fetches.get((date, name))
+                if fetch is None:
+                    owned[name] = self._fetches[(date, name)] = Future()
+                else:
+                    pending.append(fetch)
+
+        if len(owned) > 0:
+            try:
+                self._fetch_names(date, list(owned))
+            finally:
+                for fetch in owned.values():
+                    fetch.set_result(None)
+        # Files fetched by another thread are waited for, so they are complete once loaded
+        wait(pending)
+
+    def _fetch_names(self, date: str, names: list[str]):
+        try:
+            adls_folder_path = self.initial_path + "/" + date
+            local_folder_path = os.path.join(self.config["output"]["directory"], date)
+            report = self._sync_engine().download(
+                adls_folder_path,
+                local_folder_path,
+                names=names,
+                missing_only=date == today_dashed_str_with_key(),
+                inline=True,
+            )
+            logger.info(f"Fetched {', '.join(names)} for {date} from ADLS: {report}")
+        except Exception as e:
+            logger.error(f"Unable to fetch files for {date} from ADLS. Due to {e}")
+
+    def _sync_engine(self) -> "AdlsSyncEngine":
+        return AdlsSyncEngine(
+            self.service_client.get_file_system_client(self.container_name)
+        )
+
+
+@dataclass
+class SyncReport:
+    transferred: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+    missing: list[str] = field(default_factory=list)
+
+    def __str__(self) -> str:
+        return (
+            f"{len(self.transferred)} transferred, {len(self.skipped)} unchanged, "
+            f"{len(self.failed)} failed, {len(self.missing)} missing"
+        )
+
+
+def file_hash(file_path: str, chunk_size: int = CHUNK_SIZE) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        while chunk := file.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class AdlsSyncEngine:
+    """
+    Syncs a date folder between the local output directory and a Data Lake file system.
+    Files are streamed in chunks and transferred concurrently on the shared task scheduler.
+    Every remote folder holds a manifest of the content hash of its files, so files whose content
+    didn't change are neither uploaded nor downloaded again.
+    Works with any client exposing the get_paths and get_file_client methods of a FileSystemClient.
+    """
+
+    def __init__(self, file_system_client, chunk_size: int = CHUNK_SIZE):
+        self.file_system_client = file_system_client
+        self.chunk_size = chunk_size
+
+    def download(
+        self,
+        remote_folder: str,
+        local_folder: str,
+        names: list[str] | None = None,
+        missing_only: bool = False,
+        inline: bool = False,
+    ) -> SyncReport:
+        """
+        Downloads the whole remote folder, or only the given files of it.
+        With missing_only, local files are kept even if they differ from the remote ones.
+        With inline, the files are downloaded one after the other on the calling thread rather than on the
+        scheduler, whose wait would run other queued tasks in the meantime.
+        """
+        from azure.core.exceptions import ResourceNotFoundError
+
+        if names is None:
+            try:
+                names = [
+                    posixpath.relpath(path.name, remote_folder)
+                    for path in self.file_system_client.get_paths(path=remote_folder)
+                    if not path.is_directory
+                ]
+            except ResourceNotFoundError:
+                logger.warning(f"Nothing to download, {remote_folder} does not exist")
+                return SyncReport()
+        names = [name for name in names if name != MANIFEST_FILENAME]
+        manifest = self._load_manifest(remote_folder)
+
+        def download_file(name: str) -> bool | None:
+            return self._download_file(
+                remote_folder, local_folder, name, manifest.get(name), missing_only
+            )
+
+        if inline:
+            return self._report(
+                names, [_run_inline(download_file, name) for name in names]
+            )
+        scheduler = get_scheduler()
+        return self._report(names, scheduler.wait(scheduler.map(download_file, names)))
+
+    def upload(self, local_folder: str, remote_folder: str) -> SyncReport:
+        names = sorted(
+            os.path.relpath(os.path.join(root, file_name), local_folder).replace(
+                os.sep, "/"
+            )
+            for root, _, files in os.walk(local_folder)
+            for file_name in files
+            if file_name != MANIFEST_FILENAME and not file_name.endswith(PARTIAL_SUFFIX)
+        )
+        manifest = self._load_manifest(remote_folder)
+
+        scheduler = get_scheduler()
+        futures = scheduler.map(
+            lambda name: self._upload_file(
+                local_folder, remote_folder, name, manifest.get(name)
+            ),
+            names,
+        )
+        futures = scheduler.wait(futures)
+        # Failed files keep their previous hash, so they are uploaded again by the next sync
+        for name, future in zip(names, futures):
+            if future.exception() is None:
+                manifest[name] = future.result()[0]
+        report = self._report(names, futures, lambda result: result[1])
+        if len(report.transferred) > 0:
+            self._save_manifest(remote_folder, manifest)
+        return report
+
+    def _download_file(
+        self,
+        remote_folder: str,
+        local_folder: str,
+        name: str,
+        remote_hash: str | None,
+        missing_only: bool = False,
+    ) -> bool | None:
+        from azure.core.exceptions import ResourceNotFoundError
+
+        local_file_path = os.path.join(local_folder, *name.split("/"))
+        if missing_only and os.path.isfile(local_file_path):
+            return False
+        if (
+            remote_hash is not None
+            and os.path.isfile(local_file_path)
+            and file_hash(local_file_path, self.chunk_size) == remote_hash
+        ):
+            return False
+
+        file_client = self.file_system_client.get_file_client(f"{remote_folder}/{name}")
+        try:
+            download = file_client.download_file()
+        except ResourceNotFoundError:
+            return None
+
+        os.makedirs(os.path.dirname(local_file_path), exist_ok=True)
+        # Written aside and moved in place, so an interrupted download never leaves a truncated file
+        partial_file_path = local_file_path + PARTIAL_SUFFIX
+        with open(partial_file_path, "wb") as local_file:
+            for chunk in download.chunks():
+                local_file.write(chunk)
+        os.replace(partial_file_path, local_file_path)
+        logger.info(f"Downloaded: {name} to {local_file_path}")
+        return True
+
+    def _upload_file(
+        self, local_folder: str, remote_folder: str, name: str, remote_hash: str | None
+    ) -> tuple[str, bool]:
+        local_file_path = os.path.join(local_folder, *name.split("/"))
+        local_hash = file_hash(local_file_path, self.chunk_size)
+        if local_hash == remote_hash:
+            return local_hash, False
+
+        file_client = self.file_system_client.get_file_client(f"{remote_folder}/{name}")
         with open(local_file_path, "rb") as data:
-            file_client.upload_data(data, overwrite=True)
-        logger.info(f"File {file_name} uploaded to ADLS Gen2.")
+            file_client.upload_data(
+                data,
+                length=os.path.getsize(local_file_path),
+                overwrite=True,
+                chunk_size=self.chunk_size,
+            )
+        logger.info(f"File {name} uploaded to ADLS Gen2.")
+        return local_hash, True
+
+    def _load_manifest(self, remote_folder: str) -> dict[str, str]:
+        from azure.core.exceptions import ResourceNotFoundError
+
+        file_client = self.file_system_client.get_file_client(
+            f"{remote_folder}/{MANIFEST_FILENAME}"
+        )
+        try:
+            return json.loads(b"".join(file_client.download_file().chunks()))
+        except ResourceNotFoundError:
+            return {}
+
+    def _save_manifest(self, remote_folder: str, manifest: dict[str, str]):
+        file_client = self.file_system_client.get_file_client(
+            f"{remote_folder}/{MANIFEST_FILENAME}"
+        )
+        file_client.upload_data(
+            json.dumps(manifest, indent=2, sort_keys=True), overwrite=True
+        )
+
+    @staticmethod
+    def _report(
+        names: list[str],
+        futures: list[Future],
+        is_transferred: Callable[[Any], bool] = bool,
+    ) -> SyncReport:
+        report = SyncReport()
+        for name, future in zip(names, futures):
+            if future.exception() is not None:
+                logger.error(f"Unable to sync {name}. Due to {future.exception()}")
+                report.failed.append(name)
+            elif future.result() is None:
+                report.missing.append(name)
+            elif is_transferred(future.result()):
+                report.transferred.append(name)
+            else:
+                report.skipped.append(name)
+        return report
+
+
+def _run_inline(fn: Callable, *args) -> Future:
+    future = Future()
+    try:
+        future.set_result(fn(*args))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+
+_adls: AzureDataLakeStorage | None = None
+
+
+def register_lazy_fetch(adls: AzureDataLakeStorage | None):
+    """Lets the repositories fetch from ADLS the datasets not prefetched by the command."""
+    global _adls
+    _adls = adls
+
+
+def fetch_from_adls(date: str, filename: str):
+    if _adls is not None:
+        _adls.fetch(date, [filename])
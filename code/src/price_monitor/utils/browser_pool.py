@@ -0,0 +1,96 @@
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+from loguru import logger
+
+from src.price_monitor.price_scraper.constants import USER_AGENT
+
+DEFAULT_BROWSER_WORKERS = 2
+
+
+def create_browser():
+    # Selenium is imported by the commands launching a browser only
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service as ChromeService
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    chrome_options = Options()
+    chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument(f"user-agent={USER_AGENT}")
+    driver = webdriver.Chrome(
+        options=chrome_options, service=ChromeService(ChromeDriverManager().install())
+    )
+    driver.maximize_window()
+    return driver
+
+
+class BrowserPool:
+    """
+    Headless Chrome sessions shared by the scrapers driving the vendor sites, so a browser is launched once
+    per run and slot instead of once per page.
+    At most max_workers sessions are open, a scheduler worker borrowing one waits for a free slot.
+    A session that failed is quit and replaced on the next borrow, its page may be in any state.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_BROWSER_WORKERS,
+        create: Callable = create_browser,
+    ):
+        if max_workers < 1:
+            raise ValueError("browser_workers must be at least 1")
+        self.max_workers = max_workers
+        self._create = create
+        self._slots = threading.BoundedSemaphore(max_workers)
+        self._idle: list = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def browser(self) -> Iterator:
+        with self._slots:
+            with self._lock:
+                driver = self._idle.pop() if len(self._idle) > 0 else None
+            if driver is None:
+                driver = self._create()
+            try:
+                yield driver
+            except BaseException:
+                _quit(driver)
+                raise
+            with self._lock:
+                self._idle.append(driver)
+
+    def shutdown(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        if len(idle) > 0:
+            logger.info(f"Closing {len(idle)} browser sessions")
+        for driver in idle:
+            _quit(driver)
+
+
+def _quit(driver):
+    try:
+        driver.quit()
+    except Exception as e:
+        logger.debug("Unable to quit browser session: {}", e)
+
+
+_browser_pool = BrowserPool()
+
+
+def init_browser_pool(config: dict) -> BrowserPool:
+    global _browser_pool
+    _browser_pool.shutdown()
+    _browser_pool = BrowserPool(
+        config.get("scheduler", {}).get("browser_workers", DEFAULT_BROWSER_WORKERS)
+    )
+    return _browser_pool
+
+
+def get_browser_pool() -> BrowserPool:
+    return _browser_pool
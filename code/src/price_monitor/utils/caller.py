@@ -8,9 +8,11 @@ from src.price_monitor.price_scraper.constants import (
     REQUEST_TIMEOUT_SECONDS,
     USER_AGENT,
 )
+from src.price_monitor.utils.http_recorder import get_recorder
+from src.price_monitor.utils.metrics import retry_recorder, track_request
 
 
-@retry(tries=3, delay=1, backoff=2)
+@retry(tries=3, delay=1, backoff=2, logger=retry_recorder)
 def execute_request(
     method: str,
     url: str,
@@ -21,24 +23,50 @@ def execute_request(
     delay=DELAY_REQUEST_SECONDS,
     timeout=REQUEST_TIMEOUT_SECONDS,
 ):
-    """Calls the request with the appropriate headers and stuff"""
+    """Calls the request with the appropriate headers and stuff, retrying it with a backoff when it fails"""
+    return execute_request_once(
+        method, url, session, headers, body, response_format, delay, timeout
+    )
+
+
+def execute_request_once(
+    method: str,
+    url: str,
+    session=None,
+    headers=dict(),
+    body=None,
+    response_format="json",
+    delay=DELAY_REQUEST_SECONDS,
+    timeout=REQUEST_TIMEOUT_SECONDS,
+):
+    """Calls the request a single time, for requests having a fallback of their own when they fail"""
 
     if session is None:
         session = requests.Session()
 
     headers["user-agent"] = USER_AGENT
-    time.sleep(delay)
-
-    if method == "get":
-        response = session.get(url, params=body, headers=headers, timeout=timeout)
-    elif method == "post":
-        response = session.post(url, headers=headers, json=body, timeout=timeout)
-    elif method == "put":
-        response = session.put(url, headers=headers, data=body, timeout=timeout)
-    elif method == "delete":
-        response = session.delete(url, headers=headers)
-
-    response.raise_for_status()
+    recorder = get_recorder()
+    # Replayed responses wait for the latency of the recorder instead of the vendor site
+    if not recorder.replaying:
+        time.sleep(delay)
+
+    with track_request("http", url) as attempt:
+        if recorder.replaying:
+            response = recorder.replay_response(method, url, body)
+        elif method == "get":
+            response = session.get(url, params=body, headers=headers, timeout=timeout)
+        elif method == "post":
+            response = session.post(url, headers=headers, json=body, timeout=timeout)
+        elif method == "put":
+            response = session.put(url, headers=headers, data=body, timeout=timeout)
+        elif method == "delete":
+            response = session.delete(url, headers=headers)
+
+        response.raise_for_status()
+        attempt.record_body(response.content)
+
+    if recorder.recording:
+        recorder.record("http", method, url, body, response.text)
 
     if response_format == "json":
         return response.json()
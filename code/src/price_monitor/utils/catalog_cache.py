@@ -0,0 +1,99 @@
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Callable, TypeVar
+
+from loguru import logger
+from strenum import StrEnum
+
+from src.price_monitor.model.vendor import Market, Vendor
+
+T = TypeVar("T")
+
+
+class CatalogKind(StrEnum):
+    MODEL_LIST = "model_list"
+    MODEL_LEXICON = "model_lexicon"
+    MODEL_MATRIX = "model_matrix"
+    CONFIGURATION_STATE = "configuration_state"
+    API_TOKEN = "api_token"
+    METALLIC_PAINTS = "metallic_paints"
+    LOWEST_PRICE_METALLIC_PAINT = "lowest_price_metallic_paint"
+    FINANCE_PRODUCTS = "finance_products"
+    FINANCE_PRODUCT_DETAILS = "finance_product_details"
+
+
+# Kind of document, vendor, market and the model (or request) it describes
+CatalogKey = tuple[CatalogKind, Vendor, Market | None, str]
+
+
+class CatalogCache:
+    """
+    Run scoped store of the catalog documents fetched by the scrapers, so the finance scrapers reuse the
+    model lexicons, model matrices and configuration states already fetched by the price scrapers.
+    Entries are shared between scrapers and must be treated as read only.
+    """
+
+    def __init__(self):
+        self._entries: dict[CatalogKey, Future] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_fetch(self, key: CatalogKey, fetch: Callable[[], T]) -> T:
+        with self._lock:
+            entry = self._entries.get(key)
+            is_owner = entry is None
+            if is_owner:
+                entry = Future()
+                self._entries[key] = entry
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        # Concurrent requests of the same document wait for the first one instead of fetching it again
+        if not is_owner:
+            return entry.result()
+
+        try:
+            value = fetch()
+        except BaseException as e:
+            # Failures are not cached, the next scraper tries again
+            with self._lock:
+                del self._entries[key]
+            entry.set_exception(e)
+            raise
+        entry.set_result(value)
+        return value
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_catalog_cache: CatalogCache | None = None
+
+
+@contextmanager
+def catalog_cache_scope():
+    """Shares one catalog cache between all the scrapers run within the scope."""
+    global _catalog_cache
+    _catalog_cache = CatalogCache()
+    try:
+        yield _catalog_cache
+    finally:
+        logger.info(
+            f"Catalog cache served {_catalog_cache.hits} documents from {_catalog_cache.misses} fetched"
+        )
+        _catalog_cache = None
+
+
+def fetch_catalog(
+    kind: CatalogKind,
+    vendor: Vendor,
+    market: Market | None,
+    key: str,
+    fetch: Callable[[], T],
+) -> T:
+    if _catalog_cache is None:
+        return fetch()
+    return _catalog_cache.get_or_fetch((kind, vendor, market, key), fetch)
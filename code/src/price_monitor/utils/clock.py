@@ -1,3 +1,6 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 
 
@@ -23,3 +26,34 @@ def yesterday_timestamp_dashed_str_with_timezone():
 
 def yesterday_dashed_str_with_key():
     return f"date={yesterday_dashed_str()}"
+
+
+@dataclass(frozen=True)
+class ClockSnapshot:
+    timestamp: str
+    today: str
+
+
+_batch_clock: ContextVar[ClockSnapshot | None] = ContextVar("batch_clock", default=None)
+
+
+def take_clock_snapshot() -> ClockSnapshot:
+    return ClockSnapshot(
+        timestamp=current_timestamp_dashed_str_with_timezone(),
+        today=today_dashed_str(),
+    )
+
+
+def current_batch_clock() -> ClockSnapshot | None:
+    return _batch_clock.get()
+
+
+@contextmanager
+def batch_clock(clock: ClockSnapshot | None = None):
+    # Items built inside this context share one clock snapshot instead of reading the clock each
+    clock = clock or take_clock_snapshot()
+    token = _batch_clock.set(clock)
+    try:
+        yield clock
+    finally:
+        _batch_clock.reset(token)
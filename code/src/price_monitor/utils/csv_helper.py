@@ -5,6 +5,10 @@ import json
 
 from loguru import logger
 
+from src.price_monitor.model.batch_builder import (
+    build_finance_line_items,
+    build_line_items,
+)
 from src.price_monitor.model.finance_line_item import FinanceLineItem
 from src.price_monitor.model.line_item import LineItem
 from src.price_monitor.model.line_item_option_code import LineItemOptionCode
@@ -39,6 +43,7 @@ def save_csv_for_finance_line_item_repository(
 
 def load_csv_for_line_item_repository(filename: str, target_dir: str) -> list[LineItem]:
     response: list[LineItem] = []
+    records: list[dict] = []
     try:
         with open(f"{target_dir}/{filename}.csv", "r", encoding="utf-8") as file:
             for row in csv.DictReader(file):
@@ -53,9 +58,8 @@ def load_csv_for_line_item_repository(filename: str, target_dir: str) -> list[Li
                 row["gross_list_price"] = float(row["gross_list_price"])
                 row["recorded_at"] = get_timestamp_from_dir_name(target_dir)
 
-                response.append(
-                    LineItem(**filter_dataclass_attributes(row, dataclass=LineItem))
-                )
+                records.append(filter_dataclass_attributes(row, dataclass=LineItem))
+        response = build_line_items(records)
     except FileNotFoundError as e:
         logger.trace(f"No file found in {target_dir}", e)
 
@@ -66,6 +70,7 @@ def load_csv_for_finance_line_item_repository(
     filename: str, target_dir: str
 ) -> list[FinanceLineItem]:
     response: list[FinanceLineItem] = []
+    records: list[dict] = []
     try:
         with open(f"{target_dir}/{filename}.csv", "r", encoding="utf-8") as file:
             for row in csv.DictReader(file):
@@ -76,11 +81,10 @@ def load_csv_for_finance_line_item_repository(
                     row["number_of_installments"] = 0
                 else:
                     row["number_of_installments"] = int(row["number_of_installments"])
-                response.append(
-                    FinanceLineItem(
-                        **filter_dataclass_attributes(row, dataclass=FinanceLineItem)
-                    )
+                records.append(
+                    filter_dataclass_attributes(row, dataclass=FinanceLineItem)
                 )
+        response = build_finance_line_items(records)
     except FileNotFoundError as e:
         logger.trace(f"No file found in {target_dir}", e)
 
@@ -0,0 +1,163 @@
+import functools
+import json
+import os
+import threading
+import time
+from enum import StrEnum
+
+import requests
+from loguru import logger
+
+from src.price_monitor.utils.metrics import track_request
+from src.price_monitor.utils.scheduler import current_market, current_vendor
+
+UNSCOPED = "unscoped"
+
+
+class RecorderMode(StrEnum):
+    OFF = "off"
+    RECORD = "record"
+    REPLAY = "replay"
+
+
+class CassetteMissError(requests.RequestException):
+    """Raised when a replayed request was never recorded."""
+
+
+class HttpRecorder:
+    """
+    Records the responses of the vendor requests into cassettes, one file per vendor and market,
+    and serves them back offline with a fixed latency instead of calling the vendor sites.
+    Requests are matched by kind, method, url and body, whichever scraper task replays them.
+    """
+
+    def __init__(
+        self,
+        mode: RecorderMode = RecorderMode.OFF,
+        directory: str | None = None,
+        latency_seconds: float = 0.0,
+    ):
+        self.mode = mode
+        self.directory = directory
+        self.latency_seconds = latency_seconds
+        self._cassettes: dict[tuple[str, str], dict[str, dict]] = {}
+        self._replayed: dict[str, dict] | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == RecorderMode.RECORD
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == RecorderMode.REPLAY
+
+    def record(self, kind: str, method: str, url: str, body, content):
+        scope = (
+            str(current_vendor() or UNSCOPED),
+            str(current_market() or UNSCOPED),
+        )
+        with self._lock:
+            self._cassettes.setdefault(scope, {})[_key(kind, method, url, body)] = {
+                "kind": kind,
+                "method": method,
+                "url": url,
+                "body": body,
+                "content": content,
+            }
+
+    def replay(self, kind: str, method: str, url: str, body=None):
+        with self._lock:
+            if self._replayed is None:
+                self._replayed = self._load_cassettes()
+        entry = self._replayed.get(_key(kind, method, url, body))
+        if entry is None:
+            raise CassetteMissError(f"No recorded response for {method} {url}")
+        time.sleep(self.latency_seconds)
+        return entry["content"]
+
+    def replay_response(self, method: str, url: str, body=None) -> requests.Response:
+        response = requests.Response()
+        response._content = self.replay("http", method, url, body).encode()
+        response.encoding = "utf-8"
+        response.status_code = 200
+        response.url = url
+        return response
+
+    def save(self):
+        if not self.recording:
+            return
+        with self._lock:
+            cassettes = {
+                scope: dict(entries) for scope, entries in self._cassettes.items()
+            }
+        for (vendor, market), entries in cassettes.items():
+            os.makedirs(os.path.join(self.directory, vendor), exist_ok=True)
+            with open(
+                os.path.join(self.directory, vendor, f"{market}.json"), "w"
+            ) as file:
+                json.dump(list(entries.values()), file, indent=1)
+        logger.info(
+            f"Recorded {sum(len(entries) for entries in cassettes.values())} responses to {self.directory}"
+        )
+
+    def _load_cassettes(self) -> dict[str, dict]:
+        entries = {}
+        for root, _, file_names in os.walk(self.directory):
+            for file_name in sorted(file_names):
+                if file_name.endswith(".json"):
+                    with open(os.path.join(root, file_name)) as file:
+                        for entry in json.load(file):
+                            key = _key(
+                                entry["kind"],
+                                entry["method"],
+                                entry["url"],
+                                entry["body"],
+                            )
+                            entries[key] = entry
+        logger.info(f"Replaying {len(entries)} responses from {self.directory}")
+        return entries
+
+
+def _key(kind: str, method: str, url: str, body) -> str:
+    return json.dumps([kind, method, url, body], sort_keys=True, default=str)
+
+
+_recorder = HttpRecorder()
+
+
+def init_recorder(config: dict) -> HttpRecorder:
+    global _recorder
+    recorder_config = config.get("recorder", {})
+    _recorder = HttpRecorder(
+        mode=RecorderMode(recorder_config.get("mode", RecorderMode.OFF)),
+        directory=recorder_config.get("directory", "cassettes/"),
+        latency_seconds=recorder_config.get("latency_seconds", 0.0),
+    )
+    return _recorder
+
+
+def get_recorder() -> HttpRecorder:
+    return _recorder
+
+
+def replayable(kind: str):
+    """
+    Records or replays the result of a browser session driven by a function of the page url.
+    The result must be json serializable, the session itself is skipped when replaying.
+    """
+
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(url: str):
+            if _recorder.replaying:
+                with track_request(kind, url):
+                    return _recorder.replay(kind, function.__name__, url)
+            result = function(url)
+            if _recorder.recording:
+                _recorder.record(kind, function.__name__, url, None, result)
+            return result
+
+        return wrapper
+
+    return decorator
@@ -1,15 +1,19 @@
 import os
+from collections import Counter
 
-import google.cloud.logging
-from google.cloud.logging_v2.handlers import CloudLoggingHandler
 from loguru import logger
 
 from src.price_monitor.utils.clock import today_dashed_str
 
 log_level = os.getenv("LOGURU_LEVEL", "INFO")
+DEFAULT_SAMPLE_LIMIT = 10
 
 
 def init_gcp_logging():
+    # Imported on first use, the google cloud client slows down the start of every command
+    import google.cloud.logging
+    from google.cloud.logging_v2.handlers import CloudLoggingHandler
+
     client = google.cloud.logging.Client()
     handler = CloudLoggingHandler(client)
     logger.add(handler, level=log_level)
@@ -28,3 +32,34 @@ def init_logging_handler(config):
             format="{time} {level} {name}:{function}:{line} - {message}",
             level=log_level,
         )
+
+
+class SampledLog:
+    """
+    Logs the first messages of every template and only counts the others, for the warnings raised per row or per option.
+    Messages are formatted from the template and its arguments only when they are logged, and are logged from the
+    call site of the sampled log, so the log format still shows which check raised them.
+    """
+
+    def __init__(
+        self, log=logger, level: str = "WARNING", limit: int = DEFAULT_SAMPLE_LIMIT
+    ):
+        self.log = log
+        self.level = level
+        self.limit = limit
+        self.counts: Counter[str] = Counter()
+
+    def __call__(self, template: str, *args):
+        self.counts[template] += 1
+        if self.counts[template] <= self.limit:
+            self.log.opt(depth=1).log(self.level, template.format(*args))
+
+    def summarize(self, prefix: str = ""):
+        """Logs how many messages of every template were not logged, then starts counting again."""
+        for template, count in self.counts.items():
+            if count > self.limit:
+                self.log.opt(depth=1).log(
+                    self.level,
+                    f"{prefix}{count - self.limit} more messages not logged like: {template}",
+                )
+        self.counts.clear()
@@ -0,0 +1,311 @@
+import bisect
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from urllib.parse import urlsplit
+
+from loguru import logger
+
+from src.price_monitor.utils.clock import (
+    today_dashed_str,
+    yesterday_dashed_str_with_key,
+)
+from src.price_monitor.utils.scheduler import current_market, current_vendor
+
+METRICS_DIRECTORY = "metrics"
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+REQUEST_DURATION = "price_monitor_request_duration_seconds"
+REQUEST_BYTES = "price_monitor_request_bytes_total"
+REQUESTS = "price_monitor_requests_total"
+REQUEST_RETRIES = "price_monitor_request_retries_total"
+FALLBACKS_TO_YESTERDAY = "price_monitor_fallbacks_to_yesterday_total"
+REPOSITORY_DURATION = "price_monitor_repository_duration_seconds"
+REPOSITORY_ITEMS = "price_monitor_repository_items_total"
+
+DESCRIPTIONS = {
+    REQUEST_DURATION: "Duration of every request attempt",
+    REQUEST_BYTES: "Bytes received by the request attempts",
+    REQUESTS: "Request attempts by outcome",
+    REQUEST_RETRIES: "Request attempts failed and retried",
+    FALLBACKS_TO_YESTERDAY: "Scrapes replaced by the data of yesterday",
+    REPOSITORY_DURATION: "Duration of the repository loads and saves",
+    REPOSITORY_ITEMS: "Items loaded and saved by the repositories",
+}
+
+Labels = tuple[tuple[str, str], ...]
+
+
+class Histogram:
+    __slots__ = ("bucket_counts", "count", "sum")
+
+    def __init__(self):
+        self.bucket_counts = [0] * len(LATENCY_BUCKETS)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        index = bisect.bisect_left(LATENCY_BUCKETS, value)
+        if index < len(LATENCY_BUCKETS):
+            self.bucket_counts[index] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative_buckets(self) -> list[tuple[str, int]]:
+        buckets, total = [], 0
+        for bound, bucket_count in zip(LATENCY_BUCKETS, self.bucket_counts):
+            total += bucket_count
+            buckets.append((str(bound), total))
+        buckets.append(("+Inf", self.count))
+        return buckets
+
+
+class MetricsRegistry:
+    """Histograms and counters recorded during a command, keyed by metric name and labels."""
+
+    def __init__(self, output_dir: str | None = None):
+        self.output_dir = output_dir
+        self.started_at = datetime.now()
+        self.histograms: dict[str, dict[Labels, Histogram]] = {}
+        self.counters: dict[str, dict[Labels, float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, value: float, **labels):
+        key = _labels(labels)
+        with self._lock:
+            series = self.histograms.setdefault(name, {})
+            if key not in series:
+                series[key] = Histogram()
+            series[key].observe(value)
+
+    def increment(self, name: str, value: float = 1, **labels):
+        key = _labels(labels)
+        with self._lock:
+            series = self.counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def to_prometheus(self) -> str:
+        lines = []
+        with self._lock:
+            for name, series in sorted(self.histograms.items()):
+                lines += [
+                    f"# HELP {name} {DESCRIPTIONS.get(name, name)}",
+                    f"# TYPE {name} histogram",
+                ]
+                for labels, histogram in sorted(series.items()):
+                    for bound, total in histogram.cumulative_buckets():
+                        lines.append(
+                            f"{name}_bucket{_format(labels + (('le', bound),))} {total}"
+                        )
+                    lines.append(f"{name}_sum{_format(labels)} {histogram.sum}")
+                    lines.append(f"{name}_count{_format(labels)} {histogram.count}")
+            for name, series in sorted(self.counters.items()):
+                lines += [
+                    f"# HELP {name} {DESCRIPTIONS.get(name, name)}",
+                    f"# TYPE {name} counter",
+                ]
+                for labels, value in sorted(series.items()):
+                    lines.append(f"{name}{_format(labels)} {value}")
+        return "\n".join(lines) + "\n"
+
+    def to_report(self, command: str) -> dict:
+        finished_at = datetime.now()
+        with self._lock:
+            return {
+                "command": command,
+                "started_at": self.started_at.isoformat(),
+                "finished_at": finished_at.isoformat(),
+                "duration_seconds": (finished_at - self.started_at).total_seconds(),
+                "histograms": [
+                    {
+                        "name": name,
+                        "labels": dict(labels),
+                        "count": histogram.count,
+                        "sum": histogram.sum,
+                        "buckets": dict(histogram.cumulative_buckets()),
+                    }
+                    for name, series in sorted(self.histograms.items())
+                    for labels, histogram in sorted(series.items())
+                ],
+                "counters": [
+                    {"name": name, "labels": dict(labels), "value": value}
+                    for name, series in sorted(self.counters.items())
+                    for labels, value in sorted(series.items())
+                ],
+            }
+
+
+def _labels(labels: dict) -> Labels:
+    return tuple(
+        (key, "" if value is None else str(value)) for key, value in labels.items()
+    )
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format(labels: Labels) -> str:
+    if len(labels) == 0:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+
+_registry = MetricsRegistry()
+
+
+def init_metrics(config: dict) -> MetricsRegistry:
+    global _registry
+    _registry = MetricsRegistry(config["output"]["directory"])
+    return _registry
+
+
+def get_metrics() -> MetricsRegistry:
+    return _registry
+
+
+def endpoint_template(url: str) -> str:
+    """Host and path of an url, with the path segments holding ids, codes or tokens replaced by {id}."""
+    parts = urlsplit(url)
+    segments = [
+        (
+            "{id}"
+            if any(char.isdigit() for char in segment) or len(segment) > 32
+            else segment
+        )
+        for segment in parts.path.split("/")
+    ]
+    return parts.netloc + "/".join(segments)
+
+
+class RequestAttempt:
+    def __init__(self, kind: str, url: str):
+        self.labels = {
+            "kind": kind,
+            "vendor": current_vendor(),
+            "market": current_market(),
+            "endpoint": endpoint_template(url),
+        }
+        self.bytes = 0
+
+    def record_body(self, body: bytes | str):
+        # Pages rendered by the browser are text, the responses of the requests are bytes
+        if isinstance(body, str):
+            body = body.encode()
+        if isinstance(body, bytes):
+            self.bytes = len(body)
+
+
+_last_failed_attempt = threading.local()
+
+
+@contextmanager
+def track_request(kind: str, url: str):
+    """Records the duration, size and outcome of one request attempt."""
+    attempt = RequestAttempt(kind, url)
+    start = time.perf_counter()
+    try:
+        yield attempt
+    except Exception:
+        _registry.increment(REQUESTS, outcome="error", **attempt.labels)
+        _last_failed_attempt.labels = attempt.labels
+        raise
+    finally:
+        _registry.observe(
+            REQUEST_DURATION, time.perf_counter() - start, **attempt.labels
+        )
+    _registry.increment(REQUESTS, outcome="ok", **attempt.labels)
+    _registry.increment(REQUEST_BYTES, attempt.bytes, **attempt.labels)
+
+
+class RetryRecorder:
+    """
+    Logger given to the retry decorator, it's only called when a failed attempt is retried.
+    Counts the retry against the labels of the attempt that failed on the same thread.
+    """
+
+    def warning(self, message: str, *args):
+        labels = getattr(_last_failed_attempt, "labels", {})
+        _registry.increment(REQUEST_RETRIES, **labels)
+        logger.warning(message % args)
+
+
+retry_recorder = RetryRecorder()
+
+
+def timed_repository(operation: str):
+    """Records the duration of a repository load or save, and the number of items it loaded or saved."""
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            start = time.perf_counter()
+            result = method(self, *args, **kwargs)
+            labels = {"operation": operation, "dataset": self.filename}
+            _registry.observe(
+                REPOSITORY_DURATION, time.perf_counter() - start, **labels
+            )
+            items = result if operation == "load" else (args[0] if args else [])
+            _registry.increment(REPOSITORY_ITEMS, len(items), **labels)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def counts_fallback_to_yesterday(method):
+    """
+    Counts the loads of yesterday's data made by the scrapers, which only happen when a scrape failed.
+    Loads made outside of a scraper task, by the comparators or the data quality checks, are not counted.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        arguments = signature.bind(self, *args, **kwargs).arguments
+        if (
+            arguments["date"] == yesterday_dashed_str_with_key()
+            and current_vendor() is not None
+        ):
+            _registry.increment(
+                FALLBACKS_TO_YESTERDAY,
+                vendor=arguments.get("vendor"),
+                market=arguments.get("market"),
+                dataset=self.filename,
+            )
+        return result
+
+    return wrapper
+
+
+def write_reports(command: str):
+    """
+    Writes the metrics of the command as a Prometheus textfile and a JSON run report into the output directory.
+    The textfile is replaced by every run of the command, the run reports are kept per day.
+    """
+    if _registry.output_dir is None:
+        return
+    metrics_dir = os.path.join(_registry.output_dir, METRICS_DIRECTORY)
+    os.makedirs(metrics_dir, exist_ok=True)
+    _write_atomically(
+        os.path.join(metrics_dir, f"{command}.prom"), _registry.to_prometheus()
+    )
+    _write_atomically(
+        os.path.join(metrics_dir, f"{command}-{today_dashed_str()}.json"),
+        json.dumps(_registry.to_report(command), indent=2),
+    )
+    logger.info(f"Wrote metrics of {command} to {metrics_dir}")
+
+
+def _write_atomically(file_path: str, content: str):
+    # The textfile collector may read the file at any time, it must never see it half written
+    with open(f"{file_path}.tmp", "w") as file:
+        file.write(content)
+    os.replace(f"{file_path}.tmp", file_path)
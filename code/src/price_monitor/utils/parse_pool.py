@@ -0,0 +1,84 @@
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, TypeVar
+
+from loguru import logger
+
+from src.price_monitor.utils.logger import init_logging_handler
+
+T = TypeVar("T")
+
+DEFAULT_PARSE_WORKERS = 0
+
+
+class ParsePool:
+    """
+    Pool of processes the scheduler workers hand the raw vendor pages to, so the CPU bound parsing of large pages
+    runs on every core instead of holding the GIL the fetching threads need.
+    The parsers must be module level functions, or methods of picklable objects, of picklable payloads.
+    Without workers the parsing runs inline on the calling thread.
+    The processes log to the sinks of the given config, as the calling process does.
+    """
+
+    def __init__(
+        self, max_workers: int = DEFAULT_PARSE_WORKERS, config: dict | None = None
+    ):
+        if max_workers < 0:
+            raise ValueError("parse_workers must not be negative")
+        self.max_workers = max_workers
+        self.config = config
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def parse(self, parser: Callable[..., T], *args) -> T:
+        if self.max_workers == 0:
+            return parser(*args)
+        return self._get_executor().submit(parser, *args).result()
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        # Started on first use, so commands not parsing pages don't pay for the processes.
+        # Spawned rather than forked, a fork of the threads holding the loguru and session locks could deadlock.
+        with self._lock:
+            if self._executor is None:
+                logger.info(f"Starting {self.max_workers} parser processes")
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(self.config,),
+                )
+            return self._executor
+
+
+def _init_worker(config: dict | None):
+    # A spawned process starts with the default loguru sink only, the sinks of the run are added again
+    if config is not None:
+        init_logging_handler(config)
+
+
+_parse_pool = ParsePool()
+
+
+def init_parse_pool(config: dict) -> ParsePool:
+    global _parse_pool
+    _parse_pool.shutdown()
+    _parse_pool = ParsePool(
+        config.get("scheduler", {}).get("parse_workers", DEFAULT_PARSE_WORKERS),
+        config,
+    )
+    return _parse_pool
+
+
+def get_parse_pool() -> ParsePool:
+    return _parse_pool
+
+
+def parse_in_pool(parser: Callable[..., T], *args) -> T:
+    return _parse_pool.parse(parser, *args)
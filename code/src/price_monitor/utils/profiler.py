@@ -0,0 +1,153 @@
+import cProfile
+import json
+import os
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+
+from loguru import logger
+
+SAMPLE_INTERVAL_SECONDS = 0.01
+
+
+class StackSampler:
+    """
+    Samples the stacks of every thread at a fixed interval, including the scheduler workers cProfile doesn't see.
+    The samples are written in the collapsed stack format read by flamegraph.pl and speedscope.
+    """
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL_SECONDS):
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="stack-sampler", daemon=True
+        )
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            self._sample()
+
+    def _sample(self):
+        # Frames are only referenced until the sample returns, so they don't keep the locals of finished calls alive
+        own_id = threading.get_ident()
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id != own_id:
+                self.stacks[_collapse(frame)] += 1
+
+    def write_collapsed(self, file_path: str):
+        with open(file_path, "w") as file:
+            for stack, count in self.stacks.most_common():
+                file.write(f"{stack} {count}\n")
+
+
+def _collapse(frame) -> str:
+    names = []
+    while frame is not None:
+        names.append(
+            f"{frame.f_globals.get('__name__', '?')}.{frame.f_code.co_qualname}"
+        )
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class CommandProfiler:
+    """
+    Profiles a command with cProfile on the thread running it and a stack sampler on every thread.
+    Also records the peak traced memory of the stages run within it, a stage keeps the peaks of its nested stages.
+    """
+
+    def __init__(self, command: str, logs_directory: str):
+        self.command = command
+        self.logs_directory = logs_directory
+        self.memory_peaks: dict[str, int] = {}
+        self._profile = cProfile.Profile()
+        self._sampler = StackSampler()
+        self._stages: list[str] = []
+        self._lock = threading.Lock()
+
+    def start(self):
+        tracemalloc.start()
+        self._sampler.start()
+        self._profile.enable()
+
+    def stop(self):
+        self._profile.disable()
+        self._sampler.stop()
+        tracemalloc.stop()
+
+    @contextmanager
+    def stage(self, name: str):
+        with self._lock:
+            self._record_peak()
+            self._stages.append(name)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._record_peak()
+                self._stages.remove(name)
+
+    def _record_peak(self):
+        # The peak since the last reset is attributed to every stage open during that interval
+        _, peak = tracemalloc.get_traced_memory()
+        for name in self._stages:
+            self.memory_peaks[name] = max(self.memory_peaks.get(name, 0), peak)
+        tracemalloc.reset_peak()
+
+    def write(self) -> str:
+        os.makedirs(self.logs_directory, exist_ok=True)
+        file_prefix = os.path.join(
+            self.logs_directory,
+            f"profile-{self.command}-{datetime.now():%Y-%m-%dT%H-%M-%S}",
+        )
+        self._profile.dump_stats(f"{file_prefix}.pstats")
+        self._sampler.write_collapsed(f"{file_prefix}.collapsed")
+        with open(f"{file_prefix}.memory.json", "w") as file:
+            json.dump(self.memory_peaks, file, indent=2)
+        return file_prefix
+
+
+_active: CommandProfiler | None = None
+
+
+@contextmanager
+def profiling(config: dict, command: str, enabled: bool = True):
+    """Profiles the block when enabled, writing the pstats, collapsed stacks and memory peaks to the logs directory."""
+    global _active
+    if not enabled:
+        yield None
+        return
+
+    profiler = CommandProfiler(command, config["output"].get("logs_directory", "logs/"))
+    _active = profiler
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        _active = None
+        file_prefix = profiler.write()
+        for name, peak in profiler.memory_peaks.items():
+            logger.info(f"Stage {name} peaked at {peak / 2**20:.1f} MiB")
+        logger.info(f"Wrote profile of {command} to {file_prefix}.*")
+
+
+@contextmanager
+def profile_stage(name: str):
+    """Records the peak memory of a stage when the command is profiled, does nothing otherwise."""
+    if _active is None:
+        yield
+        return
+    with _active.stage(name):
+        yield
@@ -0,0 +1,223 @@
+import contextvars
+import heapq
+import itertools
+import threading
+from concurrent.futures import Future, wait
+from enum import IntEnum
+from typing import Callable, Iterable
+
+from src.price_monitor.model.vendor import Market, Vendor
+
+DEFAULT_MAX_WORKERS = 16
+
+# Vendor and market the running task belongs to, tasks submitted from it are queued for the same ones
+_current_vendor: contextvars.ContextVar[Vendor | None] = contextvars.ContextVar(
+    "current_vendor", default=None
+)
+_current_market: contextvars.ContextVar[Market | None] = contextvars.ContextVar(
+    "current_market", default=None
+)
+
+
+def current_vendor() -> Vendor | None:
+    return _current_vendor.get()
+
+
+def current_market() -> Market | None:
+    return _current_market.get()
+
+
+class TaskPriority(IntEnum):
+    # Tasks deeper in the fan-out finish the work already started before new work is picked up
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+class _Task:
+    __slots__ = ("fn", "args", "kwargs", "future", "context", "vendor", "market")
+
+    def __init__(self, fn, args, kwargs, vendor, market):
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.future = Future()
+        self.context = contextvars.copy_context()
+        self.vendor = vendor
+        self.market = market
+
+    def run(self):
+        if not self.future.set_running_or_notify_cancel():
+            return
+        try:
+            result = self.context.run(self._run)
+        except BaseException as e:
+            self.future.set_exception(e)
+        else:
+            self.future.set_result(result)
+
+    def _run(self):
+        _current_vendor.set(self.vendor)
+        _current_market.set(self.market)
+        return self.fn(*self.args, **self.kwargs)
+
+
+class TaskScheduler:
+    """
+    Process wide pool of workers shared by every scraper, so the number of threads of a run is capped
+    whatever the size of the catalogs.
+    Tasks are queued per vendor and run by priority. Among the vendors having tasks of the same priority
+    the workers take turns, so a vendor with a large fan-out can't starve the others.
+    A worker waiting for the tasks it submitted runs queued tasks in the meantime, so nested fan-out
+    never deadlocks on the worker cap.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.max_workers = max_workers
+        self._queues: dict[Vendor | None, list] = {}
+        self._vendors: list[Vendor | None] = []
+        self._next_vendor = 0
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._workers: list[threading.Thread] = []
+        self._idle_workers = 0
+        self._local = threading.local()
+        self._shutdown = False
+
+    def submit(
+        self,
+        fn: Callable,
+        *args,
+        vendor: Vendor | None = None,
+        market: Market | None = None,
+        priority: TaskPriority = TaskPriority.NORMAL,
+        **kwargs,
+    ) -> Future:
+        if vendor is None:
+            vendor = _current_vendor.get()
+        if market is None:
+            market = _current_market.get()
+        task = _Task(fn, args, kwargs, vendor, market)
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError(
+                    "Cannot submit tasks after the scheduler is shut down"
+                )
+            if vendor not in self._queues:
+                self._queues[vendor] = []
+                self._vendors.append(vendor)
+            heapq.heappush(self._queues[vendor], (priority, next(self._sequence), task))
+            # An idle worker is claimed as soon as it is notified, so a burst wakes or starts a worker per task
+            if self._idle_workers > 0:
+                self._idle_workers -= 1
+                self._condition.notify()
+            elif len(self._workers) < self.max_workers:
+                self._start_worker()
+        return task.future
+
+    def map(
+        self,
+        fn: Callable,
+        items: Iterable,
+        vendor: Vendor | None = None,
+        priority: TaskPriority = TaskPriority.NORMAL,
+    ) -> list[Future]:
+        return [
+            self.submit(fn, item, vendor=vendor, priority=priority) for item in items
+        ]
+
+    def wait(self, futures: Iterable[Future]) -> list[Future]:
+        futures = list(futures)
+        if not getattr(self._local, "is_worker", False):
+            for future in futures:
+                future.exception()
+            return futures
+
+        for future in futures:
+            while not future.done():
+                task = self._next_task(block=False)
+                if task is not None:
+                    task.run()
+                else:
+                    # Everything left is running on other workers, check the queues again shortly
+                    wait([future], timeout=0.05)
+        return futures
+
+    def gather(self, futures: Iterable[Future]) -> list:
+        return [future.result() for future in self.wait(futures)]
+
+    def shutdown(self):
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify_all()
+        for worker in self._workers:
+            worker.join()
+
+    def _start_worker(self):
+        worker = threading.Thread(
+            target=self._work,
+            name=f"scheduler_{len(self._workers)}",
+            daemon=True,
+        )
+        self._workers.append(worker)
+        worker.start()
+
+    def _work(self):
+        self._local.is_worker = True
+        while True:
+            task = self._next_task(block=True)
+            if task is None:
+                return
+            task.run()
+
+    def _next_task(self, block: bool) -> _Task | None:
+        with self._condition:
+            while True:
+                task = self._pop_fair_share()
+                if task is not None or not block or self._shutdown:
+                    return task
+                # The submitter notifying this worker takes it off the idle count
+                self._idle_workers += 1
+                self._condition.wait()
+
+    def _pop_fair_share(self) -> _Task | None:
+        # Highest priority across vendors first, then the next vendor in turn having a task of that priority
+        heads = [
+            self._queues[vendor][0][0]
+            for vendor in self._vendors
+            if self._queues[vendor]
+        ]
+        if len(heads) == 0:
+            return None
+        priority = min(heads)
+        for offset in range(len(self._vendors)):
+            index = (self._next_vendor + offset) % len(self._vendors)
+            queue = self._queues[self._vendors[index]]
+            if queue and queue[0][0] == priority:
+                self._next_vendor = index + 1
+                return heapq.heappop(queue)[2]
+
+
+_scheduler: TaskScheduler | None = None
+_scheduler_lock = threading.Lock()
+
+
+def init_scheduler(config: dict) -> TaskScheduler:
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is not None:
+            _scheduler.shutdown()
+        _scheduler = TaskScheduler(
+            config.get("scheduler", {}).get("max_workers", DEFAULT_MAX_WORKERS)
+        )
+        return _scheduler
+
+
+def get_scheduler() -> TaskScheduler:
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = TaskScheduler()
+        return _scheduler
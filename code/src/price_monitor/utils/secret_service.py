@@ -1,4 +1,3 @@
-from google.cloud import secretmanager
 from loguru import logger
 
 SECRET_PREFIX = "SECRET::"
@@ -7,6 +6,9 @@ SECRET_PREFIX = "SECRET::"
 def fetch_secret_if_present(secret: str) -> str:
     if secret.startswith(SECRET_PREFIX):
         secret_name = secret[len(SECRET_PREFIX) :]
+        # Only imported when a secret is stored in the secret manager, its client is slow to import
+        from google.cloud import secretmanager
+
         logger.debug("Retrieving secret from secret manager")
         client = secretmanager.SecretManagerServiceClient()
 
@@ -8,24 +8,37 @@ from selenium.webdriver.chrome.service import Service as ChromeService
 from webdriver_manager.chrome import ChromeDriverManager
 
 from src.price_monitor.price_scraper.constants import USER_AGENT
+from src.price_monitor.utils.http_recorder import get_recorder
+from src.price_monitor.utils.metrics import retry_recorder, track_request
 
 
-@retry(tries=5, delay=3, backoff=2)
+@retry(tries=5, delay=3, backoff=2, logger=retry_recorder)
 def selenium_execute_request(
     url: str,
     response_format="json",
 ):
     """Calls the request with the appropriate headers and stuff"""
-    chrome_options = Options()
-    chrome_options.add_argument("--headless=new")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument(f"user-agent={USER_AGENT}")
-    driver = webdriver.Chrome(
-        options=chrome_options, service=ChromeService(ChromeDriverManager().install())
-    )
-    driver.get(url=url)
-    response = driver.page_source
-    driver.close()
+    recorder = get_recorder()
+    if recorder.replaying:
+        with track_request("selenium", url) as attempt:
+            response = recorder.replay("selenium", "get", url)
+            attempt.record_body(response)
+    else:
+        chrome_options = Options()
+        chrome_options.add_argument("--headless=new")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument(f"user-agent={USER_AGENT}")
+        driver = webdriver.Chrome(
+            options=chrome_options,
+            service=ChromeService(ChromeDriverManager().install()),
+        )
+        with track_request("selenium", url) as attempt:
+            driver.get(url=url)
+            response = driver.page_source
+            attempt.record_body(response)
+        driver.close()
+        if recorder.recording:
+            recorder.record("selenium", "get", url, None, response)
     if response_format == "json":
         response = re.sub(r"<html>.*<pre>", "", response)
         response = re.sub(r"</pre>.*</html>", "", response)
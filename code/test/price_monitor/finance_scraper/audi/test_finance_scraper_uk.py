@@ -11,6 +11,7 @@ from src.price_monitor.finance_scraper.audi.finance_scraper_uk import (
     find_available_finance_model_ranges,
 )
 from src.price_monitor.model.vendor import Market, Vendor
+from src.price_monitor.utils.catalog_cache import catalog_cache_scope
 
 TEST_DATA_DIR = f"{Path(__file__).parent}/sample"
 
@@ -817,3 +818,52 @@ class TestFinanceScraper(unittest.TestCase):
         )
 
         assert actual_result == expected_finance_line_item
+
+    @patch(
+        "src.price_monitor.finance_scraper.audi.finance_scraper_uk.parse_finance_line_item"
+    )
+    @patch(
+        "src.price_monitor.finance_scraper.audi.finance_scraper_uk.parse_finance_option_details"
+    )
+    @patch(
+        "src.price_monitor.finance_scraper.audi.finance_scraper_uk.parse_finance_options"
+    )
+    @patch("src.price_monitor.finance_scraper.audi.finance_scraper_uk.execute_request")
+    def test_get_available_finance_options_sends_identical_requests_of_trims_once(
+        self,
+        mock_execute_request,
+        mock_parse_finance_options,
+        mock_parse_finance_option_details,
+        mock_parse_finance_line_item,
+    ):
+        mock_execute_request.return_value = ["data"]
+        mock_parse_finance_options.return_value = [
+            {"finance_code": "835457", "name": "Personal Contract Hire"},
+            {"finance_code": "826999", "name": "Business Contract Hire"},
+        ]
+        mock_parse_finance_line_item.side_effect = (
+            lambda finance_option, details, model: (
+                model["model_description"],
+                finance_option["finance_code"],
+            )
+        )
+        finance_scraper_audi_uk = FinanceScraperAudiUk(
+            finance_line_item_repository=Mock(), config={}, session=Mock()
+        )
+        trims = [
+            {"model_description": description, "price": 88365, "year": 2024}
+            for description in ["quattro 60", "quattro 60 vorsprung"]
+        ]
+
+        with catalog_cache_scope():
+            actual_result = [
+                finance_scraper_audi_uk._get_available_finance_options("altKey", trim)
+                for trim in trims
+            ]
+
+        assert actual_result == [
+            [("quattro 60", "835457"), ("quattro 60", "826999")],
+            [("quattro 60 vorsprung", "835457"), ("quattro 60 vorsprung", "826999")],
+        ]
+        # One products request and one details request per finance option, shared by both trims
+        assert mock_execute_request.call_count == 3
@@ -4,6 +4,7 @@ from pathlib import Path
 from test.price_monitor.utils.test_data_builder import (
     create_test_finance_line_item,
     create_test_line_item,
+    create_test_line_item_option_code,
 )
 from unittest.mock import Mock, patch
 
@@ -19,6 +20,7 @@ from src.price_monitor.finance_scraper.bmw.finance_scraper import (
 )
 from src.price_monitor.model.finance_line_item import FinanceLineItem
 from src.price_monitor.model.vendor import Currency, Market, Vendor
+from src.price_monitor.utils.catalog_cache import catalog_cache_scope
 from src.price_monitor.utils.clock import (
     today_dashed_str,
     yesterday_dashed_str_with_key,
@@ -794,3 +796,112 @@ class TestFinanceScraper(unittest.TestCase):
         )
 
         self.assertEqual(result, expected_result)
+
+    @patch(
+        "src.price_monitor.finance_scraper.bmw.finance_scraper.get_lowest_price_metallic_paint"
+    )
+    @patch("src.price_monitor.finance_scraper.bmw.finance_scraper.get_metallic_paints")
+    @patch("src.price_monitor.finance_scraper.bmw.finance_scraper.parse_is_volt_48")
+    @patch(
+        "src.price_monitor.finance_scraper.bmw.finance_scraper.get_configuration_state_and_is_volt_48"
+    )
+    @patch.object(FinanceScraperBMWUk, "get_finance_line_item_for_finance_option")
+    @patch("src.price_monitor.finance_scraper.bmw.finance_scraper.execute_request")
+    def test_get_finance_option_for_line_shares_paints_only_between_lines_of_the_same_trim(
+        self,
+        mock_execute_request,
+        mock_get_finance_line_item_for_finance_option,
+        mock_get_configuration_state_and_is_volt_48,
+        mock_parse_is_volt_48,
+        mock_get_metallic_paints,
+        mock_get_lowest_price_metallic_paint,
+    ):
+        line_items = [
+            create_test_line_item(
+                vendor=Vendor.BMW,
+                series="Z",
+                model_range_code="G29",
+                model_code="HF51",
+                line_code=line_code,
+                line_description=line_code,
+                market=Market.UK,
+                line_option_codes=[
+                    create_test_line_item_option_code(code=code) for code in codes
+                ],
+            )
+            for line_code, codes in [
+                ("M_PERFORMANCE_LINE", []),
+                ("M_PERFORMANCE_LINE", []),
+                ("M_PERFORMANCE_LINE", ["S0ZAA"]),
+                ("SPORT_LINE", []),
+            ]
+        ]
+        mock_get_configuration_state_and_is_volt_48.return_value = "testing"
+        mock_parse_is_volt_48.return_value = False
+        mock_execute_request.return_value = {
+            "financeProductList": [{"productId": "PCP"}]
+        }
+        mock_get_finance_line_item_for_finance_option.return_value = (
+            create_test_finance_line_item()
+        )
+        mock_get_metallic_paints.return_value = [
+            [{"paint_code": "P0C4W", "paint_description": "Skyscraper Grey "}],
+            [{"paint_code": "P0300", "paint_description": "Alpine White"}],
+        ]
+        mock_get_lowest_price_metallic_paint.return_value = {
+            "paint_code": "P0C4W",
+            "paint_description": "Skyscraper Grey ",
+            "paint_price": 650.0,
+        }
+        bmw_finance_scraper = FinanceScraperBMWUk(
+            finance_line_item_repository=Mock(), config={}, session=Mock()
+        )
+        setattr(bmw_finance_scraper, "token", "token123")
+        setattr(bmw_finance_scraper, "IX_MODELS", [])
+
+        with open(f"{TEST_DATA_DIR}/model_matrix_series_z.json", "r") as file:
+            model_matrix = json.load(file)
+        with catalog_cache_scope():
+            for line_item in line_items:
+                assert (
+                    len(
+                        bmw_finance_scraper.get_finance_option_for_line(
+                            line_item, model_matrix
+                        )
+                    )
+                    == 1
+                )
+
+        assert [
+            call.args[1].line_description
+            for call in mock_get_metallic_paints.call_args_list
+        ] == ["M_PERFORMANCE_LINE", "SPORT_LINE"]
+        # The lowest price paint is priced with the selected options of the line
+        assert mock_get_lowest_price_metallic_paint.call_count == 3
+
+    @patch("src.price_monitor.finance_scraper.bmw.finance_scraper.execute_request")
+    def test_get_finance_line_items_for_products_keeps_the_order_of_the_products(
+        self, mock_execute_request
+    ):
+        product_ids = ["CONTRACT_HIRE", "HP", "LEASE", "BALLOON", "OPTION"]
+        mock_execute_request.return_value = {
+            "financeProductList": [
+                {"parameters": [{"id": "installment/grossAmount", "value": 500}]}
+            ]
+        }
+        line_item = create_test_line_item(vendor=Vendor.BMW, market=Market.UK)
+        payload = {"settings": {"application": "CONX"}}
+        bmw_finance_scraper = FinanceScraperBMWUk(
+            finance_line_item_repository=Mock(), config={}, session=Mock()
+        )
+        setattr(bmw_finance_scraper, "IX_MODELS", [])
+
+        finance_line_items = bmw_finance_scraper._get_finance_line_items_for_products(
+            line_item, payload, product_ids, {}
+        )
+
+        assert [
+            finance_line_item.contract_type for finance_line_item in finance_line_items
+        ] == product_ids
+        assert mock_execute_request.call_count == len(product_ids)
+        assert payload == {"settings": {"application": "CONX"}}
@@ -64,17 +64,17 @@ class TestFinanceScraper(unittest.TestCase):
         "src.price_monitor.finance_scraper.tesla.finance_scraper.parse_finance_line_items"
     )
     @patch(
-        "src.price_monitor.finance_scraper.tesla.finance_scraper.get_finance_details_for_model"
+        "src.price_monitor.finance_scraper.tesla.finance_scraper.parse_trim_line_items"
     )
-    @patch("src.price_monitor.finance_scraper.tesla.finance_scraper.parse_line_items")
+    @patch("src.price_monitor.finance_scraper.tesla.finance_scraper.parse_lexicon")
     @patch(
-        "src.price_monitor.finance_scraper.tesla.finance_scraper.selenium_execute_request"
+        "src.price_monitor.finance_scraper.tesla.finance_scraper.get_model_page_and_finance_details"
     )
     def test_scrape_finance_option_for_model(
         self,
-        mock_selenium_execute_request,
+        mock_get_model_page_and_finance_details,
+        mock_parse_lexicon,
         mock_parse_line_items,
-        mock_get_finance_details_for_model,
         mock_parse_finance_line_items,
     ):
         finance_line_item = create_test_finance_line_item(
@@ -99,9 +99,11 @@ class TestFinanceScraper(unittest.TestCase):
                 market=Market.UK,
             ),
         ]
-        mock_selenium_execute_request.return_value = "model_text"
+        mock_get_model_page_and_finance_details.return_value = {
+            "model_page": "model_text",
+            "finance_details": {"model": {"PCP": 1000}},
+        }
         mock_parse_line_items.return_value = ["model1"]
-        mock_get_finance_details_for_model.return_value = {"model": {"PCP": 1000}}
         mock_parse_finance_line_items.return_value = [finance_line_item]
 
         config = {"scraper": {"enabled": {Vendor.TESLA: [Market.UK]}}}
@@ -116,13 +118,13 @@ class TestFinanceScraper(unittest.TestCase):
             tesla_finance_scraper.scrape_finance_option_for_model("model_1")
         )
 
-        mock_selenium_execute_request.assert_called_with(
-            url="https://www.tesla.commodel_1#overview", response_format="text"
-        )
-        mock_parse_line_items.assert_called_with("model_text", Market.UK)
-        mock_get_finance_details_for_model.assert_called_with(
+        mock_get_model_page_and_finance_details.assert_called_once_with(
             "https://www.tesla.commodel_1#overview"
         )
+        mock_parse_lexicon.assert_called_with("model_text")
+        mock_parse_line_items.assert_called_with(
+            mock_parse_lexicon.return_value, Market.UK
+        )
         mock_parse_finance_line_items.assert_called_with(
             ["model1"], {"model": {"PCP": 1000}}
         )
@@ -132,10 +134,10 @@ class TestFinanceScraper(unittest.TestCase):
         "src.price_monitor.finance_scraper.tesla.finance_scraper.parse_model_and_series"
     )
     @patch(
-        "src.price_monitor.finance_scraper.tesla.finance_scraper.selenium_execute_request"
+        "src.price_monitor.finance_scraper.tesla.finance_scraper.get_model_page_and_finance_details"
     )
     def test_scrape_finance_option_for_model_when_scraping_fail_load_previous_data(
-        self, mock_selenium_execute_request, mock_parse_model_and_series
+        self, mock_get_model_page_and_finance_details, mock_parse_model_and_series
     ):
         finance_line_item = create_test_finance_line_item(
             vendor=Vendor.TESLA,
@@ -155,7 +157,7 @@ class TestFinanceScraper(unittest.TestCase):
         mock_repository = Mock()
         mock_repository.load_model_filter_by_series.return_value = [finance_line_item]
         mock_parse_model_and_series.return_value = ["model_1", "series1"]
-        mock_selenium_execute_request.side_effect = HTTPError()
+        mock_get_model_page_and_finance_details.side_effect = HTTPError()
 
         config = {"scraper": {"enabled": {Vendor.TESLA: [Market.UK]}}}
 
@@ -171,8 +173,8 @@ class TestFinanceScraper(unittest.TestCase):
             tesla_finance_scraper.scrape_finance_option_for_model("model_1")
         )
 
-        mock_selenium_execute_request.assert_called_with(
-            url="https://www.tesla.commodel_1#overview", response_format="text"
+        mock_get_model_page_and_finance_details.assert_called_with(
+            "https://www.tesla.commodel_1#overview"
         )
         mock_repository.load_model_filter_by_series.assert_called_with(
             date=yesterday_dashed_str_with_key(),
@@ -1,28 +1,43 @@
 import unittest
-from unittest.mock import Mock, call, patch
+from unittest.mock import Mock, patch
 
 from src.price_monitor.finance_scraper.tesla.selenium import (
-    get_finance_details_for_model,
+    get_model_page_and_finance_details,
 )
+from src.price_monitor.utils.browser_pool import BrowserPool
 
 
 class TestSeleniumCaller(unittest.TestCase):
+    @patch(
+        "src.price_monitor.finance_scraper.tesla.selenium.get_finance_details_for_trimline"
+    )
     @patch("src.price_monitor.finance_scraper.tesla.selenium.WebDriverWait")
     @patch("src.price_monitor.finance_scraper.tesla.selenium.time")
-    @patch("src.price_monitor.finance_scraper.tesla.selenium.Options")
-    @patch("src.price_monitor.finance_scraper.tesla.selenium.webdriver")
-    def test_get_finance_details_for_model_should_call_with_headless(
-        self, mock_driver, mock_options, mock_time, mock_web_driver_wait
+    @patch("src.price_monitor.finance_scraper.tesla.selenium.get_browser_pool")
+    def test_get_model_page_and_finance_details_uses_one_browser_session(
+        self,
+        mock_get_browser_pool,
+        mock_time,
+        mock_web_driver_wait,
+        mock_get_finance_details_for_trimline,
     ):
-        model_page = '<html><head><meta name="color-scheme" content="light dark"><meta charset="utf-8"></head><body><pre>{"model":"I am Model"}</pre><div class="json-formatter-container"></div></body></html>'
+        model_page = "<html><body>Model 3</body></html>"
         driver_mock = Mock()
-        mock_driver.Chrome.return_value = driver_mock
-        mock_web_driver_wait.Chrome.return_value = Mock()
-        mock_driver.Chrome().page_source = model_page
+        driver_mock.page_source = model_page
         mock_variant = Mock()
         driver_mock.find_elements.return_value = [mock_variant]
         mock_variant.get_attribute.return_value = "MDL3"
-        get_finance_details_for_model(url="url")
-        mock_options().add_argument.assert_has_calls(
-            [call("--headless=new")], any_order=True
-        )
+        mock_get_finance_details_for_trimline.return_value = {"PCP": {}}
+        create_browser = Mock(return_value=driver_mock)
+        mock_get_browser_pool.return_value = BrowserPool(1, create_browser)
+
+        response = get_model_page_and_finance_details(url="url")
+        get_model_page_and_finance_details(url="url")
+
+        create_browser.assert_called_once()
+        driver_mock.get.assert_called_with(url="url")
+        mock_get_finance_details_for_trimline.assert_called_with(driver_mock)
+        assert response == {
+            "model_page": model_page,
+            "finance_details": {"MDL3": {"PCP": {}}},
+        }
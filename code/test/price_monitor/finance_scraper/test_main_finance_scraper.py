@@ -1,6 +1,6 @@
 import json
 import os
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future
 from pathlib import Path
 from test.price_monitor.utils.test_data_builder import create_test_finance_line_item
 from unittest.mock import Mock, call, patch
@@ -14,18 +14,19 @@ from src.price_monitor.finance_scraper.main_finance_scraper import (
 )
 from src.price_monitor.model.vendor import Market, Vendor
 from src.price_monitor.price_scraper.vendor_scraper import VendorScraper
+from src.price_monitor.utils.scheduler import TaskScheduler
 
 finance_line_item = create_test_finance_line_item()
 
 
-@patch.object(target=ThreadPoolExecutor, attribute="submit")
-def test_scrape_saves_scraped_finance_line_items(mock_thread_pool):
+@patch.object(target=TaskScheduler, attribute="submit")
+def test_scrape_saves_scraped_finance_line_items(mock_submit):
     finance_line_item_repository_mock = Mock()
     finance_line_item_repository_mock.load.return_value = []
 
-    mock_job = Mock()
-    mock_thread_pool.return_value = mock_job
-    mock_job.result.return_value = [finance_line_item]
+    job = Future()
+    job.set_result([finance_line_item])
+    mock_submit.return_value = job
 
     config = {
         "output": {"directory": "", "finance_option_filename": ""},
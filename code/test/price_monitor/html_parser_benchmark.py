@@ -0,0 +1,127 @@
+import base64
+import json
+import time
+import urllib.parse
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+from unittest.mock import patch
+
+from src.price_monitor.price_scraper.audi import parser as audi_parser
+from src.price_monitor.price_scraper.audi import parser_uk as audi_parser_uk
+from src.price_monitor.price_scraper.audi import parser_usa as audi_parser_usa
+from src.price_monitor.price_scraper.bmw.constants import X_API_KEY
+from src.price_monitor.price_scraper.bmw.parser import parse_api_token
+from src.price_monitor.price_scraper.mercedes_benz.mercedes_benz_usa.parser_usa import (
+    MercedesBenzUSAParser,
+)
+from src.price_monitor.price_scraper.tesla.parser import parse_lexicon
+from src.price_monitor.utils.html_parser import LXML, PYTHON_HTML_PARSER
+
+SCRAPER_TEST_DIR = Path(__file__).parent / "price_scraper"
+
+
+@dataclass(frozen=True)
+class SamplePage:
+    name: str
+    path: Path | None
+    extract: Callable[[str], object]
+    markup: str | None = None
+
+    def read(self) -> str:
+        return self.markup if self.path is None else self.path.read_text()
+
+
+def _bmw_token_page() -> str:
+    # The stored BMW configurator page predates the token script, the script is embedded as the site serves it
+    settings = {
+        "APP": {"backend": {"settingsAccessories": {"headers": {X_API_KEY: "token"}}}}
+    }
+    encoded = base64.b64encode(
+        urllib.parse.quote(json.dumps(settings)).encode()
+    ).decode()
+    return (
+        "<html><head><title>Konfigurator</title></head><body><div id='app'></div><script>"
+        f'var conApp = {{}}; conApp.inputSettings = JSON.parse(decodeURIComponent(atob("{encoded}")))'
+        "</script></body></html>"
+    )
+
+
+_mercedes_usa_parser = MercedesBenzUSAParser()
+
+SAMPLE_PAGES = [
+    SamplePage(
+        "audi/model_list_de.html",
+        SCRAPER_TEST_DIR / "audi" / "sample" / "model_list_de.html",
+        audi_parser.parse_available_model_links,
+    ),
+    SamplePage(
+        "audi/uk_model_list.html",
+        SCRAPER_TEST_DIR / "audi" / "sample" / "uk_model_list.html",
+        audi_parser_uk.parse_available_model_range_links,
+    ),
+    SamplePage(
+        "audi/model_list_us.html",
+        SCRAPER_TEST_DIR / "audi" / "sample" / "model_list_us.html",
+        audi_parser_usa.parse_available_model_range_links,
+    ),
+    SamplePage("bmw/token_page.html", None, parse_api_token, _bmw_token_page()),
+    *[
+        SamplePage(
+            f"tesla/{model_page}",
+            SCRAPER_TEST_DIR / "tesla" / "sample" / model_page,
+            parse_lexicon,
+        )
+        for model_page in ["model3_de.html", "modelx_de.html", "modely_de.html"]
+    ],
+    SamplePage(
+        "mercedes_benz/sedan_model.html",
+        SCRAPER_TEST_DIR / "mercedes_benz" / "sample_usa_apis" / "sedan_model.html",
+        _mercedes_usa_parser.parse_line_codes,
+    ),
+    SamplePage(
+        "mercedes_benz/cabriolet_base_model.html",
+        SCRAPER_TEST_DIR
+        / "mercedes_benz"
+        / "sample_usa_apis"
+        / "cabriolet_base_model.html",
+        lambda model_page: _mercedes_usa_parser.parse_trim_line(
+            model_page, "BASIC LINE", ""
+        ),
+    ),
+]
+
+
+def benchmark_page(
+    sample_page: SamplePage, backends: list[str], repeat: int = 10
+) -> dict[str, float]:
+    """Milliseconds spent per call extracting the content of a sample page, as the scrapers do, with each backend."""
+    markup = sample_page.read()
+    timings = {}
+    for backend in backends:
+        with patch("src.price_monitor.utils.html_parser.DEFAULT_BACKEND", backend):
+            start = time.perf_counter()
+            for _ in range(repeat):
+                sample_page.extract(markup)
+            timings[backend] = (time.perf_counter() - start) * 1000 / repeat
+    return timings
+
+
+if __name__ == "__main__":
+    # python -m test.price_monitor.html_parser_benchmark
+    try:
+        import lxml  # noqa: F401
+
+        available_backends = [PYTHON_HTML_PARSER, LXML]
+    except ImportError:
+        available_backends = [PYTHON_HTML_PARSER]
+
+    print(f"{'page':<42}" + "".join(f"{backend:>14}" for backend in available_backends))
+    for page in SAMPLE_PAGES:
+        page_timings = benchmark_page(page, available_backends)
+        print(
+            f"{page.name:<42}"
+            + "".join(
+                f"{page_timings[backend]:>12.2f}ms" for backend in available_backends
+            )
+        )
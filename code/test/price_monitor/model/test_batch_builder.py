@@ -0,0 +1,106 @@
+import dataclasses
+from test.price_monitor.builder.line_item_builder import LineItemBuilder
+from test.price_monitor.utils.test_data_builder import (
+    assert_line_items_list,
+    create_test_finance_line_item,
+)
+
+import pytest
+from assertpy import assert_that
+
+from src.price_monitor.model.batch_builder import (
+    build_finance_line_items,
+    build_line_items,
+)
+from src.price_monitor.model.finance_line_item import compute_vehicle_id
+from src.price_monitor.model.vendor import Market, Vendor
+from src.price_monitor.utils.clock import (
+    ClockSnapshot,
+    current_batch_clock,
+    today_dashed_str,
+)
+
+CLOCK = ClockSnapshot(timestamp="2024-01-01 10:00:00 UTC", today="2024-01-01")
+
+
+def _as_record(item) -> dict:
+    return {field.name: getattr(item, field.name) for field in dataclasses.fields(item)}
+
+
+def test_build_line_items_builds_the_same_line_items_as_the_constructor():
+    line_items = [
+        LineItemBuilder().with_vendor(Vendor.BMW).build(),
+        LineItemBuilder().with_vendor(Vendor.AUDI).with_market(Market.DE).build(),
+    ]
+
+    actual = build_line_items(_as_record(line_item) for line_item in line_items)
+
+    assert_line_items_list(line_items, actual)
+    assert_that([line_item.is_current for line_item in actual]).is_equal_to(
+        [True, True]
+    )
+
+
+def test_build_line_items_uses_one_clock_snapshot_for_the_whole_batch():
+    records = [
+        _as_record(LineItemBuilder().with_last_scraped_on("2024-01-01").build()),
+        _as_record(LineItemBuilder().with_last_scraped_on("2023-12-31").build()),
+    ]
+
+    actual = build_line_items(records, clock=CLOCK)
+
+    assert_that([line_item.recorded_at for line_item in actual]).is_equal_to(
+        [CLOCK.timestamp, CLOCK.timestamp]
+    )
+    assert_that([line_item.is_current for line_item in actual]).is_equal_to(
+        [True, False]
+    )
+    assert_that(current_batch_clock()).is_none()
+
+
+def test_build_line_items_raises_error_when_a_required_field_is_blank():
+    records = [
+        _as_record(LineItemBuilder().build()),
+        {**_as_record(LineItemBuilder().build()), "line_code": " "},
+    ]
+
+    with pytest.raises(ValueError, match="line_code cannot be blank or empty"):
+        build_line_items(records)
+
+    assert_that(current_batch_clock()).is_none()
+
+
+def test_build_finance_line_items_builds_the_same_finance_line_items_as_the_constructor():
+    finance_line_items = [
+        create_test_finance_line_item(vendor=Vendor.BMW, market=Market.UK),
+        create_test_finance_line_item(vendor=Vendor.AUDI, market=Market.UK),
+    ]
+
+    actual = build_finance_line_items(
+        _as_record(finance_line_item) for finance_line_item in finance_line_items
+    )
+
+    assert_that(actual).is_equal_to(finance_line_items)
+    assert_that([item.vehicle_id for item in actual]).is_equal_to(
+        [item.vehicle_id for item in finance_line_items]
+    )
+    assert_that([item.last_scraped_on for item in actual]).contains_only(
+        today_dashed_str()
+    )
+
+
+def test_build_finance_line_items_raises_error_when_a_required_field_is_blank():
+    record = _as_record(create_test_finance_line_item())
+    record["contract_type"] = ""
+
+    with pytest.raises(ValueError, match="contract_type cannot be blank or empty"):
+        build_finance_line_items([record], clock=CLOCK)
+
+
+def test_compute_vehicle_id_is_memoized_for_repeated_attributes():
+    compute_vehicle_id.cache_clear()
+    records = [_as_record(create_test_finance_line_item()) for _ in range(5)]
+
+    build_finance_line_items(records, clock=CLOCK)
+
+    assert_that(compute_vehicle_id.cache_info().misses).is_equal_to(1)
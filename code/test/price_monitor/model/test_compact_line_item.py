@@ -0,0 +1,167 @@
+import gc
+import tracemalloc
+from test.price_monitor.builder.line_item_builder import LineItemBuilder
+from test.price_monitor.utils.test_data_builder import (
+    assert_line_items_list,
+    create_test_line_item_option_code,
+)
+
+from assertpy import assert_that
+
+from src.price_monitor.model.compact_line_item import (
+    CompactLineItemOptionCode,
+    CompactLineItemSnapshot,
+)
+from src.price_monitor.model.vendor import Market, Vendor
+from src.price_monitor.repository.line_item_repository import (
+    FileSystemLineItemRepository,
+)
+from src.price_monitor.utils.clock import today_dashed_str_with_key
+
+
+def _create_line_items_for_a_day(
+    models_per_market: int, lines_per_model: int, options_per_line: int
+):
+    line_items = []
+    for vendor in Vendor:
+        for market in Market:
+            for model in range(models_per_market):
+                for line in range(lines_per_model):
+                    line_items.append(
+                        LineItemBuilder()
+                        .with_vendor(vendor)
+                        .with_market(market)
+                        .with_model_code(f"model_{model}")
+                        .with_line_code(f"line_{line}")
+                        .with_line_option_code(
+                            [
+                                create_test_line_item_option_code(
+                                    code=f"option_{option}",
+                                    type="Upholstery",
+                                    description=f"Description of option {option}",
+                                    net_list_price=100.0,
+                                    gross_list_price=120.0,
+                                    included=option % 2 == 0,
+                                )
+                                for option in range(options_per_line)
+                            ]
+                        )
+                        .build()
+                    )
+    return line_items
+
+
+def test_compact_line_item_option_code_round_trips_line_item_option_code():
+    option = create_test_line_item_option_code(
+        code="P7",
+        type="Package",
+        description="Comfort package",
+        net_list_price=1000.0,
+        gross_list_price=1200.0,
+        included=False,
+        category="comfort",
+    )
+
+    compact_option = CompactLineItemOptionCode.from_line_item_option_code(option)
+
+    assert_that(compact_option.to_line_item_option_code()).is_equal_to(option)
+
+
+def test_compact_line_item_option_code_has_no_instance_dict():
+    compact_option = CompactLineItemOptionCode.from_line_item_option_code(
+        create_test_line_item_option_code(code="P7")
+    )
+
+    assert_that(hasattr(compact_option, "__dict__")).is_false()
+
+
+def test_compact_snapshot_round_trips_line_items():
+    line_items = [
+        LineItemBuilder().with_vendor(Vendor.BMW).with_market(Market.DE).build(),
+        LineItemBuilder()
+        .with_vendor(Vendor.AUDI)
+        .with_market(Market.UK)
+        .with_line_option_code([])
+        .build(),
+        LineItemBuilder().with_vendor(Vendor.TESLA).with_line_option_code(None).build(),
+    ]
+
+    snapshot = CompactLineItemSnapshot.from_line_items(line_items)
+
+    assert_that(snapshot).is_length(3)
+    assert_line_items_list(line_items, snapshot.to_line_items())
+
+
+def test_compact_snapshot_shares_one_option_table_per_model():
+    line_items = _create_line_items_for_a_day(
+        models_per_market=2, lines_per_model=3, options_per_line=10
+    )
+
+    snapshot = CompactLineItemSnapshot.from_line_items(line_items)
+
+    assert_that(snapshot.option_tables).is_length(len(Vendor) * len(Market) * 2)
+    for option_table in snapshot.option_tables.values():
+        assert_that(option_table).is_length(10)
+    first_line, second_line = snapshot.line_items[0], snapshot.line_items[1]
+    assert_that(first_line.option_table).is_same_as(second_line.option_table)
+    assert_that(first_line.line_option_codes[0]).is_same_as(
+        second_line.line_option_codes[0]
+    )
+
+
+def test_compact_snapshot_keeps_options_apart_when_they_differ_between_lines():
+    line_items = [
+        LineItemBuilder()
+        .with_line_code("line_1")
+        .with_line_option_code(
+            [create_test_line_item_option_code(code="P7", included=True)]
+        )
+        .build(),
+        LineItemBuilder()
+        .with_line_code("line_2")
+        .with_line_option_code(
+            [create_test_line_item_option_code(code="P7", included=False)]
+        )
+        .build(),
+    ]
+
+    snapshot = CompactLineItemSnapshot.from_line_items(line_items)
+
+    assert_line_items_list(line_items, snapshot.to_line_items())
+    assert_that(list(snapshot.option_tables.values())[0]).is_length(2)
+
+
+def test_compact_snapshot_uses_less_memory_than_line_items_for_a_full_day_of_all_vendors(
+    tmp_path,
+):
+    repository = FileSystemLineItemRepository(
+        config={
+            "output": {
+                "directory": str(tmp_path),
+                "prices_filename": "prices",
+                "file_type": "avro",
+            }
+        }
+    )
+    repository.save(
+        _create_line_items_for_a_day(
+            models_per_market=3, lines_per_model=4, options_per_line=100
+        )
+    )
+    gc.collect()
+
+    tracemalloc.start()
+    line_items = repository.load(date=today_dashed_str_with_key())
+    line_items_memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    snapshot = CompactLineItemSnapshot.from_line_items(
+        repository.load(date=today_dashed_str_with_key())
+    )
+    gc.collect()
+    snapshot_memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert_that(snapshot).is_length(len(line_items))
+    assert_that(snapshot_memory).is_less_than(line_items_memory / 4)
@@ -11,7 +11,7 @@ from test.price_monitor.utils.test_data_builder import (
 from assertpy import assert_that
 
 from src.price_monitor.model.difference_item import DifferenceReason
-from src.price_monitor.model.line_item import LineItem
+from src.price_monitor.model.line_item import LineItem, LineOptionIndex
 from src.price_monitor.model.vendor import Market, Vendor
 
 
@@ -481,3 +481,26 @@ def test_is_not_current_when_date_and_last_scraped_is_not_today():
 def test_unknown_is_current_when_last_scraped_on_is_missing():
     line_item = create_test_line_item(last_scraped_on=None)
     assert_that(line_item).has_is_current(None)
+
+
+def test_line_option_index_indexes_option_details_and_descriptions():
+    line_item = create_test_line_item(
+        line_option_codes=[
+            create_test_line_item_option_code(
+                code="A1", description="A1 option", net_list_price=10.0
+            ),
+            create_test_line_item_option_code(
+                code="B2", description="B2 option", included=False
+            ),
+        ]
+    )
+
+    option_index = LineOptionIndex(line_item)
+
+    assert_that(option_index.details).is_equal_to(
+        line_item.get_line_option_code_details()
+    )
+    assert_that(option_index.descriptions).is_equal_to(
+        line_item.get_line_options_description()
+    )
+    assert_that(option_index.description_values).is_equal_to({"A1 option", "B2 option"})
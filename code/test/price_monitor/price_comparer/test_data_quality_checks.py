@@ -50,8 +50,8 @@ class TestDataQualityChecks(unittest.TestCase):
             vendor=Vendor.MERCEDES_BENZ, markets=[Market.US]
         )
 
-        mock_logger.warning.assert_called_with(
-            "[US-mercedes_benz] Model Negative Gross List Price"
+        mock_logger.opt.return_value.log.assert_called_with(
+            "WARNING", "[US-mercedes_benz] Model Negative Gross List Price"
         )
         mock_repository.load_market.assert_called_with(
             date=today_dashed_str_with_key(),
@@ -80,8 +80,8 @@ class TestDataQualityChecks(unittest.TestCase):
             vendor=Vendor.MERCEDES_BENZ, markets=[Market.US]
         )
 
-        mock_logger.warning.assert_called_with(
-            "[US-mercedes_benz] Model Negative Net List Price"
+        mock_logger.opt.return_value.log.assert_called_with(
+            "WARNING", "[US-mercedes_benz] Model Negative Net List Price"
         )
         mock_repository.load_market.assert_called_with(
             date=today_dashed_str_with_key(),
@@ -111,8 +111,8 @@ class TestDataQualityChecks(unittest.TestCase):
             vendor=Vendor.MERCEDES_BENZ, markets=[Market.US]
         )
 
-        mock_logger.warning.assert_called_with(
-            "[US-mercedes_benz] Option Negative Gross List Price"
+        mock_logger.opt.return_value.log.assert_called_with(
+            "WARNING", "[US-mercedes_benz] Option Negative Gross List Price"
         )
         mock_repository.load_market.assert_called_with(
             date=today_dashed_str_with_key(),
@@ -142,8 +142,8 @@ class TestDataQualityChecks(unittest.TestCase):
             vendor=Vendor.MERCEDES_BENZ, markets=[Market.US]
         )
 
-        mock_logger.warning.assert_called_with(
-            "[US-mercedes_benz] Option Negative Net List Price"
+        mock_logger.opt.return_value.log.assert_called_with(
+            "WARNING", "[US-mercedes_benz] Option Negative Net List Price"
         )
         mock_repository.load_market.assert_called_with(
             date=today_dashed_str_with_key(),
@@ -174,8 +174,9 @@ class TestDataQualityChecks(unittest.TestCase):
             vendor=Vendor.MERCEDES_BENZ, markets=[Market.US]
         )
 
-        mock_logger.warning.assert_called_with(
-            "[US-mercedes_benz] New Line Character Error in Model_Range_Description for model_range:A4 \n Sportsback model_description:model line_description:line"
+        mock_logger.opt.return_value.log.assert_called_with(
+            "WARNING",
+            "[US-mercedes_benz] New Line Character Error in Model_Range_Description for model_range:A4 \n Sportsback model_description:model line_description:line",
         )
         mock_repository.load_market.assert_called_with(
             date=today_dashed_str_with_key(),
@@ -206,8 +207,9 @@ class TestDataQualityChecks(unittest.TestCase):
             vendor=Vendor.MERCEDES_BENZ, markets=[Market.US]
         )
 
-        mock_logger.warning.assert_called_with(
-            "[US-mercedes_benz] New Line Character Error in Model_Description for model_range:model range model_description:A4 \n Avant line_description:line"
+        mock_logger.opt.return_value.log.assert_called_with(
+            "WARNING",
+            "[US-mercedes_benz] New Line Character Error in Model_Description for model_range:model range model_description:A4 \n Avant line_description:line",
         )
         mock_repository.load_market.assert_called_with(
             date=today_dashed_str_with_key(),
@@ -238,8 +240,9 @@ class TestDataQualityChecks(unittest.TestCase):
             vendor=Vendor.MERCEDES_BENZ, markets=[Market.US]
         )
 
-        mock_logger.warning.assert_called_with(
-            "[US-mercedes_benz] New Line Character Error in Line_Description for model_range:model range model_description:model description line_description:A4 \n Sportsback"
+        mock_logger.opt.return_value.log.assert_called_with(
+            "WARNING",
+            "[US-mercedes_benz] New Line Character Error in Line_Description for model_range:model range model_description:model description line_description:A4 \n Sportsback",
         )
         mock_repository.load_market.assert_called_with(
             date=today_dashed_str_with_key(),
@@ -272,8 +275,9 @@ class TestDataQualityChecks(unittest.TestCase):
             vendor=Vendor.MERCEDES_BENZ, markets=[Market.US]
         )
 
-        mock_logger.warning.assert_called_with(
-            "[US-mercedes_benz] New Line Character Error in Option_Description for model_range:model range model_description:model line_description:line"
+        mock_logger.opt.return_value.log.assert_called_with(
+            "WARNING",
+            "[US-mercedes_benz] New Line Character Error in Option_Description for model_range:model range model_description:model line_description:line",
         )
         mock_repository.load_market.assert_called_with(
             date=today_dashed_str_with_key(),
@@ -301,8 +305,9 @@ class TestDataQualityChecks(unittest.TestCase):
             vendor=Vendor.MERCEDES_BENZ, markets=[Market.US]
         )
 
-        mock_logger.warning.assert_called_with(
-            "[US-mercedes_benz] Expected to be Boolean but Found <class 'str'>"
+        mock_logger.opt.return_value.log.assert_called_with(
+            "WARNING",
+            "[US-mercedes_benz] Expected to be Boolean but Found <class 'str'>",
         )
         mock_repository.load_market.assert_called_with(
             date=today_dashed_str_with_key(),
@@ -333,8 +338,9 @@ class TestDataQualityChecks(unittest.TestCase):
             vendor=Vendor.MERCEDES_BENZ, markets=[Market.US]
         )
 
-        mock_logger.warning.assert_called_with(
-            "[US-mercedes_benz] Zero count of options included for options in model_range:model range model_description:model line_description:line"
+        mock_logger.opt.return_value.log.assert_called_with(
+            "WARNING",
+            "[US-mercedes_benz] Zero count of options included for options in model_range:model range model_description:model line_description:line",
         )
         mock_repository.load_market.assert_called_with(
             date=today_dashed_str_with_key(),
@@ -370,8 +376,9 @@ class TestDataQualityChecks(unittest.TestCase):
             vendor=Vendor.MERCEDES_BENZ, markets=[Market.US]
         )
 
-        mock_logger.warning.assert_called_with(
-            "[US-mercedes_benz] Zero count of options excluded for options in model_range:model range model_description:model line_description:line"
+        mock_logger.opt.return_value.log.assert_called_with(
+            "WARNING",
+            "[US-mercedes_benz] Zero count of options excluded for options in model_range:model range model_description:model line_description:line",
         )
         mock_repository.load_market.assert_called_with(
             date=today_dashed_str_with_key(),
@@ -469,8 +476,9 @@ class TestDataQualityChecks(unittest.TestCase):
             vendor=Vendor.TESLA, markets=[Market.US]
         )
 
-        mock_logger.warning.assert_called_with(
-            "[US-tesla] Option Included has Non-Zero Price for model_range:model range model_description:model line_description:line"
+        mock_logger.opt.return_value.log.assert_called_with(
+            "WARNING",
+            "[US-tesla] Option Included has Non-Zero Price for model_range:model range model_description:model line_description:line",
         )
         mock_repository.load_market.assert_called_with(
             date=today_dashed_str_with_key(),
@@ -536,8 +544,9 @@ class TestDataQualityChecks(unittest.TestCase):
             vendor=Vendor.AUDI, markets=[Market.DE]
         )
 
-        mock_logger.warning.assert_called_with(
-            "[DE-audi] Option Included has Non-Zero Price for model_range:model range model_description:model line_description:line"
+        mock_logger.opt.return_value.log.assert_called_with(
+            "WARNING",
+            "[DE-audi] Option Included has Non-Zero Price for model_range:model range model_description:model line_description:line",
         )
         mock_repository.load_market.assert_called_with(
             date=today_dashed_str_with_key(),
@@ -1,6 +1,6 @@
 import unittest
 from test.price_monitor.utils.test_data_builder import create_test_finance_line_item
-from unittest.mock import Mock, call, patch
+from unittest.mock import Mock, patch
 
 from src.price_monitor.model.vendor import Market, Vendor
 from src.price_monitor.data_quality.data_quality_checks_finance import (
@@ -50,8 +50,9 @@ class TestDataQualityCheckFinances(unittest.TestCase):
             vendor=Vendor.MERCEDES_BENZ, markets=[Market.US]
         )
 
-        mock_logger.warning.assert_called_with(
-            "[US-mercedes_benz] Negative Monthly Rental GLP for model_range:range_desc model_description:model_desc line_description:line_desc"
+        mock_logger.opt.return_value.log.assert_called_with(
+            "WARNING",
+            "[US-mercedes_benz] Negative Monthly Rental GLP for model_range:range_desc model_description:model_desc line_description:line_desc",
         )
         mock_repository.load_market.assert_called_with(
             date=today_dashed_str_with_key(),
@@ -81,8 +82,9 @@ class TestDataQualityCheckFinances(unittest.TestCase):
             vendor=Vendor.MERCEDES_BENZ, markets=[Market.US]
         )
 
-        mock_logger.warning.assert_called_with(
-            "[US-mercedes_benz] Negative Monthly Rental NLP for model_range:range_desc model_description:model_desc line_description:line_desc"
+        mock_logger.opt.return_value.log.assert_called_with(
+            "WARNING",
+            "[US-mercedes_benz] Negative Monthly Rental NLP for model_range:range_desc model_description:model_desc line_description:line_desc",
         )
         mock_repository.load_market.assert_called_with(
             date=today_dashed_str_with_key(),
@@ -111,8 +113,9 @@ class TestDataQualityCheckFinances(unittest.TestCase):
             vendor=Vendor.MERCEDES_BENZ, markets=[Market.US]
         )
 
-        mock_logger.warning.assert_called_with(
-            "[US-mercedes_benz] New Line Character Error in Model_Range_Description for model_range:A4 \n Sportsback model_description:model line_description:line"
+        mock_logger.opt.return_value.log.assert_called_with(
+            "WARNING",
+            "[US-mercedes_benz] New Line Character Error in Model_Range_Description for model_range:A4 \n Sportsback model_description:model line_description:line",
         )
         mock_repository.load_market.assert_called_with(
             date=today_dashed_str_with_key(),
@@ -141,8 +144,9 @@ class TestDataQualityCheckFinances(unittest.TestCase):
             vendor=Vendor.MERCEDES_BENZ, markets=[Market.US]
         )
 
-        mock_logger.warning.assert_called_with(
-            "[US-mercedes_benz] New Line Character Error in Model_Description for model_range:model range model_description:A4 \n Avant line_description:line"
+        mock_logger.opt.return_value.log.assert_called_with(
+            "WARNING",
+            "[US-mercedes_benz] New Line Character Error in Model_Description for model_range:model range model_description:A4 \n Avant line_description:line",
         )
         mock_repository.load_market.assert_called_with(
             date=today_dashed_str_with_key(),
@@ -171,8 +175,9 @@ class TestDataQualityCheckFinances(unittest.TestCase):
             vendor=Vendor.MERCEDES_BENZ, markets=[Market.US]
         )
 
-        mock_logger.warning.assert_called_with(
-            "[US-mercedes_benz] New Line Character Error in Line_Description for model_range:model range model_description:model description line_description:A4 \n Sportsback"
+        mock_logger.opt.return_value.log.assert_called_with(
+            "WARNING",
+            "[US-mercedes_benz] New Line Character Error in Line_Description for model_range:model range model_description:model description line_description:A4 \n Sportsback",
         )
         mock_repository.load_market.assert_called_with(
             date=today_dashed_str_with_key(),
@@ -218,13 +223,10 @@ class TestDataQualityCheckFinances(unittest.TestCase):
             vendor=Vendor.AUDI, markets=[Market.DE]
         )
 
-        mock_logger.warning.assert_has_calls(
-            [
-                call("[DE-audi] Duplication of Models Found"),
-                call(
-                    "series # model range code # model range # model code # model # line code # line # type\n"
-                ),
-            ]
+        mock_logger.warning.assert_called_with("[DE-audi] Duplication of Models Found")
+        mock_logger.opt.return_value.log.assert_called_with(
+            "WARNING",
+            "series # model range code # model range # model code # model # line code # line # type\n",
         )
         mock_repository.load_market.assert_called_with(
             date=today_dashed_str_with_key(),
@@ -257,8 +259,9 @@ class TestDataQualityCheckFinances(unittest.TestCase):
             vendor=Vendor.AUDI, markets=[Market.DE]
         )
 
-        mock_logger.warning.assert_called_with(
-            "[DE-audi] No. of Installments Zero for model_range:model range model_description:model line_description:line"
+        mock_logger.opt.return_value.log.assert_called_with(
+            "WARNING",
+            "[DE-audi] No. of Installments Zero for model_range:model range model_description:model line_description:line",
         )
 
     @patch("src.price_monitor.data_quality.data_quality_checks_finance.logger")
@@ -287,8 +290,9 @@ class TestDataQualityCheckFinances(unittest.TestCase):
             vendor=Vendor.AUDI, markets=[Market.DE]
         )
 
-        mock_logger.warning.assert_called_with(
-            "[DE-audi] No. of installments is greater then contract duration for model_range:model range model_description:model line_description:line"
+        mock_logger.opt.return_value.log.assert_called_with(
+            "WARNING",
+            "[DE-audi] No. of installments is greater then contract duration for model_range:model range model_description:model line_description:line",
         )
 
     @patch.object(
@@ -1177,6 +1177,113 @@ class TestLineDiffChecker(unittest.TestCase):
 
         assert actual == expected_price_difference
 
+    def test_create_price_difference_item_merges_reasons_of_a_line_when_its_differences_are_not_adjacent(
+        self,
+    ):
+        line_item1_today = create_test_line_item(
+            model_range_code="model_1",
+            model_code="model_code_1",
+            line_code="audi_cool_model",
+        )
+        line_item2_today = create_test_line_item(
+            model_range_code="model_2",
+            model_code="model_code_2",
+            line_code="audi_model",
+        )
+        list_of_difference_item = [
+            create_difference_line_item(
+                model_range_code="model_1",
+                model_code="model_code_1",
+                line_code="audi_cool_model",
+                old_value="4000.00",
+                new_value="5000.00",
+                reason=DifferenceReason.PRICE_CHANGE,
+            ),
+            create_difference_line_item(
+                model_range_code="model_2",
+                model_code="model_code_2",
+                line_code="audi_model",
+                old_value="3000.00",
+                new_value="2000.00",
+                reason=DifferenceReason.PRICE_CHANGE,
+            ),
+            create_difference_line_item(
+                model_range_code="model_1",
+                model_code="model_code_1",
+                line_code="audi_cool_model",
+                old_value="4000.00/10/10",
+                new_value="5000.00/xyz",
+                reason=DifferenceReason.OPTION_INCLUDED,
+            ),
+        ]
+        expected_price_difference = [
+            create_test_difference_item(
+                line_item=line_item1_today,
+                old_price=4000.0,
+                new_price=5000.00,
+                perc_change="25%",
+                model_price_change=1000.00,
+                reason=PriceDifferenceReason.PRICE_INCREASE_OPTION_INCLUDED,
+                option_code="xyz",
+                option_net_list_price=10.0,
+                option_gross_list_price=10.0,
+            ),
+            create_test_difference_item(
+                line_item=line_item2_today,
+                old_price=3000.0,
+                new_price=2000.00,
+                perc_change="33%",
+                model_price_change=-1000.00,
+                reason=PriceDifferenceReason.PRICE_DECREASE,
+            ),
+        ]
+
+        actual = create_price_difference_item(list_of_difference_item)
+
+        assert actual == expected_price_difference
+
+    def test_create_price_difference_item_does_not_merge_same_line_from_different_markets(
+        self,
+    ):
+        line_item_nl = create_test_line_item(market=Market.NL)
+        line_item_de = create_test_line_item(market=Market.DE)
+        list_of_difference_item = [
+            create_difference_line_item(
+                old_value="4000.00",
+                new_value="5000.00",
+                reason=DifferenceReason.PRICE_CHANGE,
+                market=Market.NL,
+            ),
+            create_difference_line_item(
+                old_value="4000.00",
+                new_value="3000.00",
+                reason=DifferenceReason.PRICE_CHANGE,
+                market=Market.DE,
+            ),
+        ]
+        expected_price_difference = [
+            create_test_difference_item(
+                line_item=line_item_nl,
+                old_price=4000.0,
+                new_price=5000.00,
+                perc_change="25%",
+                model_price_change=1000.00,
+                reason=PriceDifferenceReason.PRICE_INCREASE,
+            ),
+            create_test_difference_item(
+                line_item=line_item_de,
+                old_price=4000.0,
+                new_price=3000.00,
+                perc_change="25%",
+                model_price_change=-1000.00,
+                reason=PriceDifferenceReason.PRICE_DECREASE,
+            ),
+        ]
+
+        actual = create_price_difference_item(list_of_difference_item)
+
+        assert actual == expected_price_difference
+
     def test_difference_with_when_only_option_code_is_changed_then_should_not_detect_as_option_added(
         self,
     ):
@@ -1,5 +1,6 @@
 import json
 import unittest
+from concurrent.futures import Future
 from pathlib import Path
 from test.price_monitor.utils.test_data_builder import (
     create_test_line_item,
@@ -19,6 +20,12 @@ from src.price_monitor.utils.clock import yesterday_dashed_str_with_key
 TEST_DATA_DIR = f"{Path(__file__).parent}/sample"
 
 
+def _resolved(value) -> Future:
+    future = Future()
+    future.set_result(value)
+    return future
+
+
 class TestAudiScraper(unittest.TestCase):
     @patch(
         "src.price_monitor.price_scraper.audi.scraper.AudiScraper._scrape_models_for_market"
@@ -67,13 +74,12 @@ class TestAudiScraper(unittest.TestCase):
         self, mock__find_available_models_link, mock__scrape_models_from_link
     ):
         audi_scraper_config = {"scraper": {"enabled": {Vendor.AUDI: [Market.DE]}}}
-        mock__scrape_models_from_link.side_effect = [
-            [create_test_line_item(line_description="audi_line_item")],
-            [create_test_line_item(line_description="audi_line_item")],
+        mock__scrape_models_from_link.return_value = [
+            create_test_line_item(line_description="audi_line_item")
         ]
         mock__find_available_models_link.return_value = [
             ["/de/brand/de/neuwagen/a5/a5-coupe", "/de/brand/de/neuwagen/a6/a6-avant"],
-            [],
+            ["/de/brand/de/neuwagen/q8/q8-e-tron"],
         ]
         mock_line_item_repository = Mock()
         mock_line_item_repository.load_market.return_value = []
@@ -82,9 +88,10 @@ class TestAudiScraper(unittest.TestCase):
             mock_line_item_repository,
             audi_scraper_config,
         )
-        audi_scraper._scrape_models_for_market(market=Market.DE)
+        line_items = audi_scraper._scrape_models_for_market(market=Market.DE)
 
-        assert mock__scrape_models_from_link.call_count == 2
+        assert mock__scrape_models_from_link.call_count == 3
+        assert len(line_items) == 3
         assert mock__find_available_models_link.call_count == 1
 
     @patch.object(AudiScraper, "_scrape_line_items")
@@ -113,10 +120,14 @@ class TestAudiScraper(unittest.TestCase):
         assert mock__scrape_line_items.call_count == 1
         assert len(parsed_line_items) == 3
 
+    @patch.object(AudiScraper, "get_options_types")
     @patch.object(AudiScraper, "_get_line_item_from_trim_line")
     @patch("src.price_monitor.price_scraper.audi.scraper.execute_request")
     def test__scrape_line_items_when_model_api_is_successful_then_return_latest_line_items(
-        self, mock_execute_request, mock__get_line_item_from_trim_line
+        self,
+        mock_execute_request,
+        mock__get_line_item_from_trim_line,
+        mock_get_options_types,
     ):
         audi_scraper_config = {"scraper": {"enabled": {Vendor.AUDI: [Market.DE]}}}
         mock_session = Mock()
@@ -165,6 +176,7 @@ class TestAudiScraper(unittest.TestCase):
         assert mock_line_item_repository.call_count == 0
         assert mock__get_line_item_from_trim_line.call_count == 4
         assert len(parsed_line_items) == 3
+        mock_get_options_types.assert_called_once_with(carinfo)
 
     @patch.object(AudiScraper, "_load_trim_lines_from_previous_day")
     @patch.object(AudiScraper, "_get_line_item_from_trim_line")
@@ -260,6 +272,7 @@ class TestAudiScraper(unittest.TestCase):
         ]
         mock_line_item_repository = Mock()
         mock__load_previous_day_line_item.return_value = None
+        options_type = _resolved({"1YA": "Wheel"})
         audi_scraper = AudiScraper(
             mock_line_item_repository,
             audi_scraper_config,
@@ -273,6 +286,7 @@ class TestAudiScraper(unittest.TestCase):
             "FR5K043",
             "FR5K043%7C6Y6Y%7CYM",
             {"carinfo": "carinfo"},
+            options_type,
         )
 
         assert mock__load_previous_day_line_item.call_count == 0
@@ -282,6 +296,7 @@ class TestAudiScraper(unittest.TestCase):
             trimline_code="FR5K043",
             trimline_details="test_json_data",
             carinfo={"carinfo": "carinfo"},
+            options_type=options_type,
         )
         mock_parse_model_line_item.assert_called_with(
             model_link="/de/brand/de/neuwagen/a5/a5-coupe",
@@ -317,6 +332,7 @@ class TestAudiScraper(unittest.TestCase):
             "FR5K043",
             "FR5K043%7C6Y6Y%7CYM",
             {"carinfo": "carinfo"},
+            _resolved({}),
         )
 
         mock__load_previous_day_line_item.assert_called_with(
@@ -443,12 +459,10 @@ class TestAudiScraper(unittest.TestCase):
     @patch(
         "src.price_monitor.price_scraper.audi.scraper.parse_line_item_options_for_trimline"
     )
-    @patch.object(AudiScraper, "get_options_types")
     def test_get_line_option_codes_when_able_to_fetch_options_and_their_generic_option_type_then_return_list_of_line_option_codes(
-        self, mock_get_options_types, mock_parse_line_item_options_for_trimline
+        self, mock_parse_line_item_options_for_trimline
     ):
         options_type = {"1YA": "Wheel", "YM": "Metalic Color"}
-        mock_get_options_types.return_value = options_type
         expected_line_option_codes = [
             create_test_line_item_option_code(code="1YA"),
             create_test_line_item_option_code(code="YM"),
@@ -471,14 +485,44 @@ class TestAudiScraper(unittest.TestCase):
             trimline_code="FR45FKF",
             trimline_details="trimline_details",
             carinfo={"items": "line_option_codes"},
+            options_type=_resolved(options_type),
         )
         for actual in actual_line_option_codes:
             assert actual.type == options_type[actual.code]
-        mock_get_options_types.assert_called_with({"items": "line_option_codes"})
         mock_parse_line_item_options_for_trimline.assert_called_with(
             "trimline_details", "line_option_codes", Market.DE
         )
 
+    @patch(
+        "src.price_monitor.price_scraper.audi.scraper.parse_line_item_options_for_trimline"
+    )
+    def test_get_line_option_codes_when_option_types_failed_then_return_line_option_codes_with_their_own_type(
+        self, mock_parse_line_item_options_for_trimline
+    ):
+        expected_line_option_codes = [
+            create_test_line_item_option_code(code="1YA", type="Felgen")
+        ]
+        mock_parse_line_item_options_for_trimline.return_value = (
+            expected_line_option_codes
+        )
+        options_type = Future()
+        options_type.set_exception(ValueError("no data"))
+        audi_scraper = AudiScraper(
+            Mock(), {"scraper": {"enabled": {Vendor.AUDI: [Market.DE]}}}
+        )
+        setattr(audi_scraper, "market", Market.DE)
+
+        actual_line_option_codes = audi_scraper.get_line_option_codes(
+            model_link="de/brand/de/neuwagen/a5/a5-coupe.modelsinfo.mv-0-1733.31.json",
+            trimline_code="FR45FKF",
+            trimline_details="trimline_details",
+            carinfo={"items": "line_option_codes"},
+            options_type=options_type,
+        )
+
+        assert actual_line_option_codes == expected_line_option_codes
+        assert actual_line_option_codes[0].type == "Felgen"
+
     @patch("src.price_monitor.price_scraper.audi.scraper.parse_options_type")
     @patch("src.price_monitor.price_scraper.audi.scraper.get_option_type_details")
     def test_get_options_types_when_api_execute_successful_then_return_dict_of_option_types(
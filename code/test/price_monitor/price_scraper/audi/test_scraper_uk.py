@@ -8,7 +8,10 @@ from unittest.mock import Mock, patch
 from requests import HTTPError
 
 from src.price_monitor.model.vendor import Market, Vendor
-from src.price_monitor.price_scraper.audi.constants import AUDI_UK_CONFIG_URL
+from src.price_monitor.price_scraper.audi.constants import (
+    AUDI_UK_CONFIG_URL,
+    FALLBACK_REQUEST_TIMEOUT_SECONDS,
+)
 from src.price_monitor.price_scraper.audi.scraper import AudiScraper
 from src.price_monitor.price_scraper.audi.scraper_uk import AudiScraperUK
 from src.price_monitor.utils.clock import (
@@ -119,6 +122,35 @@ class TestAudiUKScraper(unittest.TestCase):
         mock_scrape_models_from_model_range.assert_called_with("a4/a4-limousine")
         assert len(actual_line_items) == 1
 
+    @patch.object(AudiScraperUK, "_scrape_models_from_model_range")
+    @patch(
+        "src.price_monitor.price_scraper.audi.scraper_uk.parse_available_model_range_links"
+    )
+    @patch("src.price_monitor.price_scraper.audi.scraper_uk.execute_request")
+    def test_scrape_models_for_uk_saves_the_unchanged_request_fallbacks_again(
+        self,
+        mock_execute_request,
+        mock_parse_available_model_range_links,
+        mock_scrape_models_from_model_range,
+    ):
+        learned = {"a4/a4-limousine": {"main_id": {"trimline": "sport"}}}
+        mock_request_fallback_repository = Mock()
+        mock_request_fallback_repository.load.return_value = learned
+        mock_parse_available_model_range_links.return_value = ["a4/a4-limousine"]
+        mock_scrape_models_from_model_range.return_value = []
+
+        scraper = AudiScraperUK(
+            line_item_repository=Mock(),
+            session=Mock(),
+            config={},
+            request_fallback_repository=mock_request_fallback_repository,
+        )
+        scraper.scrape_models_for_uk()
+
+        mock_request_fallback_repository.save.assert_called_once_with(
+            Vendor.AUDI, Market.UK, learned
+        )
+
     list_test_line_item = [
         create_test_line_item(
             line_option_codes=[
@@ -151,9 +183,13 @@ class TestAudiUKScraper(unittest.TestCase):
 
     @patch("src.price_monitor.price_scraper.audi.scraper_uk.parse_model_line_item")
     @patch("src.price_monitor.price_scraper.audi.scraper_uk.parse_line_option_codes")
-    @patch("src.price_monitor.price_scraper.audi.scraper_uk.execute_request")
+    @patch("src.price_monitor.price_scraper.audi.trimline_resolver.execute_request")
+    @patch(
+        "src.price_monitor.price_scraper.audi.trimline_resolver.execute_request_once"
+    )
     def test__get_line_items_for_model_when_response_does_not_contain_prices_but_contains_choice_ids_executes_new_request_and_returns_models_data(
         self,
+        mock_execute_request_once,
         mock_execute_request,
         mock_parse_line_option_codes,
         mock_parse_model_line_item,
@@ -182,6 +218,10 @@ class TestAudiUKScraper(unittest.TestCase):
             "configuration": {},
             "conflicts": {"choiceIds": {}, "prstring": "parameter_test"},
         }
+        mock_execute_request_once.side_effect = [
+            {"configuration": {}},
+            {"configuration": {"prices": {}}},
+        ]
         mock_parse_model_line_item.return_value = create_test_line_item(
             recorded_at=today_dashed_str(),
             vendor=Vendor.AUDI,
@@ -220,16 +260,25 @@ class TestAudiUKScraper(unittest.TestCase):
             )
         ]
 
-        mock_execute_request.assert_called_with(
+        mock_execute_request_once.assert_called_with(
             "get",
             AUDI_UK_CONFIG_URL,
             mock_session,
             body={"ids": "parameter_test", "action": "accept"},
+            timeout=FALLBACK_REQUEST_TIMEOUT_SECONDS,
         )
+        assert scraper.trimline_resolver.learned == {
+            test_link: {
+                "audi_line_item_for_model_1": {
+                    "ids": "parameter_test",
+                    "action": "accept",
+                }
+            }
+        }
 
     @patch("src.price_monitor.price_scraper.audi.scraper_uk.parse_model_line_item")
     @patch("src.price_monitor.price_scraper.audi.scraper_uk.parse_line_option_codes")
-    @patch("src.price_monitor.price_scraper.audi.scraper_uk.execute_request")
+    @patch("src.price_monitor.price_scraper.audi.trimline_resolver.execute_request")
     def test__get_line_items_for_model_when_response_contains_prices_returns_models_data(
         self,
         mock_execute_request,
@@ -313,7 +362,7 @@ class TestAudiUKScraper(unittest.TestCase):
 
     @patch("src.price_monitor.price_scraper.audi.scraper_uk.parse_model_line_item")
     @patch("src.price_monitor.price_scraper.audi.scraper_uk.parse_line_option_codes")
-    @patch("src.price_monitor.price_scraper.audi.scraper_uk.execute_request")
+    @patch("src.price_monitor.price_scraper.audi.trimline_resolver.execute_request")
     def test__get_line_items_for_model_when_response_does_not_contains_prices_neither_choices_returns_empty_models_data(
         self,
         mock_execute_request,
@@ -352,7 +401,7 @@ class TestAudiUKScraper(unittest.TestCase):
 
     @patch("src.price_monitor.price_scraper.audi.scraper_uk.parse_model_line_item")
     @patch("src.price_monitor.price_scraper.audi.scraper_uk.parse_line_option_codes")
-    @patch("src.price_monitor.price_scraper.audi.scraper_uk.execute_request")
+    @patch("src.price_monitor.price_scraper.audi.trimline_resolver.execute_request")
     def test__get_line_items_for_model_when_response_contains_empty_prices_and_empty_choices_returns_empty_models_data(
         self,
         mock_execute_request,
@@ -391,7 +440,7 @@ class TestAudiUKScraper(unittest.TestCase):
         mock_execute_request.assert_called_once()
 
     @patch("src.price_monitor.price_scraper.audi.scraper_uk.parse_line_option_codes")
-    @patch("src.price_monitor.price_scraper.audi.scraper_uk.execute_request")
+    @patch("src.price_monitor.price_scraper.audi.trimline_resolver.execute_request")
     def test__get_line_items_for_model_when_execute_request_throws_http_error_then_previous_day_data_should_load(
         self,
         mock_execute_request,
@@ -11,7 +11,10 @@ from src.price_monitor.model.vendor import Market, Vendor
 from src.price_monitor.repository.line_item_repository import (
     FileSystemLineItemRepository,
 )
-from src.price_monitor.price_scraper.audi.constants import AUDI_USA_CONFIG_URL
+from src.price_monitor.price_scraper.audi.constants import (
+    AUDI_USA_CONFIG_URL,
+    FALLBACK_REQUEST_TIMEOUT_SECONDS,
+)
 from src.price_monitor.price_scraper.audi.scraper import AudiScraper
 from src.price_monitor.price_scraper.audi.scraper_usa import AudiScraperUSA
 from src.price_monitor.utils.clock import (
@@ -157,9 +160,13 @@ class TestAudiUSAScraper(unittest.TestCase):
 
     @patch("src.price_monitor.price_scraper.audi.scraper_usa.parse_model_line_item")
     @patch("src.price_monitor.price_scraper.audi.scraper_usa.parse_line_option_codes")
-    @patch("src.price_monitor.price_scraper.audi.scraper_usa.execute_request")
+    @patch("src.price_monitor.price_scraper.audi.trimline_resolver.execute_request")
+    @patch(
+        "src.price_monitor.price_scraper.audi.trimline_resolver.execute_request_once"
+    )
     def test__get_line_items_for_model_when_response_does_not_contain_prices_but_contains_choice_ids_executes_new_request_and_returns_models_data(
         self,
+        mock_execute_request_once,
         mock_execute_request,
         mock_parse_line_option_codes,
         mock_parse_model_line_item,
@@ -186,6 +193,10 @@ class TestAudiUSAScraper(unittest.TestCase):
             "configuration": {},
             "conflicts": {"choiceIds": {}, "prstring": "parameter_test"},
         }
+        mock_execute_request_once.side_effect = [
+            {"configuration": {}},
+            {"configuration": {"prices": {}}},
+        ]
         mock_parse_model_line_item.return_value = create_test_line_item(
             recorded_at=today_dashed_str(),
             vendor=Vendor.AUDI,
@@ -224,16 +235,25 @@ class TestAudiUSAScraper(unittest.TestCase):
             )
         ]
 
-        mock_execute_request.assert_called_with(
+        mock_execute_request_once.assert_called_with(
             "get",
             AUDI_USA_CONFIG_URL,
             mock_session,
             body={"ids": "parameter_test", "action": "accept"},
+            timeout=FALLBACK_REQUEST_TIMEOUT_SECONDS,
         )
+        assert scraper.trimline_resolver.learned == {
+            test_link: {
+                "audi_line_item_for_model_1": {
+                    "ids": "parameter_test",
+                    "action": "accept",
+                }
+            }
+        }
 
     @patch("src.price_monitor.price_scraper.audi.scraper_usa.parse_model_line_item")
     @patch("src.price_monitor.price_scraper.audi.scraper_usa.parse_line_option_codes")
-    @patch("src.price_monitor.price_scraper.audi.scraper_usa.execute_request")
+    @patch("src.price_monitor.price_scraper.audi.trimline_resolver.execute_request")
     def test__get_line_items_for_model_when_response_contains_prices_returns_models_data(
         self,
         mock_execute_request,
@@ -315,7 +335,7 @@ class TestAudiUSAScraper(unittest.TestCase):
 
     @patch("src.price_monitor.price_scraper.audi.scraper_usa.parse_model_line_item")
     @patch("src.price_monitor.price_scraper.audi.scraper_usa.parse_line_option_codes")
-    @patch("src.price_monitor.price_scraper.audi.scraper_usa.execute_request")
+    @patch("src.price_monitor.price_scraper.audi.trimline_resolver.execute_request")
     def test__get_line_items_for_model_when_response_does_not_contains_prices_neither_choices_returns_empty_models_data(
         self,
         mock_execute_request,
@@ -352,7 +372,7 @@ class TestAudiUSAScraper(unittest.TestCase):
 
     @patch("src.price_monitor.price_scraper.audi.scraper_usa.parse_model_line_item")
     @patch("src.price_monitor.price_scraper.audi.scraper_usa.parse_line_option_codes")
-    @patch("src.price_monitor.price_scraper.audi.scraper_usa.execute_request")
+    @patch("src.price_monitor.price_scraper.audi.trimline_resolver.execute_request")
     def test__get_line_items_for_model_when_response_contains_empty_prices_and_empty_choices_returns_empty_models_data(
         self,
         mock_execute_request,
@@ -389,7 +409,7 @@ class TestAudiUSAScraper(unittest.TestCase):
         mock_execute_request.assert_called_once()
 
     @patch("src.price_monitor.price_scraper.audi.scraper_usa.parse_line_option_codes")
-    @patch("src.price_monitor.price_scraper.audi.scraper_usa.execute_request")
+    @patch("src.price_monitor.price_scraper.audi.trimline_resolver.execute_request")
     def test__get_line_items_for_model_when_execute_request_throws_http_error_then_previous_day_data_should_load(
         self,
         mock_execute_request,
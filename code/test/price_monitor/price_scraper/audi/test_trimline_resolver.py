@@ -0,0 +1,98 @@
+from unittest.mock import Mock, patch
+
+import pytest
+from assertpy import assert_that
+from requests import Timeout
+
+from src.price_monitor.price_scraper.audi.constants import (
+    AUDI_UK_CONFIG_URL,
+    FALLBACK_REQUEST_TIMEOUT_SECONDS,
+)
+from src.price_monitor.price_scraper.audi.trimline_resolver import (
+    TrimlineConfigResolver,
+)
+
+PRICED = {"configuration": {"prices": {"total": 10000}}}
+CONFLICTS = {"configuration": {}, "conflicts": {"choiceIds": {}, "prstring": "pr"}}
+ACCEPT = {"ids": "pr", "action": "accept"}
+
+
+@patch("src.price_monitor.price_scraper.audi.trimline_resolver.execute_request_once")
+@patch("src.price_monitor.price_scraper.audi.trimline_resolver.execute_request")
+def test_resolve_returns_configuration_without_fallback_when_it_has_prices(
+    mock_execute_request, mock_execute_request_once
+):
+    mock_execute_request.return_value = PRICED
+    resolver = TrimlineConfigResolver(AUDI_UK_CONFIG_URL, Mock())
+
+    assert_that(resolver.resolve("q8", "main", "trim")).is_equal_to(PRICED)
+    mock_execute_request_once.assert_not_called()
+    assert_that(resolver.changed).is_false()
+
+
+@patch("src.price_monitor.price_scraper.audi.trimline_resolver.execute_request_once")
+@patch("src.price_monitor.price_scraper.audi.trimline_resolver.execute_request")
+def test_resolve_sends_fallbacks_once_and_learns_the_one_answering(
+    mock_execute_request, mock_execute_request_once
+):
+    session = Mock()
+    mock_execute_request.return_value = CONFLICTS
+    mock_execute_request_once.side_effect = [Timeout(), PRICED]
+    resolver = TrimlineConfigResolver(AUDI_UK_CONFIG_URL, session)
+
+    assert_that(resolver.resolve("q8", "main", "trim")).is_equal_to(PRICED)
+    assert_that(mock_execute_request_once.call_count).is_equal_to(2)
+    mock_execute_request_once.assert_called_with(
+        "get",
+        AUDI_UK_CONFIG_URL,
+        session,
+        body=ACCEPT,
+        timeout=FALLBACK_REQUEST_TIMEOUT_SECONDS,
+    )
+    assert_that(resolver.learned).is_equal_to({"q8": {"trim": ACCEPT}})
+    assert_that(resolver.changed).is_true()
+
+
+@patch("src.price_monitor.price_scraper.audi.trimline_resolver.execute_request_once")
+@patch("src.price_monitor.price_scraper.audi.trimline_resolver.execute_request")
+def test_resolve_sends_learned_fallback_first(
+    mock_execute_request, mock_execute_request_once
+):
+    mock_execute_request_once.return_value = PRICED
+    resolver = TrimlineConfigResolver(
+        AUDI_UK_CONFIG_URL, Mock(), {"q8": {"trim": ACCEPT}}
+    )
+
+    assert_that(resolver.resolve("q8", "main", "trim")).is_equal_to(PRICED)
+    mock_execute_request.assert_not_called()
+    assert_that(resolver.changed).is_false()
+
+
+@patch("src.price_monitor.price_scraper.audi.trimline_resolver.execute_request_once")
+@patch("src.price_monitor.price_scraper.audi.trimline_resolver.execute_request")
+def test_resolve_forgets_learned_fallback_when_it_no_longer_answers(
+    mock_execute_request, mock_execute_request_once
+):
+    mock_execute_request_once.return_value = {"configuration": {}}
+    mock_execute_request.return_value = PRICED
+    resolver = TrimlineConfigResolver(
+        AUDI_UK_CONFIG_URL, Mock(), {"q8": {"trim": ACCEPT}}
+    )
+
+    assert_that(resolver.resolve("q8", "main", "trim")).is_equal_to(PRICED)
+    assert_that(resolver.learned).is_empty()
+    assert_that(resolver.changed).is_true()
+
+
+@patch("src.price_monitor.price_scraper.audi.trimline_resolver.execute_request_once")
+@patch("src.price_monitor.price_scraper.audi.trimline_resolver.execute_request")
+def test_resolve_raises_when_no_fallback_answers(
+    mock_execute_request, mock_execute_request_once
+):
+    mock_execute_request.return_value = CONFLICTS
+    mock_execute_request_once.return_value = {"configuration": {}}
+    resolver = TrimlineConfigResolver(AUDI_UK_CONFIG_URL, Mock())
+
+    with pytest.raises(ValueError):
+        resolver.resolve("q8", "main", "trim")
+    assert_that(resolver.changed).is_false()
@@ -0,0 +1,96 @@
+from test.price_monitor.utils.test_data_builder import create_test_line_item_option_code
+from unittest.mock import Mock, patch
+
+from assertpy import assert_that
+from requests import HTTPError
+
+from src.price_monitor.price_scraper.bmw.constants import USA_MODEL_CONFIGURATION_URL
+from src.price_monitor.price_scraper.bmw.constructibility_usa import (
+    USAConstructibilityEngine,
+)
+
+MODEL_DETAILS = {"cmId": "base_key", "model": {"code": "37AA"}}
+# The option P337A requires the line S0ZSP
+ADDED_ITEMS = {"P337A": {"S0ZSP": {}, "P337A": {}}}
+
+
+def _fake_configurator(start_fails=False):
+    calls = []
+
+    def execute_request(method, url, session=None):
+        calls.append((method, url))
+        path = url.removeprefix(f"{USA_MODEL_CONFIGURATION_URL}/")
+        if path.startswith("start/"):
+            if start_fails:
+                raise HTTPError()
+            return {"cmId": f"key_{len([c for c in calls if 'start/' in c[1]])}"}
+        option_code = path.split("/")[1]
+        if method == "put" and option_code in ADDED_ITEMS:
+            return {
+                "configuration": {"changeInfo": {"addItems": ADDED_ITEMS[option_code]}}
+            }
+        return {"configuration": {}}
+
+    return execute_request, calls
+
+
+def _options(count):
+    return [
+        create_test_line_item_option_code(code=f"P{index}") for index in range(count)
+    ]
+
+
+@patch("src.price_monitor.price_scraper.bmw.constructibility_usa.execute_request")
+def test_get_constructible_options_shards_options_across_configurator_sessions(
+    mock_execute_request,
+):
+    mock_execute_request.side_effect, calls = _fake_configurator()
+    options = _options(39) + [create_test_line_item_option_code(code="P337A")]
+    engine = USAConstructibilityEngine(MODEL_DETAILS, Mock(), max_sessions=4)
+
+    result = engine.get_constructible_options("S0ZBM", ["S0ZSP"], options)
+
+    assert_that(result).is_equal_to(options[:-1])
+    assert_that([model_key for model_key, _ in engine.sessions]).is_equal_to(
+        ["base_key", "key_1", "key_2", "key_3"]
+    )
+    put_calls = [url for method, url in calls if method == "put"]
+    assert_that(put_calls).is_length(40)
+    for model_key, _ in engine.sessions:
+        assert_that([url for url in put_calls if f"/{model_key}/" in url]).is_length(10)
+    assert_that(engine.round_trips).is_equal_to(3 + 40 * 2)
+
+
+@patch("src.price_monitor.price_scraper.bmw.constructibility_usa.execute_request")
+def test_get_constructible_options_reuses_option_responses_for_other_lines(
+    mock_execute_request,
+):
+    mock_execute_request.side_effect, calls = _fake_configurator()
+    options = _options(3) + [create_test_line_item_option_code(code="P337A")]
+    engine = USAConstructibilityEngine(MODEL_DETAILS, Mock())
+
+    first_line = engine.get_constructible_options("S0ZBM", ["S0ZSP"], options)
+    second_line = engine.get_constructible_options("S0ZSP", ["S0ZBM"], options)
+
+    assert_that(first_line).is_equal_to(options[:-1])
+    assert_that(second_line).is_equal_to(options)
+    assert_that([method for method, _ in calls].count("put")).is_equal_to(4)
+    assert_that(engine.round_trips_saved).is_equal_to(8)
+    assert_that(engine.results).contains_key(("37AA", "S0ZSP", "P337A"))
+
+
+@patch("src.price_monitor.price_scraper.bmw.constructibility_usa.execute_request")
+def test_get_constructible_options_uses_base_session_when_no_other_session_can_be_opened(
+    mock_execute_request,
+):
+    mock_execute_request.side_effect, calls = _fake_configurator(start_fails=True)
+    options = _options(30)
+    engine = USAConstructibilityEngine(MODEL_DETAILS, Mock())
+
+    result = engine.get_constructible_options("S0ZBM", [], options)
+
+    assert_that(result).is_equal_to(options)
+    assert_that(engine.sessions).is_length(1)
+    assert_that(
+        [url for method, url in calls if method == "put" and "/base_key/" in url]
+    ).is_length(30)
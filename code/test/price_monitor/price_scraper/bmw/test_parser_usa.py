@@ -9,6 +9,7 @@ from src.price_monitor.price_scraper.bmw.parser_usa import (
     extract_line_item,
     extract_price,
     generate_line_item_options,
+    parse_added_items,
     parse_all_available_options,
     parse_extra_designs_list,
     parse_is_option_constructible,
@@ -723,3 +724,10 @@ def test_generated_line_item_options_filters_options_with_word_deletion_in_descr
             predicted_category="",
         )
     ]
+
+
+def test_parse_added_items_returns_empty_set_when_there_is_no_change_info():
+    assert parse_added_items({"configuration": {}}) == frozenset()
+    assert parse_added_items(
+        {"configuration": {"changeInfo": {"addItems": {"S0ZSP": {}}}}}
+    ) == frozenset({"S0ZSP"})
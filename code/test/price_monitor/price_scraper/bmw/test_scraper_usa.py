@@ -150,7 +150,7 @@ class TestBMWScraperUsa(unittest.TestCase):
         )
 
         mock_get_line_options.assert_called_with(
-            {}, model_details, model_key, mock_session
+            {}, model_details, model_key, mock_session, None, line_item.line_code
         )
 
     @patch("src.price_monitor.price_scraper.bmw.scraper_usa.get_line_options")
@@ -15,11 +15,13 @@ from src.price_monitor.price_scraper.mercedes_benz.parser import (
     build_model_range_description,
     get_option_codes,
     parse_available_models_links,
+    parse_component_table,
     parse_engine_performance_kw_and_hp,
     parse_line_item,
     parse_line_options,
     parse_trim_line,
     parse_trim_line_codes,
+    slice_line_options,
     split_engine_performance,
 )
 from src.price_monitor.utils.clock import today_dashed_str
@@ -488,6 +490,57 @@ class TestMBParser(unittest.TestCase):
         actual_line_option = parse_line_options(True, data, False, "Progressive")
         assert expected_line_option == actual_line_option
 
+    def test_component_table_is_sliced_into_the_options_of_each_line(self):
+        with open(f"{TEST_DATA_DIR}/OPTIONS.json", "r") as payload:
+            data = json.load(payload)
+        component_table = parse_component_table(True, data)
+
+        for is_line_basic, line_description in [
+            (True, "BASIC LINE"),
+            (False, "Progressive"),
+            (False, "AMG Line"),
+        ]:
+            assert slice_line_options(
+                component_table, is_line_basic, line_description
+            ) == parse_line_options(True, data, is_line_basic, line_description)
+        assert "PC-PYF" not in component_table.components
+
+    def test_parse_line_options_of_trim_line_skips_components_of_the_lines(self):
+        data = {
+            "componentCategories": [
+                {
+                    "subcategories": [
+                        {
+                            "subcategories": [
+                                {"id": "ZK096", "componentIds": ["SA-226"]},
+                                {"id": "ZK001", "componentIds": ["SA-256"]},
+                            ]
+                        }
+                    ]
+                }
+            ],
+            "components": {
+                "SA-256": {
+                    "id": "SA-256",
+                    "name": "AMG TRACK PACE",
+                    "path": ["MULTIMEDIA_SAFETY", "MULTIMEDIA", "DISPLAY"],
+                    "selected": True,
+                    "price": {"netPrice": 0.0, "price": 0.0, "currencyISO": "EUR"},
+                }
+            },
+        }
+
+        expected_line_options = [
+            create_test_line_item_option_code(
+                code="SA-256",
+                description="AMG TRACK PACE",
+                type="MULTIMEDIA_SAFETY, MULTIMEDIA, DISPLAY",
+            )
+        ]
+        assert expected_line_options == parse_line_options(
+            True, data, False, "Progressive"
+        )
+
     @patch("src.price_monitor.price_scraper.mercedes_benz.parser.get_option_codes")
     def test_parse_line_options_does_not_return_option_when_path_type_length_is_less_than_or_equal_to_zero(
         self,
@@ -0,0 +1,49 @@
+import time
+from pathlib import Path
+
+from src.price_monitor.model.vendor import Market
+from src.price_monitor.price_scraper.tesla.parser import (
+    parse_lexicon,
+    parse_trim_line_items,
+)
+
+SAMPLE_DIR = Path(__file__).parent / "sample"
+MODEL_PAGES = ["model3_de.html", "modelx_de.html", "modely_de.html"]
+MARKETS = [Market.DE, Market.FR, Market.UK, Market.US]
+
+
+def _per_call_ms(function, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def benchmark_model_page(model_page: str, repeat: int = 20) -> dict[str, float]:
+    """
+    Milliseconds spent per call parsing the lexicon of a captured model page, and parsing the line items
+    of all its trims from the lexicon for every market, as the price and finance scrapers do.
+    """
+    lexicon = parse_lexicon(model_page)
+    return {
+        "lexicon_ms": _per_call_ms(lambda: parse_lexicon(model_page), repeat),
+        "trims_ms": _per_call_ms(
+            lambda: [parse_trim_line_items(lexicon, market) for market in MARKETS],
+            repeat,
+        ),
+        "trims": len(lexicon.trim_codes),
+        "options": len(lexicon.options),
+    }
+
+
+if __name__ == "__main__":
+    # python -m test.price_monitor.price_scraper.tesla.parser_benchmark
+    print(
+        f"{'model page':<18}{'trims':>6}{'options':>9}{'lexicon ms':>12}{'trims ms':>10}"
+    )
+    for model_page_file in MODEL_PAGES:
+        result = benchmark_model_page((SAMPLE_DIR / model_page_file).read_text())
+        print(
+            f"{model_page_file:<18}{result['trims']:>6}{result['options']:>9}"
+            f"{result['lexicon_ms']:>12.2f}{result['trims_ms']:>10.2f}"
+        )
@@ -7,8 +7,10 @@ from src.price_monitor.model.vendor import Market, Vendor
 from src.price_monitor.repository.line_item_repository import LineItem
 from src.price_monitor.price_scraper.tesla.parser import (
     adjust_otr_price,
+    _get_tesla_object,
     get_line_description,
     parse_available_models_links,
+    parse_lexicon,
     parse_line_items,
     parse_model_and_series,
     parse_otr_price,
@@ -1861,6 +1863,27 @@ def test_parse_available_options_for_model():
             assert item == expected_line_item
 
 
+def test_parse_lexicon_maps_every_option_to_the_first_group_listing_it():
+    for model_page_file in ["model3_de.html", "modelx_de.html", "modely_de.html"]:
+        with open(f"{TEST_DATA_DIR}/{model_page_file}", "r") as payload:
+            model_page = payload.read()
+        dss_services = _get_tesla_object(model_page)["DSServices"]
+        groups = dss_services[dss_services["KeyManager"]["keys"]["Lexicon"][0]["key"]][
+            "groups"
+        ]
+
+        option_groups = parse_lexicon(model_page).option_groups
+
+        for option_code, group_code in option_groups.items():
+            first_group = next(
+                group for group in groups if option_code in group["options"]
+            )
+            assert group_code == str(first_group["code"])
+        assert set(option_groups) == {
+            option_code for group in groups for option_code in group["options"]
+        }
+
+
 def test_new_line_characters_remove_from_option_description():
     with open(f"{TEST_DATA_DIR}/modelx_de.html", "r") as payload:
         for item in parse_line_items(payload.read(), Market.DE):
@@ -56,11 +56,16 @@ class TestTeslaScraper(unittest.TestCase):
 
         assert expected_result == actual_line_item
 
+    @patch("src.price_monitor.price_scraper.tesla.scraper.parse_lexicon")
     @patch("src.price_monitor.price_scraper.tesla.scraper.get_otr_prices_for_model")
-    @patch("src.price_monitor.price_scraper.tesla.scraper.parse_line_items")
+    @patch("src.price_monitor.price_scraper.tesla.scraper.parse_trim_line_items")
     @patch("src.price_monitor.price_scraper.tesla.scraper.selenium_execute_request")
-    def test__scrape_model_calls_parser_with_model_page_from_the_url_call(
-        self, mock_execute_request, mock_parse_line_items, mock_get_otr_prices_for_model
+    def test__scrape_model_calls_parser_with_lexicon_of_the_model_page_from_the_url_call(
+        self,
+        mock_execute_request,
+        mock_parse_line_items,
+        mock_get_otr_prices_for_model,
+        mock_parse_lexicon,
     ):
         # ASSEMBLE
         expected_scraped_model = [create_test_line_item(series="Tesla_best_series")]
@@ -81,19 +86,25 @@ class TestTeslaScraper(unittest.TestCase):
         actual_scraped_model = tesla_scraper._scrape_model("model_a")
 
         # ASSERT
+        mock_parse_lexicon.assert_called_with("Model Tesla Best You've Ever Seen")
         mock_parse_line_items.assert_called_with(
-            "Model Tesla Best You've Ever Seen", Market.DE
+            mock_parse_lexicon.return_value, Market.DE
         )
         assert actual_scraped_model == expected_scraped_model
 
+    @patch("src.price_monitor.price_scraper.tesla.scraper.parse_lexicon")
     @patch(
-        "src.price_monitor.price_scraper.tesla.scraper.parse_line_items",
+        "src.price_monitor.price_scraper.tesla.scraper.parse_trim_line_items",
         return_value=[create_test_line_item(series="Tesla_best_series")],
     )
     @patch("src.price_monitor.price_scraper.tesla.scraper.get_otr_prices_for_model")
     @patch("src.price_monitor.price_scraper.tesla.scraper.selenium_execute_request")
     def test__scrape_model_calls_url_with_the_model(
-        self, mock_execute_request, mock_parse_line_items, mock_get_otr_prices_for_model
+        self,
+        mock_execute_request,
+        mock_parse_line_items,
+        mock_get_otr_prices_for_model,
+        mock_parse_lexicon,
     ):
         # ASSEMBLE
         mock_session = Mock()
@@ -241,11 +252,16 @@ class TestTeslaScraper(unittest.TestCase):
             series="mx",
         )
 
+    @patch("src.price_monitor.price_scraper.tesla.scraper.parse_lexicon")
     @patch("src.price_monitor.price_scraper.tesla.scraper.get_otr_prices_for_model")
-    @patch("src.price_monitor.price_scraper.tesla.scraper.parse_line_items")
+    @patch("src.price_monitor.price_scraper.tesla.scraper.parse_trim_line_items")
     @patch("src.price_monitor.price_scraper.tesla.scraper.selenium_execute_request")
     def test__scrape_model_should_scrape_otr_prices(
-        self, mock_execute_request, mock_parse_line_items, mock_get_otr_prices_for_model
+        self,
+        mock_execute_request,
+        mock_parse_line_items,
+        mock_get_otr_prices_for_model,
+        mock_parse_lexicon,
     ):
         # ASSEMBLE
         expected_scraped_model = create_test_line_item(
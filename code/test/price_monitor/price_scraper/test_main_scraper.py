@@ -1,6 +1,6 @@
 import json
 import os
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future
 from pathlib import Path
 from test.price_monitor.utils.test_data_builder import create_test_line_item
 from unittest.mock import Mock, call, patch
@@ -16,18 +16,19 @@ from src.price_monitor.price_scraper.main_scraper import (
 )
 from src.price_monitor.price_scraper.tesla.scraper import TeslaScraper
 from src.price_monitor.price_scraper.vendor_scraper import VendorScraper
+from src.price_monitor.utils.scheduler import TaskScheduler
 
 line_item = create_test_line_item()
 
 
-@patch.object(target=ThreadPoolExecutor, attribute="submit")
-def test_scrape_saves_scraped_line_items(mock_thread_pool):
+@patch.object(target=TaskScheduler, attribute="submit")
+def test_scrape_saves_scraped_line_items(mock_submit):
     line_item_repository_mock = Mock()
     line_item_repository_mock.load.return_value = []
 
-    mock_job = Mock()
-    mock_thread_pool.return_value = mock_job
-    mock_job.result.return_value = [line_item]
+    job = Future()
+    job.set_result([line_item])
+    mock_submit.return_value = job
 
     config = {
         "output": {"directory": "", "prices_filename": ""},
@@ -164,3 +165,34 @@ def test_scrape_when_some_line_items_are_already_present_then_repository_should_
         [create_test_line_item(vendor=Vendor.AUDI)],
         config,
     )
+
+
+@patch("src.price_monitor.price_scraper.main_scraper.FileSystemCheckpointRepository")
+@patch("src.price_monitor.price_scraper.main_scraper._start_scraper_jobs")
+def test_scrape_clears_previous_checkpoints_unless_resuming(
+    mock_scraper_jobs, mock_checkpoint_repository
+):
+    line_item_repository_mock = Mock()
+    line_item_repository_mock.load.return_value = []
+    mock_scraper_jobs.return_value = [line_item]
+    config = {
+        "output": {"directory": "", "prices_filename": ""},
+        "scraper": {"enabled": {"audi": ["DE"]}},
+    }
+
+    scrape(config, line_item_repository_mock)
+    assert mock_checkpoint_repository.return_value.clear.call_count == 2
+
+    mock_checkpoint_repository.reset_mock()
+    scrape(config, line_item_repository_mock, resume=True)
+    assert mock_checkpoint_repository.return_value.clear.call_count == 1
+
+
+def test_init_scrapers_sets_the_checkpoint_repository_on_each_scraper():
+    checkpoint_repository = Mock()
+    scrapers_config = {"scraper": {"enabled": {Vendor.BMW: [Market.DE]}}}
+
+    scrapers = _init_scrapers(scrapers_config, (), checkpoint_repository)
+
+    assert scrapers[0].checkpoint_repository == checkpoint_repository
+    assert scrapers[0].vendor == Vendor.BMW
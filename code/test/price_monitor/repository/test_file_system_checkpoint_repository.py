@@ -0,0 +1,64 @@
+from test.price_monitor.builder.line_item_builder import LineItemBuilder
+from test.price_monitor.utils.test_data_builder import assert_line_items_list
+
+from assertpy import assert_that
+
+from src.price_monitor.model.vendor import Market, Vendor
+from src.price_monitor.repository.checkpoint_repository import (
+    FileSystemCheckpointRepository,
+)
+
+
+def _create_checkpoint_repository(directory) -> FileSystemCheckpointRepository:
+    return FileSystemCheckpointRepository(
+        config={"output": {"directory": str(directory), "prices_filename": "prices"}}
+    )
+
+
+def test_load_returns_none_when_no_checkpoint_exists(tmp_path):
+    checkpoint_repository = _create_checkpoint_repository(tmp_path)
+
+    assert_that(checkpoint_repository.load(Vendor.BMW, Market.DE)).is_none()
+
+
+def test_save_then_load_returns_checkpointed_line_items_of_the_partition(tmp_path):
+    checkpoint_repository = _create_checkpoint_repository(tmp_path)
+    bmw_de = [LineItemBuilder().with_vendor(Vendor.BMW).with_market(Market.DE).build()]
+    bmw_uk = [LineItemBuilder().with_vendor(Vendor.BMW).with_market(Market.UK).build()]
+
+    checkpoint_repository.save(Vendor.BMW, Market.DE, bmw_de)
+    checkpoint_repository.save(Vendor.BMW, Market.UK, bmw_uk)
+
+    assert_line_items_list(bmw_de, checkpoint_repository.load(Vendor.BMW, Market.DE))
+    assert_line_items_list(bmw_uk, checkpoint_repository.load(Vendor.BMW, Market.UK))
+    assert_that(checkpoint_repository.load(Vendor.AUDI, Market.DE)).is_none()
+
+
+def test_load_returns_empty_list_when_an_empty_partition_was_checkpointed(tmp_path):
+    checkpoint_repository = _create_checkpoint_repository(tmp_path)
+
+    checkpoint_repository.save(Vendor.TESLA, Market.NL, [])
+
+    assert_that(checkpoint_repository.load(Vendor.TESLA, Market.NL)).is_empty()
+
+
+def test_checkpoints_are_written_outside_the_dated_output_folder(tmp_path):
+    checkpoint_repository = _create_checkpoint_repository(tmp_path)
+
+    checkpoint_repository.save(Vendor.TESLA, Market.NL, [])
+
+    assert_that(checkpoint_repository.target_dir).starts_with(
+        f"{tmp_path}/checkpoints/date="
+    )
+    assert_that(list((tmp_path / "checkpoints").glob("*/*.tmp"))).is_empty()
+
+
+def test_clear_removes_all_checkpoints(tmp_path):
+    checkpoint_repository = _create_checkpoint_repository(tmp_path)
+    checkpoint_repository.save(Vendor.TESLA, Market.NL, [])
+    checkpoint_repository.save(Vendor.AUDI, Market.DE, [])
+
+    checkpoint_repository.clear()
+
+    assert_that(checkpoint_repository.load(Vendor.TESLA, Market.NL)).is_none()
+    assert_that(checkpoint_repository.load(Vendor.AUDI, Market.DE)).is_none()
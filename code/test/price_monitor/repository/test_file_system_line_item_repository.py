@@ -1,6 +1,7 @@
 import glob
 import os
 from pathlib import Path
+from unittest.mock import patch
 from test.price_monitor.builder.line_item_builder import LineItemBuilder
 from assertpy import assert_that
 import pytest
@@ -765,3 +766,23 @@ def test_update_line_items_when_data_is_not_present_for_that_market_then_data_sh
     actual_line_items = line_item_repository.load(date=today_dashed_str_with_key())
 
     assert expected_line_items == actual_line_items
+
+
+def test_load_market_for_today_uses_saved_snapshot():
+    config = {
+        "output": {
+            "directory": TEST_DATA_DIR,
+            "prices_filename": FILE_NAME,
+        }
+    }
+    repository = FileSystemLineItemRepository(config=config)
+    repository.save(ITEMS, date=today_dashed_str_with_key())
+
+    with patch.object(repository, "load") as load:
+        today_line_items = repository.load_market(
+            date=today_dashed_str_with_key(), vendor=Vendor.BMW, market=Market.NL
+        )
+
+    load.assert_not_called()
+    assert_that(repository.today_line_items).is_equal_to(ITEMS)
+    assert_that(today_line_items).is_equal_to([ITEMS[1]])
@@ -0,0 +1,40 @@
+from assertpy import assert_that
+
+from src.price_monitor.model.vendor import Market, Vendor
+from src.price_monitor.repository.request_fallback_repository import (
+    FileSystemRequestFallbackRepository,
+)
+
+
+def _create_request_fallback_repository(
+    directory,
+) -> FileSystemRequestFallbackRepository:
+    return FileSystemRequestFallbackRepository(
+        config={"output": {"directory": str(directory)}}
+    )
+
+
+def test_load_returns_empty_dict_when_no_fallback_was_saved(tmp_path):
+    request_fallback_repository = _create_request_fallback_repository(tmp_path)
+
+    assert_that(request_fallback_repository.load(Vendor.AUDI, Market.UK)).is_empty()
+
+
+def test_save_then_load_returns_fallbacks_of_the_partition(tmp_path):
+    request_fallback_repository = _create_request_fallback_repository(tmp_path)
+    fallbacks = {"q8-e-tron": {"GEGBFY": {"ids": "prstring", "action": "accept"}}}
+
+    request_fallback_repository.save(Vendor.AUDI, Market.UK, fallbacks)
+
+    assert_that(request_fallback_repository.load(Vendor.AUDI, Market.UK)).is_equal_to(
+        fallbacks
+    )
+    assert_that(request_fallback_repository.load(Vendor.AUDI, Market.US)).is_empty()
+
+
+def test_load_returns_empty_dict_when_fallbacks_are_unreadable(tmp_path):
+    request_fallback_repository = _create_request_fallback_repository(tmp_path)
+    (tmp_path / "request_fallbacks").mkdir()
+    (tmp_path / "request_fallbacks" / f"{Vendor.AUDI}_{Market.UK}.json").write_text("{")
+
+    assert_that(request_fallback_repository.load(Vendor.AUDI, Market.UK)).is_empty()
@@ -0,0 +1,125 @@
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable
+
+from src.price_monitor.finance_scraper import main_finance_scraper
+from src.price_monitor.price_scraper import main_scraper
+from src.price_monitor.repository.finance_item_repository import (
+    FileSystemFinanceLineItemRepository,
+)
+from src.price_monitor.repository.line_item_repository import (
+    FileSystemLineItemRepository,
+)
+from src.price_monitor.utils.http_recorder import RecorderMode, init_recorder
+from src.price_monitor.utils.metrics import REQUESTS, init_metrics
+from src.price_monitor.utils.scheduler import init_scheduler
+
+
+@dataclass
+class BenchmarkResult:
+    scraper: str
+    line_items: int
+    requests: int
+    wall_seconds: float
+    peak_memory_bytes: int
+
+    @property
+    def requests_per_second(self) -> float:
+        return self.requests / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    def __str__(self):
+        return (
+            f"{self.scraper:<28}{self.line_items:>8}{self.requests:>10}"
+            f"{self.requests_per_second:>10.1f}{self.wall_seconds:>10.2f}"
+            f"{self.peak_memory_bytes / 2**20:>10.1f}"
+        )
+
+
+HEADER = f"{'scraper':<28}{'items':>8}{'requests':>10}{'req/s':>10}{'wall s':>10}{'peak MiB':>10}"
+
+
+def benchmark_scraper(name: str, run: Callable[[], list | None]) -> BenchmarkResult:
+    """Runs a scraper end to end, counting its requests from the metrics and tracing its peak memory."""
+    metrics = init_metrics({"output": {"directory": None}})
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        line_items = run() or []
+        wall_seconds = time.perf_counter() - start
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return BenchmarkResult(
+        scraper=name,
+        line_items=len(line_items),
+        requests=int(sum(metrics.counters.get(REQUESTS, {}).values())),
+        wall_seconds=wall_seconds,
+        peak_memory_bytes=peak_memory,
+    )
+
+
+def run_benchmarks(
+    config: dict, cassette_directory: str, latency_seconds: float
+) -> list[BenchmarkResult]:
+    """
+    Replays every scraper enabled in the config from the cassettes, without calling the vendor sites.
+    The scrapers write to a temporary output directory, so the data of the config is never touched.
+    """
+    with tempfile.TemporaryDirectory() as output_directory:
+        config = {
+            **config,
+            "output": {**config["output"], "directory": output_directory},
+            "recorder": {
+                "mode": RecorderMode.REPLAY,
+                "directory": cassette_directory,
+                "latency_seconds": latency_seconds,
+            },
+        }
+        init_scheduler(config)
+        init_recorder(config)
+
+        results = []
+        line_item_repository = FileSystemLineItemRepository(config=config)
+        for scraper in main_scraper._init_scrapers(config, line_item_repository):
+            results.append(
+                benchmark_scraper(
+                    f"{scraper.vendor}", lambda: main_scraper._run_scraper(scraper)
+                )
+            )
+        if "finance_scraper" in config:
+            finance_line_item_repository = FileSystemFinanceLineItemRepository(
+                config=config
+            )
+            for scraper in main_finance_scraper._init_scrapers(
+                config, finance_line_item_repository
+            ):
+                results.append(
+                    benchmark_scraper(
+                        f"{scraper.vendor} finance",
+                        lambda: main_finance_scraper._run_finance_scraper(scraper),
+                    )
+                )
+        return results
+
+
+if __name__ == "__main__":
+    # Record the cassettes with a run of the scrapers on a config holding
+    # "recorder": {"mode": "record", "directory": "cassettes/"}, then replay them with
+    # python -m test.price_monitor.scraper_benchmark --config-file config.json --cassettes cassettes/
+    parser = argparse.ArgumentParser(description="Benchmarks the scrapers offline")
+    parser.add_argument("--config-file", required=True)
+    parser.add_argument("--cassettes", required=True)
+    parser.add_argument("--latency", type=float, default=0.05)
+    arguments = parser.parse_args()
+
+    with open(arguments.config_file) as file:
+        benchmark_config = json.load(file)
+    print(HEADER)
+    for result in run_benchmarks(
+        benchmark_config, arguments.cassettes, arguments.latency
+    ):
+        print(result)
@@ -0,0 +1,108 @@
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+from assertpy import assert_that
+
+ROOT_DIR = Path(__file__).parents[2]
+HEAVY_MODULES = [
+    "pandas",
+    "selenium",
+    "webdriver_manager",
+    "bs4",
+    "azure",
+    "google.cloud",
+]
+
+# Heavy dependencies each command must not import, as they belong to the subsystems of the other commands
+COMMANDS = {
+    "run_scraper": ["pandas", "azure", "google.cloud"],
+    "run_finance_scraper": ["pandas", "azure", "google.cloud"],
+    "run_compare": HEAVY_MODULES,
+    "run_finance_compare": HEAVY_MODULES,
+    "notify": HEAVY_MODULES,
+    "check_data_quality": [
+        "selenium",
+        "webdriver_manager",
+        "bs4",
+        "azure",
+        "google.cloud",
+    ],
+    "run_pipeline": ["azure", "google.cloud"],
+}
+
+
+def write_config(directory: str) -> str:
+    config_file = f"{directory}/config.json"
+    with open(config_file, "w") as file:
+        json.dump(
+            {
+                "environment": "test",
+                "output": {
+                    "directory": f"{directory}/data/",
+                    "prices_filename": "prices",
+                    "finance_options_filename": "finance_options",
+                    "differences_filename": "changelog",
+                    "file_type": "avro",
+                },
+                "scraper": {"enabled": {}},
+                "finance_scraper": {"enabled": {}},
+            },
+            file,
+        )
+    return config_file
+
+
+def measure_imports(command: str, config_file: str) -> dict[str, int]:
+    """
+    Runs a command on an empty config in a new interpreter with -X importtime.
+    Returns the cumulative import time in microseconds of every module it imported.
+    """
+    script = (
+        "from pathlib import Path\n"
+        f"from src.price_monitor.main import {command}\n"
+        f"{command}(Path({config_file!r}))\n"
+    )
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if process.returncode != 0:
+        raise RuntimeError(f"{command} failed: {process.stderr[-2000:]}")
+
+    imports = {}
+    for line in process.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, module = line.split("|")
+            if cumulative.strip().isdigit():
+                imports[module.strip()] = int(cumulative)
+    return imports
+
+
+def top_level_import_time(imports: dict[str, int]) -> int:
+    return sum(imports[module] for module in imports if "." not in module)
+
+
+@pytest.mark.parametrize("command", COMMANDS)
+def test_command_only_imports_its_own_subsystem(command, tmp_path):
+    imports = measure_imports(command, write_config(str(tmp_path)))
+
+    assert_that(imports).contains_key("src.price_monitor.main")
+    assert_that(imports).does_not_contain_key(*COMMANDS[command])
+
+
+if __name__ == "__main__":
+    # python -m test.price_monitor.test_import_time
+    with tempfile.TemporaryDirectory() as directory:
+        config_file = write_config(directory)
+        for command in COMMANDS:
+            imports = measure_imports(command, config_file)
+            print(
+                f"{command:<22}{len(imports):>6} modules"
+                f"{top_level_import_time(imports) / 1000:>10.1f} ms"
+            )
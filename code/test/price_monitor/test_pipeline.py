@@ -0,0 +1,94 @@
+from unittest.mock import Mock, patch
+
+from assertpy import assert_that
+
+from src.price_monitor.pipeline import run_pipeline
+
+CONFIG = {
+    "scraper": {"enabled": {"audi": ["DE"]}},
+    "finance_scraper": {"enabled": {"audi": ["UK"]}},
+    "notification": {},
+}
+
+
+@patch("src.price_monitor.pipeline.Notifier")
+@patch("src.price_monitor.pipeline.FinanceDataQualityProcessor")
+@patch("src.price_monitor.pipeline.DataQualityCheckFinance")
+@patch("src.price_monitor.pipeline.DataQualityCheck")
+@patch("src.price_monitor.pipeline.FinanceOptionsComparator")
+@patch("src.price_monitor.pipeline.Comparator")
+@patch("src.price_monitor.pipeline.scrape_finance")
+@patch("src.price_monitor.pipeline.scrape")
+@patch("src.price_monitor.pipeline.FileSystemFinanceLineItemRepository")
+@patch("src.price_monitor.pipeline.FileSystemLineItemRepository")
+def test_run_pipeline_chains_stages_on_in_memory_snapshots(
+    mock_line_item_repository,
+    mock_finance_line_item_repository,
+    mock_scrape,
+    mock_scrape_finance,
+    mock_comparator,
+    mock_finance_comparator,
+    mock_data_quality_check,
+    mock_data_quality_check_finance,
+    mock_finance_data_quality_processor,
+    mock_notifier,
+):
+    line_item_repository = mock_line_item_repository.return_value
+    finance_line_item_repository = mock_finance_line_item_repository.return_value
+    differences = [Mock()]
+    mock_comparator.return_value.compare.return_value = differences
+
+    timings = run_pipeline(CONFIG, resume=True)
+
+    assert_that(timings).contains_only(
+        "scrape",
+        "finance_scrape",
+        "compare",
+        "finance_compare",
+        "data_quality",
+        "notify",
+    )
+    mock_scrape.assert_called_once_with(CONFIG, line_item_repository, resume=True)
+    mock_scrape_finance.assert_called_once_with(CONFIG, finance_line_item_repository)
+    mock_comparator.return_value.compare.assert_called_once_with(
+        line_item_repository.today_line_items,
+        line_item_repository.yesterday_line_items,
+    )
+    mock_finance_comparator.return_value.compare.assert_called_once_with(
+        finance_line_item_repository.today_finance_line_items,
+        finance_line_item_repository.yesterday_finance_line_items,
+    )
+    mock_data_quality_check.assert_called_once_with(line_item_repository)
+    mock_finance_data_quality_processor.return_value.run_quality_checks_all_vendors.assert_called_once_with(
+        CONFIG
+    )
+    mock_notifier.return_value.notify.assert_called_once_with(differences=differences)
+
+
+@patch("src.price_monitor.pipeline.Notifier")
+@patch("src.price_monitor.pipeline.DataQualityCheckFinance")
+@patch("src.price_monitor.pipeline.DataQualityCheck")
+@patch("src.price_monitor.pipeline.FinanceOptionsComparator")
+@patch("src.price_monitor.pipeline.Comparator")
+@patch("src.price_monitor.pipeline.scrape_finance")
+@patch("src.price_monitor.pipeline.scrape")
+@patch("src.price_monitor.pipeline.FileSystemFinanceLineItemRepository")
+@patch("src.price_monitor.pipeline.FileSystemLineItemRepository")
+def test_run_pipeline_skips_stages_not_configured(
+    _,
+    __,
+    mock_scrape,
+    mock_scrape_finance,
+    mock_comparator,
+    mock_finance_comparator,
+    mock_data_quality_check,
+    mock_data_quality_check_finance,
+    mock_notifier,
+):
+    timings = run_pipeline({"scraper": {"enabled": {"audi": ["DE"]}}})
+
+    assert_that(timings).contains_only("scrape", "compare", "data_quality")
+    mock_scrape_finance.assert_not_called()
+    mock_finance_comparator.assert_not_called()
+    mock_data_quality_check_finance.assert_not_called()
+    mock_notifier.assert_not_called()
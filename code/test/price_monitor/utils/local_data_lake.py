@@ -0,0 +1,74 @@
+import os
+import shutil
+
+from azure.core.exceptions import ResourceExistsError, ResourceNotFoundError
+
+
+class LocalPath:
+    def __init__(self, name: str, is_directory: bool):
+        self.name = name
+        self.is_directory = is_directory
+
+
+class LocalDownloader:
+    def __init__(self, file_path: str, chunk_size: int):
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+
+    def chunks(self):
+        with open(self.file_path, "rb") as file:
+            while chunk := file.read(self.chunk_size):
+                yield chunk
+
+    def readall(self) -> bytes:
+        return b"".join(self.chunks())
+
+
+class LocalFileClient:
+    def __init__(self, file_system, path: str):
+        self.file_system = file_system
+        self.path = path
+        self.file_path = os.path.join(file_system.root, *path.split("/"))
+
+    def download_file(self) -> LocalDownloader:
+        if not os.path.isfile(self.file_path):
+            raise ResourceNotFoundError(f"{self.path} does not exist")
+        self.file_system.downloaded.append(self.path)
+        return LocalDownloader(self.file_path, self.file_system.chunk_size)
+
+    def upload_data(self, data, length=None, overwrite=False, **kwargs):
+        if os.path.exists(self.file_path) and not overwrite:
+            raise ResourceExistsError(f"{self.path} already exists")
+        os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+        with open(self.file_path, "wb") as file:
+            if isinstance(data, (str, bytes)):
+                file.write(data.encode() if isinstance(data, str) else data)
+            else:
+                shutil.copyfileobj(data, file)
+        self.file_system.uploaded.append(self.path)
+
+
+class LocalFileSystemClient:
+    """Stand-in for a Data Lake FileSystemClient, storing the files under a local directory."""
+
+    def __init__(self, root: str, chunk_size: int = 4):
+        self.root = root
+        self.chunk_size = chunk_size
+        self.downloaded: list[str] = []
+        self.uploaded: list[str] = []
+
+    def get_paths(self, path: str):
+        directory = os.path.join(self.root, *path.split("/"))
+        if not os.path.isdir(directory):
+            raise ResourceNotFoundError(f"{path} does not exist")
+        for current, dirs, files in os.walk(directory):
+            for name in dirs + files:
+                yield LocalPath(
+                    os.path.relpath(os.path.join(current, name), self.root).replace(
+                        os.sep, "/"
+                    ),
+                    name in dirs,
+                )
+
+    def get_file_client(self, path: str) -> LocalFileClient:
+        return LocalFileClient(self, path)
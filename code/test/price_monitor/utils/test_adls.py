@@ -1,11 +1,40 @@
+import os
+import tempfile
 import unittest
+from test.price_monitor.utils.local_data_lake import (
+    LocalFileClient,
+    LocalFileSystemClient,
+)
 from unittest.mock import patch, call, Mock
 
-from src.price_monitor.utils.adls import AzureDataLakeStorage
+from azure.core.exceptions import ResourceNotFoundError
+
+from src.price_monitor.utils.adls import (
+    MANIFEST_FILENAME,
+    AdlsSyncEngine,
+    AzureDataLakeStorage,
+    DataRequirement,
+    Dataset,
+    fetch_from_adls,
+    file_hash,
+    register_lazy_fetch,
+)
 from src.price_monitor.utils.clock import (
     today_dashed_str_with_key,
     yesterday_dashed_str_with_key,
 )
+from src.price_monitor.utils.scheduler import TaskPriority, TaskScheduler
+
+
+def _write(file_path, content):
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    with open(file_path, "wb") as file:
+        file.write(content)
+
+
+def _read(file_path):
+    with open(file_path, "rb") as file:
+        return file.read()
 
 
 class TestAzureDataLakeStorage(unittest.TestCase):
@@ -90,10 +119,19 @@ class TestAzureDataLakeStorage(unittest.TestCase):
         adls = AzureDataLakeStorage(config)
         mock_service_client = Mock()
         setattr(adls, "service_client", mock_service_client)
-        adls.upload_folder_to_adls()
-        mock_service_client.get_directory_client.assert_called_with(
-            "container", f"initial/{today_dashed_str_with_key()}"
-        )
+        with tempfile.TemporaryDirectory() as directory:
+            local_folder = f"{directory}/local"
+            _write(f"{local_folder}/prices.avro", b"prices")
+            file_system_client = LocalFileSystemClient(f"{directory}/remote")
+            mock_service_client.get_file_system_client.return_value = file_system_client
+
+            adls.upload_folder_to_adls(local_folder_path=local_folder)
+
+            mock_service_client.get_file_system_client.assert_called_with("container")
+            self.assertIn(
+                f"initial/{today_dashed_str_with_key()}/prices.avro",
+                file_system_client.uploaded,
+            )
 
     @patch("src.price_monitor.utils.adls.dbutils")
     def test_download_folder_from_directory_should_download_to_given_directory(
@@ -128,6 +166,9 @@ class TestAzureDataLakeStorage(unittest.TestCase):
         setattr(adls, "service_client", mock_service_client)
         mock_file_system_client = Mock()
         mock_file_system_client.get_paths.return_value = []
+        mock_file_system_client.get_file_client.return_value.download_file.side_effect = ResourceNotFoundError(
+            "Manifest not found"
+        )
         mock_service_client.get_file_system_client.return_value = (
             mock_file_system_client
         )
@@ -136,3 +177,252 @@ class TestAzureDataLakeStorage(unittest.TestCase):
         mock_file_system_client.get_paths.assert_called_with(
             path=f"initial/{yesterday_dashed_str_with_key()}"
         )
+
+
+class TestAdlsSyncEngine(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.local_folder = f"{self.directory.name}/local/date=2024-01-02"
+        self.remote_folder = "initial/date=2024-01-02"
+        self.file_system_client = LocalFileSystemClient(f"{self.directory.name}/remote")
+        self.engine = AdlsSyncEngine(self.file_system_client, chunk_size=4)
+        _write(f"{self.local_folder}/prices.avro", b"some prices")
+        _write(f"{self.local_folder}/finance/options.csv", b"some finance options")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_upload_streams_every_file_and_writes_manifest(self):
+        report = self.engine.upload(self.local_folder, self.remote_folder)
+
+        self.assertEqual(report.transferred, ["finance/options.csv", "prices.avro"])
+        self.assertEqual(
+            _read(
+                f"{self.directory.name}/remote/{self.remote_folder}/finance/options.csv"
+            ),
+            b"some finance options",
+        )
+        self.assertEqual(
+            self.engine._load_manifest(self.remote_folder),
+            {
+                "finance/options.csv": file_hash(
+                    f"{self.local_folder}/finance/options.csv"
+                ),
+                "prices.avro": file_hash(f"{self.local_folder}/prices.avro"),
+            },
+        )
+
+    def test_upload_skips_files_unchanged_since_last_sync(self):
+        self.engine.upload(self.local_folder, self.remote_folder)
+        _write(f"{self.local_folder}/prices.avro", b"updated prices")
+        self.file_system_client.uploaded.clear()
+
+        report = self.engine.upload(self.local_folder, self.remote_folder)
+
+        self.assertEqual(report.transferred, ["prices.avro"])
+        self.assertEqual(report.skipped, ["finance/options.csv"])
+        self.assertEqual(
+            self.file_system_client.uploaded,
+            [
+                f"{self.remote_folder}/prices.avro",
+                f"{self.remote_folder}/{MANIFEST_FILENAME}",
+            ],
+        )
+
+    def test_upload_keeps_previous_hash_of_failed_files(self):
+        self.engine.upload(self.local_folder, self.remote_folder)
+        previous_manifest = self.engine._load_manifest(self.remote_folder)
+        _write(f"{self.local_folder}/prices.avro", b"updated prices")
+        _write(f"{self.local_folder}/finance/options.csv", b"updated options")
+        upload_data = LocalFileClient.upload_data
+
+        def fail_prices(file_client, data, **kwargs):
+            if file_client.path.endswith("prices.avro"):
+                raise Exception("Connection reset")
+            upload_data(file_client, data, **kwargs)
+
+        with patch.object(
+            LocalFileClient, "upload_data", autospec=True, side_effect=fail_prices
+        ):
+            report = self.engine.upload(self.local_folder, self.remote_folder)
+
+        manifest = self.engine._load_manifest(self.remote_folder)
+        self.assertEqual(report.failed, ["prices.avro"])
+        self.assertEqual(report.transferred, ["finance/options.csv"])
+        self.assertEqual(manifest["prices.avro"], previous_manifest["prices.avro"])
+        self.assertNotEqual(
+            manifest["finance/options.csv"], previous_manifest["finance/options.csv"]
+        )
+
+    def test_download_places_files_relative_to_the_local_folder(self):
+        self.engine.upload(self.local_folder, self.remote_folder)
+        target_folder = f"{self.directory.name}/target"
+
+        report = self.engine.download(self.remote_folder, target_folder)
+
+        self.assertEqual(
+            sorted(report.transferred), ["finance/options.csv", "prices.avro"]
+        )
+        self.assertEqual(_read(f"{target_folder}/prices.avro"), b"some prices")
+        self.assertFalse(os.path.exists(f"{target_folder}/{MANIFEST_FILENAME}"))
+
+    def test_download_skips_files_already_up_to_date(self):
+        self.engine.upload(self.local_folder, self.remote_folder)
+        _write(f"{self.local_folder}/prices.avro", b"local changes")
+
+        report = self.engine.download(self.remote_folder, self.local_folder)
+
+        self.assertEqual(report.transferred, ["prices.avro"])
+        self.assertEqual(report.skipped, ["finance/options.csv"])
+        self.assertEqual(_read(f"{self.local_folder}/prices.avro"), b"some prices")
+
+    def test_download_of_missing_files_only_keeps_local_changes(self):
+        self.engine.upload(self.local_folder, self.remote_folder)
+        _write(f"{self.local_folder}/prices.avro", b"local changes")
+        os.remove(f"{self.local_folder}/finance/options.csv")
+
+        report = self.engine.download(
+            self.remote_folder, self.local_folder, missing_only=True
+        )
+
+        self.assertEqual(report.transferred, ["finance/options.csv"])
+        self.assertEqual(report.skipped, ["prices.avro"])
+        self.assertEqual(_read(f"{self.local_folder}/prices.avro"), b"local changes")
+
+    def test_download_of_given_files_only(self):
+        self.engine.upload(self.local_folder, self.remote_folder)
+        target_folder = f"{self.directory.name}/target"
+
+        report = self.engine.download(
+            self.remote_folder, target_folder, names=["prices.avro", "prices.csv"]
+        )
+
+        self.assertEqual(report.transferred, ["prices.avro"])
+        self.assertEqual(report.missing, ["prices.csv"])
+        self.assertFalse(os.path.exists(f"{target_folder}/finance"))
+
+    def test_download_of_missing_folder_transfers_nothing(self):
+        report = self.engine.download("initial/date=2023-12-31", self.local_folder)
+
+        self.assertEqual(str(report), "0 transferred, 0 unchanged, 0 failed, 0 missing")
+
+
+class TestAdlsLazyFetch(unittest.TestCase):
+    @patch.object(AzureDataLakeStorage, "initialize_datalake_client")
+    @patch.object(AzureDataLakeStorage, "authenticate_with_service_principal")
+    @patch("src.price_monitor.utils.adls.dbutils")
+    def setUp(self, mock_dbutils, *_):
+        self.directory = tempfile.TemporaryDirectory()
+        mock_dbutils.secrets.get.side_effect = [
+            "tenant",
+            "client",
+            "secret",
+            "account",
+            "container",
+            "initial",
+        ]
+        self.adls = AzureDataLakeStorage(
+            {
+                "output": {
+                    "directory": f"{self.directory.name}/local",
+                    "prices_filename": "prices",
+                    "finance_options_filename": "finance_options",
+                    "differences_filename": "changelog",
+                },
+                "adls": {
+                    "scope_type": "credential",
+                    "tenant_id": "TENANT-ID",
+                    "service_client_id": "CLIENT_ID",
+                    "service_secret": "SERVICE_SECRET",
+                    "storage_account_name": "STORAGE_ACCOUNT_NAME",
+                    "container_name": "CONTAINER_NAME",
+                    "initial_path": "INITIAL_PATH",
+                },
+            }
+        )
+        self.file_system_client = LocalFileSystemClient(f"{self.directory.name}/remote")
+        self.adls.service_client = Mock()
+        self.adls.service_client.get_file_system_client.return_value = (
+            self.file_system_client
+        )
+        for name in ["prices.avro", "finance_options.avro", "changelog.avro"]:
+            _write(
+                f"{self.directory.name}/remote/initial/date=2024-01-02/{name}",
+                name.encode(),
+            )
+
+    def tearDown(self):
+        register_lazy_fetch(None)
+        self.directory.cleanup()
+
+    def test_prefetch_downloads_only_the_required_datasets(self):
+        self.adls.prefetch([DataRequirement(Dataset.DIFFERENCES, "date=2024-01-02")])
+
+        self.assertEqual(
+            os.listdir(f"{self.directory.name}/local/date=2024-01-02"),
+            ["changelog.avro"],
+        )
+
+    def test_fetch_from_adls_downloads_a_dataset_once_per_run(self):
+        register_lazy_fetch(self.adls)
+
+        fetch_from_adls("date=2024-01-02", "prices")
+        fetch_from_adls("date=2024-01-02", "prices")
+
+        self.assertEqual(
+            self.file_system_client.downloaded,
+            ["initial/date=2024-01-02/prices.avro"],
+        )
+        self.assertEqual(
+            _read(f"{self.directory.name}/local/date=2024-01-02/prices.avro"),
+            b"prices.avro",
+        )
+
+    def test_fetch_keeps_the_local_files_of_today(self):
+        today = today_dashed_str_with_key()
+        for name in ["prices.avro", "finance_options.avro"]:
+            _write(f"{self.directory.name}/remote/initial/{today}/{name}", b"remote")
+        _write(f"{self.directory.name}/local/{today}/prices.avro", b"scraped today")
+
+        self.adls.fetch(today, ["prices", "finance_options"])
+
+        self.assertEqual(
+            _read(f"{self.directory.name}/local/{today}/prices.avro"),
+            b"scraped today",
+        )
+        self.assertEqual(
+            _read(f"{self.directory.name}/local/{today}/finance_options.avro"),
+            b"remote",
+        )
+
+    def test_markets_fetching_the_same_dataset_do_not_deadlock_on_a_single_worker(
+        self,
+    ):
+        scheduler = TaskScheduler(max_workers=1)
+
+        def scrape_market(_):
+            self.adls.fetch("date=2024-01-02", ["prices"])
+
+        def scrape_vendor():
+            scheduler.gather(
+                scheduler.submit(scrape_market, market, priority=TaskPriority.HIGH)
+                for market in range(2)
+            )
+
+        with patch(
+            "src.price_monitor.utils.adls.get_scheduler", return_value=scheduler
+        ):
+            scheduler.submit(scrape_vendor).result(timeout=10)
+        scheduler.shutdown()
+
+        self.assertEqual(
+            self.file_system_client.downloaded,
+            ["initial/date=2024-01-02/prices.avro"],
+        )
+
+    def test_fetch_from_adls_does_nothing_without_adls(self):
+        register_lazy_fetch(None)
+
+        fetch_from_adls("date=2024-01-02", "prices")
+
+        self.assertEqual(self.file_system_client.downloaded, [])
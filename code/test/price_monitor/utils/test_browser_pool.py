@@ -0,0 +1,86 @@
+import threading
+from unittest.mock import Mock
+
+import pytest
+from assertpy import assert_that
+
+from src.price_monitor.utils.browser_pool import (
+    DEFAULT_BROWSER_WORKERS,
+    BrowserPool,
+    get_browser_pool,
+    init_browser_pool,
+)
+
+
+def test_browser_sessions_are_reused():
+    create_browser = Mock(side_effect=lambda: Mock())
+    browser_pool = BrowserPool(2, create_browser)
+
+    with browser_pool.browser() as first:
+        pass
+    with browser_pool.browser() as second:
+        pass
+
+    assert_that(second).is_same_as(first)
+    create_browser.assert_called_once()
+
+
+def test_failed_browser_session_is_quit_and_replaced():
+    create_browser = Mock(side_effect=lambda: Mock())
+    browser_pool = BrowserPool(1, create_browser)
+
+    with pytest.raises(ValueError):
+        with browser_pool.browser() as failed:
+            raise ValueError("Page in an unexpected state")
+    with browser_pool.browser() as replacement:
+        pass
+
+    failed.quit.assert_called_once()
+    assert_that(replacement).is_not_same_as(failed)
+
+
+def test_borrowers_wait_for_a_free_session():
+    browser_pool = BrowserPool(1, Mock)
+    borrowed = threading.Event()
+    released = threading.Event()
+
+    def borrow():
+        with browser_pool.browser():
+            borrowed.set()
+            released.wait()
+
+    borrower = threading.Thread(target=borrow)
+    borrower.start()
+    borrowed.wait()
+    waiting = threading.Thread(target=lambda: browser_pool.browser().__enter__())
+    waiting.start()
+    waiting.join(timeout=0.1)
+
+    assert_that(waiting.is_alive()).is_true()
+    released.set()
+    borrower.join()
+    waiting.join(timeout=1)
+    assert_that(waiting.is_alive()).is_false()
+
+
+def test_shutdown_quits_the_idle_sessions():
+    browser_pool = BrowserPool(1, Mock)
+    with browser_pool.browser() as driver:
+        pass
+
+    browser_pool.shutdown()
+
+    driver.quit.assert_called_once()
+
+
+def test_browser_workers_are_read_from_the_scheduler_configuration():
+    init_browser_pool({"scheduler": {"browser_workers": 3}})
+    assert_that(get_browser_pool().max_workers).is_equal_to(3)
+
+    init_browser_pool({})
+    assert_that(get_browser_pool().max_workers).is_equal_to(DEFAULT_BROWSER_WORKERS)
+
+
+def test_browser_workers_below_one_are_rejected():
+    with pytest.raises(ValueError):
+        BrowserPool(0)
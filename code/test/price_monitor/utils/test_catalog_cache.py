@@ -0,0 +1,112 @@
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+from assertpy import assert_that
+
+from src.price_monitor.finance_scraper.tesla.finance_scraper import (
+    FinanceScraperTeslaUk,
+)
+from src.price_monitor.model.vendor import Market, Vendor
+from src.price_monitor.price_scraper.bmw.scraper import get_model_matrix
+from src.price_monitor.utils.catalog_cache import (
+    CatalogCache,
+    CatalogKind,
+    catalog_cache_scope,
+    fetch_catalog,
+)
+
+KEY = (CatalogKind.MODEL_MATRIX, Vendor.BMW, Market.UK, "model_matrix_url")
+
+
+def test_fetch_catalog_fetches_every_time_outside_of_a_scope():
+    fetch = Mock(return_value={"model": "matrix"})
+
+    fetch_catalog(*KEY, fetch)
+    fetch_catalog(*KEY, fetch)
+
+    assert_that(fetch.call_count).is_equal_to(2)
+
+
+def test_fetch_catalog_fetches_a_document_once_within_a_scope():
+    fetch = Mock(return_value={"model": "matrix"})
+
+    with catalog_cache_scope() as cache:
+        first = fetch_catalog(*KEY, fetch)
+        second = fetch_catalog(*KEY, fetch)
+        fetch_catalog(CatalogKind.MODEL_MATRIX, Vendor.BMW, Market.DE, KEY[3], fetch)
+
+    assert_that(first).is_same_as(second)
+    assert_that(fetch.call_count).is_equal_to(2)
+    assert_that(cache.hits).is_equal_to(1)
+    assert_that(cache.misses).is_equal_to(2)
+
+
+def test_get_or_fetch_does_not_cache_failures():
+    cache = CatalogCache()
+    fetch = Mock(side_effect=[ValueError("Failed to fetch"), {"model": "matrix"}])
+
+    with pytest.raises(ValueError):
+        cache.get_or_fetch(KEY, fetch)
+
+    assert_that(cache.get_or_fetch(KEY, fetch)).is_equal_to({"model": "matrix"})
+    assert_that(cache).is_length(1)
+
+
+def test_get_or_fetch_fetches_once_for_concurrent_requests():
+    cache = CatalogCache()
+    fetch = Mock(side_effect=lambda: time.sleep(0.05) or "model_page")
+    results = []
+
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_fetch(KEY, fetch)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert_that(results).is_equal_to(["model_page"] * 5)
+    assert_that(fetch.call_count).is_equal_to(1)
+
+
+@patch("src.price_monitor.price_scraper.bmw.scraper.execute_request")
+def test_bmw_model_matrix_is_reused_within_a_scope(mock_execute_request):
+    mock_execute_request.return_value = {"model": "matrix"}
+
+    with catalog_cache_scope():
+        get_model_matrix(Market.UK, Mock(), {})
+        get_model_matrix(Market.UK, Mock(), {})
+
+    assert_that(mock_execute_request.call_count).is_equal_to(1)
+
+
+@patch("src.price_monitor.finance_scraper.tesla.finance_scraper.parse_trim_line_items")
+@patch("src.price_monitor.finance_scraper.tesla.finance_scraper.parse_lexicon")
+@patch(
+    "src.price_monitor.finance_scraper.tesla.finance_scraper.get_model_page_and_finance_details"
+)
+def test_tesla_finance_reuses_the_lexicon_parsed_by_the_price_scraper(
+    mock_get_model_page_and_finance_details,
+    mock_parse_lexicon,
+    mock_parse_trim_line_items,
+):
+    mock_get_model_page_and_finance_details.return_value = {
+        "model_page": "model_page",
+        "finance_details": {},
+    }
+    mock_parse_trim_line_items.return_value = []
+    url = "https://www.tesla.com/en_gb/model3#overview"
+    finance_scraper = FinanceScraperTeslaUk(Mock(), Mock(), {})
+    lexicon = Mock()
+
+    with catalog_cache_scope():
+        fetch_catalog(
+            CatalogKind.MODEL_LEXICON, Vendor.TESLA, Market.UK, url, lambda: lexicon
+        )
+        finance_scraper.scrape_finance_option_for_model("/en_gb/model3")
+
+    mock_parse_lexicon.assert_not_called()
+    mock_parse_trim_line_items.assert_called_with(lexicon, Market.UK)
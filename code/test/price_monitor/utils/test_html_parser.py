@@ -0,0 +1,36 @@
+from unittest.mock import patch
+
+import pytest
+from assertpy import assert_that
+
+from src.price_monitor.utils.html_parser import LXML, PYTHON_HTML_PARSER, parse_html
+from test.price_monitor.html_parser_benchmark import SAMPLE_PAGES, benchmark_page
+
+
+@pytest.fixture(params=SAMPLE_PAGES, ids=lambda sample_page: sample_page.name)
+def sample_page(request):
+    return request.param
+
+
+def _extract_with(backend: str, sample_page):
+    with patch("src.price_monitor.utils.html_parser.DEFAULT_BACKEND", backend):
+        return sample_page.extract(sample_page.read())
+
+
+def test_extraction_is_identical_with_every_backend(sample_page):
+    assert_that(_extract_with(LXML, sample_page)).is_equal_to(
+        _extract_with(PYTHON_HTML_PARSER, sample_page)
+    )
+
+
+def test_pages_are_parsed_with_the_given_backend():
+    soup = parse_html("<p>price</p>", PYTHON_HTML_PARSER)
+
+    assert_that(soup.builder.NAME).is_equal_to(PYTHON_HTML_PARSER)
+    assert_that(soup.p.text).is_equal_to("price")
+
+
+def test_benchmark_reports_the_time_per_backend(sample_page):
+    result = benchmark_page(sample_page, [PYTHON_HTML_PARSER], repeat=1)
+
+    assert_that(result[PYTHON_HTML_PARSER]).is_positive()
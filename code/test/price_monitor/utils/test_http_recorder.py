@@ -0,0 +1,116 @@
+import json
+from unittest.mock import Mock
+
+import pytest
+import requests
+from assertpy import assert_that
+
+from src.price_monitor.model.vendor import Market, Vendor
+from src.price_monitor.price_scraper.vendor_scraper import VendorScraper
+from src.price_monitor.utils.caller import execute_request
+from src.price_monitor.utils.http_recorder import (
+    CassetteMissError,
+    RecorderMode,
+    get_recorder,
+    init_recorder,
+    replayable,
+)
+from src.price_monitor.utils.scheduler import init_scheduler
+from test.price_monitor.scraper_benchmark import benchmark_scraper
+
+
+def _response(content: bytes) -> requests.Response:
+    response = requests.Response()
+    response._content = content
+    response.status_code = 200
+    return response
+
+
+class FakeScraper(VendorScraper):
+    vendor = Vendor.BMW
+    session = None
+
+    def __init__(self, line_item_repository, config):
+        super().__init__(line_item_repository, config)
+        self.markets = [Market.UK, Market.DE]
+
+    def scrape_models(self, market: Market) -> list[dict]:
+        return [
+            execute_request(
+                "get",
+                f"https://prod.api.bmw.com/models/{market}",
+                FakeScraper.session,
+                body={"market": str(market)},
+                delay=0,
+            )
+        ]
+
+
+@replayable("selenium")
+def load_finance_details(url: str) -> dict:
+    return FakeScraper.session.load(url)
+
+
+@pytest.fixture(autouse=True)
+def scheduler():
+    scheduler = init_scheduler({"scheduler": {"max_workers": 2}})
+    yield scheduler
+    init_recorder({})
+
+
+def _recorder_config(tmp_path, mode: RecorderMode, latency_seconds: float = 0.0):
+    return {
+        "recorder": {
+            "mode": mode,
+            "directory": str(tmp_path),
+            "latency_seconds": latency_seconds,
+        }
+    }
+
+
+def test_recorded_responses_are_replayed_without_calling_the_vendor(tmp_path):
+    FakeScraper.session = Mock()
+    FakeScraper.session.get.side_effect = lambda url, **_: _response(
+        json.dumps({"model": url[-2:]}).encode()
+    )
+    FakeScraper.session.load.return_value = {"PCP": {"rental_th": "£499"}}
+    init_recorder(_recorder_config(tmp_path, RecorderMode.RECORD))
+    recorded = FakeScraper(None, {}).run()
+    recorded_details = load_finance_details("https://www.tesla.com/en_gb/model3")
+    get_recorder().save()
+
+    FakeScraper.session = Mock()
+    init_recorder(_recorder_config(tmp_path, RecorderMode.REPLAY))
+    replayed = FakeScraper(None, {}).run()
+
+    assert_that(sorted(tmp_path.glob("*/*.json"))).is_length(3)
+    assert_that(replayed).contains_only(*recorded)
+    assert_that(load_finance_details("https://www.tesla.com/en_gb/model3")).is_equal_to(
+        recorded_details
+    )
+    FakeScraper.session.get.assert_not_called()
+    FakeScraper.session.load.assert_not_called()
+
+
+def test_replay_fails_for_requests_never_recorded(tmp_path):
+    init_recorder(_recorder_config(tmp_path, RecorderMode.REPLAY))
+
+    with pytest.raises(CassetteMissError):
+        get_recorder().replay("http", "get", "https://prod.api.bmw.com/models/G20")
+
+
+def test_benchmark_reports_requests_wall_time_and_peak_memory(tmp_path):
+    FakeScraper.session = Mock()
+    FakeScraper.session.get.return_value = _response(b'{"model": "G20"}')
+    init_recorder(_recorder_config(tmp_path, RecorderMode.RECORD))
+    FakeScraper(None, {}).run()
+    get_recorder().save()
+    init_recorder(_recorder_config(tmp_path, RecorderMode.REPLAY, 0.05))
+
+    result = benchmark_scraper("bmw", FakeScraper(None, {}).run)
+
+    assert_that(result.line_items).is_equal_to(2)
+    assert_that(result.requests).is_equal_to(2)
+    assert_that(result.wall_seconds).is_greater_than_or_equal_to(0.05)
+    assert_that(result.requests_per_second).is_positive()
+    assert_that(result.peak_memory_bytes).is_positive()
@@ -1,8 +1,10 @@
 import os
 from unittest.mock import patch
 
+from loguru import logger
+
 from src.price_monitor.utils.clock import today_dashed_str
-from src.price_monitor.utils.logger import init_logging_handler
+from src.price_monitor.utils.logger import SampledLog, init_logging_handler
 
 
 @patch("src.price_monitor.utils.logger.logger")
@@ -18,3 +20,34 @@ def test_init_logging_handler_when_file_loging_set_then_create_file_logging(
         format="{time} {level} {name}:{function}:{line} - {message}",
         level="INFO",
     )
+
+
+def test_sampled_log_logs_the_first_messages_of_every_template_and_counts_the_others():
+    records = []
+    sink_id = logger.add(records.append, level="WARNING", format="{message}")
+    sampled_log = SampledLog(logger, limit=2)
+
+    try:
+        for row in range(5):
+            sampled_log("Rule '{}' violated at row {}.", "OTR", row)
+        sampled_log("Negative price at row {}.", 7)
+        sampled_log.summarize("[UK-bmw] ")
+    finally:
+        logger.remove(sink_id)
+
+    assert [record.record["message"] for record in records] == [
+        "Rule 'OTR' violated at row 0.",
+        "Rule 'OTR' violated at row 1.",
+        "Negative price at row 7.",
+        "[UK-bmw] 3 more messages not logged like: Rule '{}' violated at row {}.",
+    ]
+    # Logged from the check sampling them, not from the sampled log
+    assert {
+        (record.record["name"], record.record["function"]) for record in records
+    } == {
+        (
+            __name__,
+            "test_sampled_log_logs_the_first_messages_of_every_template_and_counts_the_others",
+        )
+    }
+    assert len(sampled_log.counts) == 0
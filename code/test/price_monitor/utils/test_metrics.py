@@ -0,0 +1,152 @@
+import json
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+from assertpy import assert_that
+
+from src.price_monitor.model.vendor import Market, Vendor
+from src.price_monitor.utils.caller import execute_request
+from src.price_monitor.utils.clock import (
+    today_dashed_str,
+    today_dashed_str_with_key,
+    yesterday_dashed_str_with_key,
+)
+from src.price_monitor.utils.metrics import (
+    FALLBACKS_TO_YESTERDAY,
+    REQUEST_BYTES,
+    REQUEST_DURATION,
+    REQUEST_RETRIES,
+    REQUESTS,
+    counts_fallback_to_yesterday,
+    endpoint_template,
+    get_metrics,
+    init_metrics,
+    write_reports,
+)
+from src.price_monitor.utils.scheduler import TaskScheduler
+
+LABELS = (
+    ("kind", "http"),
+    ("vendor", "bmw"),
+    ("market", "UK"),
+    ("endpoint", "prod.api.bmw.com/models/{id}"),
+)
+
+
+@pytest.fixture(autouse=True)
+def metrics(tmp_path):
+    return init_metrics({"output": {"directory": str(tmp_path)}})
+
+
+def _response(content=b'{"model": "G20"}', status_code=200):
+    response = requests.Response()
+    response._content = content
+    response.status_code = status_code
+    return response
+
+
+class FakeRepository:
+    filename = "prices"
+
+    @counts_fallback_to_yesterday
+    def load_market(self, date, market, vendor):
+        return []
+
+
+def test_endpoint_template_replaces_ids_in_path():
+    assert_that(
+        endpoint_template("https://prod.api.bmw.com/models/G20?market=uk")
+    ).is_equal_to("prod.api.bmw.com/models/{id}")
+
+
+def test_execute_request_records_latency_bytes_and_retries(metrics):
+    session = Mock()
+    session.get.side_effect = [
+        requests.ConnectionError("Connection reset"),
+        _response(),
+    ]
+    scheduler = TaskScheduler(max_workers=1)
+
+    with patch("retry.api.time.sleep"):
+        scheduler.gather(
+            [
+                scheduler.submit(
+                    execute_request,
+                    "get",
+                    "https://prod.api.bmw.com/models/G20",
+                    session,
+                    delay=0,
+                    vendor=Vendor.BMW,
+                    market=Market.UK,
+                )
+            ]
+        )
+
+    assert_that(metrics.histograms[REQUEST_DURATION][LABELS].count).is_equal_to(2)
+    assert_that(metrics.counters[REQUESTS][(("outcome", "ok"),) + LABELS]).is_equal_to(
+        1
+    )
+    assert_that(
+        metrics.counters[REQUESTS][(("outcome", "error"),) + LABELS]
+    ).is_equal_to(1)
+    assert_that(metrics.counters[REQUEST_BYTES][LABELS]).is_equal_to(16)
+    assert_that(metrics.counters[REQUEST_RETRIES][LABELS]).is_equal_to(1)
+    scheduler.shutdown()
+
+
+def test_fallback_to_yesterday_is_only_counted_within_scraper_tasks(metrics):
+    repository = FakeRepository()
+    scheduler = TaskScheduler(max_workers=1)
+
+    scheduler.gather(
+        [
+            scheduler.submit(
+                repository.load_market,
+                yesterday_dashed_str_with_key(),
+                Market.UK,
+                Vendor.BMW,
+                vendor=Vendor.BMW,
+            ),
+            scheduler.submit(
+                repository.load_market,
+                today_dashed_str_with_key(),
+                Market.UK,
+                Vendor.BMW,
+                vendor=Vendor.BMW,
+            ),
+        ]
+    )
+    repository.load_market(yesterday_dashed_str_with_key(), Market.UK, Vendor.BMW)
+
+    assert_that(metrics.counters[FALLBACKS_TO_YESTERDAY]).is_equal_to(
+        {(("vendor", "bmw"), ("market", "UK"), ("dataset", "prices")): 1}
+    )
+    scheduler.shutdown()
+
+
+def test_write_reports_writes_prometheus_textfile_and_json_report(tmp_path):
+    get_metrics().observe(REQUEST_DURATION, 0.3, **dict(LABELS))
+    get_metrics().increment(REQUEST_BYTES, 512, **dict(LABELS))
+
+    write_reports("run-scraper")
+
+    with open(f"{tmp_path}/metrics/run-scraper.prom") as file:
+        textfile = file.read()
+    with open(f"{tmp_path}/metrics/run-scraper-{today_dashed_str()}.json") as file:
+        report = json.load(file)
+    labels = (
+        'kind="http",vendor="bmw",market="UK",endpoint="prod.api.bmw.com/models/{id}"'
+    )
+    assert_that(textfile).contains(
+        "# TYPE price_monitor_request_duration_seconds histogram",
+        f'price_monitor_request_duration_seconds_bucket{{{labels},le="0.25"}} 0',
+        f'price_monitor_request_duration_seconds_bucket{{{labels},le="0.5"}} 1',
+        f'price_monitor_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1',
+        f"price_monitor_request_bytes_total{{{labels}}} 512",
+    )
+    assert_that(report["command"]).is_equal_to("run-scraper")
+    assert_that(report["counters"][0]["value"]).is_equal_to(512)
+    assert_that(report["histograms"][0]["buckets"]["0.5"]).is_equal_to(1)
+    assert_that(os.listdir(f"{tmp_path}/metrics")).is_length(2)
@@ -0,0 +1,93 @@
+import os
+from pathlib import Path
+
+import pytest
+from assertpy import assert_that
+from loguru import logger
+
+from src.price_monitor.model.vendor import Market
+from src.price_monitor.price_scraper.tesla.parser import (
+    parse_lexicon,
+    parse_trim_line_items,
+)
+from src.price_monitor.utils.clock import today_dashed_str
+from src.price_monitor.utils.parse_pool import (
+    ParsePool,
+    get_parse_pool,
+    init_parse_pool,
+    parse_in_pool,
+)
+
+TESLA_MODEL_PAGE = (
+    Path(__file__).parents[1] / "price_scraper" / "tesla" / "sample" / "model3_de.html"
+)
+
+
+def _parser_pid(_: str) -> int:
+    return os.getpid()
+
+
+def _failing_parser(page: str):
+    raise ValueError(f"Unexpected page {page}")
+
+
+def _logging_parser(page: str):
+    logger.info(f"Parsing {page}")
+
+
+@pytest.fixture
+def parse_pool(tmp_path):
+    parse_pool = init_parse_pool(
+        {
+            "scheduler": {"parse_workers": 2},
+            "output": {"logs_directory": str(tmp_path)},
+        }
+    )
+    yield parse_pool
+    init_parse_pool({})
+
+
+def test_pages_are_parsed_inline_without_parse_workers():
+    init_parse_pool({})
+
+    assert_that(get_parse_pool().max_workers).is_equal_to(0)
+    assert_that(parse_in_pool(_parser_pid, "page")).is_equal_to(os.getpid())
+
+
+def test_pages_are_parsed_in_the_parser_processes(parse_pool):
+    model_page = TESLA_MODEL_PAGE.read_text()
+
+    lexicon = parse_in_pool(parse_lexicon, model_page)
+
+    assert_that(parse_in_pool(_parser_pid, "page")).is_not_equal_to(os.getpid())
+    assert_that(lexicon).is_equal_to(parse_lexicon(model_page))
+    assert_that(parse_trim_line_items(lexicon, Market.DE)).is_not_empty()
+
+
+def test_parser_errors_are_raised_to_the_fetching_thread(parse_pool):
+    with pytest.raises(ValueError, match="Unexpected page"):
+        parse_in_pool(_failing_parser, "page")
+
+
+def test_parser_processes_log_to_the_configured_sinks(tmp_path, monkeypatch):
+    monkeypatch.setenv("PM_FILE_LOGGING", "true")
+    parse_pool = init_parse_pool(
+        {
+            "scheduler": {"parse_workers": 1},
+            "output": {"logs_directory": str(tmp_path)},
+        }
+    )
+
+    parse_in_pool(_logging_parser, "model3_de")
+    parse_pool.shutdown()
+    init_parse_pool({})
+
+    log_file = tmp_path / f"price-monitor-{today_dashed_str()}.log"
+    assert_that(log_file.read_text()).contains(
+        "test_parse_pool:_logging_parser", "Parsing model3_de"
+    )
+
+
+def test_negative_parse_workers_are_rejected():
+    with pytest.raises(ValueError):
+        ParsePool(-1)
@@ -0,0 +1,57 @@
+import glob
+import json
+import pstats
+import time
+
+from assertpy import assert_that
+
+from src.price_monitor.utils.profiler import profile_stage, profiling
+from src.price_monitor.utils.scheduler import TaskScheduler
+
+
+def _allocate(size: int) -> bytes:
+    data = bytes(size)
+    time.sleep(0.05)
+    return data
+
+
+def test_profiling_writes_pstats_collapsed_stacks_and_stage_memory_peaks(tmp_path):
+    config = {"output": {"logs_directory": str(tmp_path)}}
+    scheduler = TaskScheduler(max_workers=1)
+
+    with profiling(config, "run-compare"):
+        with profile_stage("load"):
+            _allocate(8 * 2**20)
+        with profile_stage("compare"):
+            with profile_stage("data_quality"):
+                scheduler.gather([scheduler.submit(_allocate, 2 * 2**20)])
+
+    (pstats_file,) = glob.glob(f"{tmp_path}/profile-run-compare-*.pstats")
+    file_prefix = pstats_file.removesuffix(".pstats")
+    functions = {name for _, _, name in pstats.Stats(pstats_file).stats}
+    with open(f"{file_prefix}.collapsed") as file:
+        stacks = file.read().splitlines()
+    with open(f"{file_prefix}.memory.json") as file:
+        memory_peaks = json.load(file)
+
+    assert_that(functions).contains("_allocate")
+    assert_that(stacks).is_not_empty()
+    assert_that(stacks[0]).matches(r"^\S+(;\S+)* \d+$")
+    assert_that(
+        [stack for stack in stacks if "test_profiler._allocate" in stack]
+    ).is_not_empty()
+    assert_that(memory_peaks["load"]).is_greater_than(8 * 2**20)
+    assert_that(memory_peaks["data_quality"]).is_between(2 * 2**20, 8 * 2**20)
+    assert_that(memory_peaks["compare"]).is_equal_to(memory_peaks["data_quality"])
+    scheduler.shutdown()
+
+
+def test_profiling_disabled_writes_nothing(tmp_path):
+    config = {"output": {"logs_directory": str(tmp_path)}}
+
+    with profiling(config, "notify", enabled=False) as profiler:
+        with profile_stage("load"):
+            _allocate(1024)
+
+    assert_that(profiler).is_none()
+    assert_that(list(tmp_path.iterdir())).is_empty()
@@ -0,0 +1,133 @@
+import threading
+import time
+
+import pytest
+from assertpy import assert_that
+
+from src.price_monitor.model.vendor import Vendor
+from src.price_monitor.utils.scheduler import (
+    DEFAULT_MAX_WORKERS,
+    TaskPriority,
+    TaskScheduler,
+    init_scheduler,
+)
+
+
+def _blocked_scheduler(max_workers=1):
+    # Keeps the only worker busy until released, so the queued tasks can be ordered by the scheduler
+    scheduler = TaskScheduler(max_workers=max_workers)
+    release = threading.Event()
+    scheduler.submit(release.wait)
+    time.sleep(0.05)
+    return scheduler, release
+
+
+def test_nested_fan_out_does_not_deadlock_on_a_single_worker():
+    scheduler = TaskScheduler(max_workers=1)
+
+    def scrape_market(market):
+        return sum(
+            scheduler.gather(
+                scheduler.submit(lambda model: model * market, model)
+                for model in range(5)
+            )
+        )
+
+    actual = scheduler.gather(
+        scheduler.submit(scrape_market, market, vendor=Vendor.AUDI)
+        for market in range(3)
+    )
+
+    assert_that(actual).is_equal_to([0, 10, 20])
+    scheduler.shutdown()
+
+
+def test_running_tasks_never_exceed_the_worker_cap():
+    scheduler = TaskScheduler(max_workers=3)
+    lock = threading.Lock()
+    running = [0, 0]
+
+    def scrape_model(_):
+        with lock:
+            running[0] += 1
+            running[1] = max(running)
+        time.sleep(0.01)
+        with lock:
+            running[0] -= 1
+
+    def scrape_vendor(_):
+        scheduler.gather(scheduler.map(scrape_model, range(10)))
+
+    scheduler.gather(
+        scheduler.submit(scrape_vendor, vendor, vendor=vendor) for vendor in Vendor
+    )
+
+    assert_that(running[1]).is_less_than_or_equal_to(3)
+    assert_that(len(scheduler._workers)).is_less_than_or_equal_to(3)
+    scheduler.shutdown()
+
+
+def test_burst_after_warm_up_runs_on_as_many_workers():
+    scheduler = TaskScheduler(max_workers=8)
+    scheduler.gather([scheduler.submit(lambda: None)])
+    time.sleep(0.05)
+
+    start = time.perf_counter()
+    scheduler.wait(scheduler.submit(time.sleep, 0.2) for _ in range(8))
+    elapsed = time.perf_counter() - start
+
+    assert_that(elapsed).is_less_than(0.6)
+    assert_that(len(scheduler._workers)).is_equal_to(8)
+    scheduler.shutdown()
+
+
+def test_workers_take_turns_between_vendors():
+    scheduler, release = _blocked_scheduler()
+    order = []
+
+    jobs = [
+        scheduler.submit(order.append, f"{vendor}_{index}", vendor=vendor)
+        for vendor in [Vendor.AUDI, Vendor.BMW]
+        for index in range(3)
+    ]
+    release.set()
+    scheduler.wait(jobs)
+
+    assert_that(order).is_equal_to(
+        ["audi_0", "bmw_0", "audi_1", "bmw_1", "audi_2", "bmw_2"]
+    )
+    scheduler.shutdown()
+
+
+def test_tasks_with_higher_priority_run_first():
+    scheduler, release = _blocked_scheduler()
+    order = []
+
+    jobs = [
+        scheduler.submit(order.append, "low", priority=TaskPriority.LOW),
+        scheduler.submit(order.append, "normal"),
+        scheduler.submit(order.append, "high", priority=TaskPriority.HIGH),
+    ]
+    release.set()
+    scheduler.wait(jobs)
+
+    assert_that(order).is_equal_to(["high", "normal", "low"])
+    scheduler.shutdown()
+
+
+def test_gather_raises_the_exception_of_a_failed_task():
+    scheduler = TaskScheduler(max_workers=2)
+
+    def fail():
+        raise ValueError("Failed to scrape")
+
+    with pytest.raises(ValueError, match="Failed to scrape"):
+        scheduler.gather([scheduler.submit(fail)])
+    scheduler.shutdown()
+
+
+def test_init_scheduler_uses_configured_worker_cap():
+    assert_that(
+        init_scheduler({"scheduler": {"max_workers": 4}}).max_workers
+    ).is_equal_to(4)
+    assert_that(init_scheduler({}).max_workers).is_equal_to(DEFAULT_MAX_WORKERS)
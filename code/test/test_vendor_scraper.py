@@ -1,8 +1,9 @@
 from test.price_monitor.utils.test_data_builder import create_test_line_item
-from unittest.mock import patch
+from unittest.mock import Mock, call, patch
 
 from src.price_monitor.model.vendor import Market
 from src.price_monitor.price_scraper.vendor_scraper import VendorScraper
+from src.price_monitor.utils.clock import today_dashed_str, yesterday_dashed_str
 
 line_item_de = create_test_line_item(market=Market.DE)
 
@@ -41,3 +42,64 @@ def test_run_calls_scrape_models_to_len_of_markets_given(
 
     assert actual == [line_item_de, line_item_nl]
     assert 2 == mock_scrape_models.call_count
+
+
+@patch("src.price_monitor.price_scraper.vendor_scraper.VendorScraper.scrape_models")
+def test_run_checkpoints_each_scraped_market(mock_scrape_models):
+    mock_scrape_models.side_effect = side_effect_scrape_models
+    checkpoint_repository = Mock()
+    checkpoint_repository.load.return_value = None
+
+    scraper = VendorScraper(None, None)
+    setattr(scraper, "markets", ["DE", "NL"])
+    scraper.checkpoint_repository = checkpoint_repository
+    actual = scraper.run()
+
+    assert actual == [line_item_de, line_item_nl]
+    checkpoint_repository.save.assert_has_calls(
+        [call(None, "DE", [line_item_de]), call(None, "NL", [line_item_nl])],
+        any_order=True,
+    )
+
+
+@patch("src.price_monitor.price_scraper.vendor_scraper.VendorScraper.scrape_models")
+def test_run_skips_markets_already_checkpointed(mock_scrape_models):
+    mock_scrape_models.side_effect = side_effect_scrape_models
+    checkpoint_repository = Mock()
+    checkpoint_repository.load.side_effect = lambda vendor, market: (
+        [line_item_de] if market == Market.DE else None
+    )
+
+    scraper = VendorScraper(None, None)
+    setattr(scraper, "markets", ["DE", "NL"])
+    scraper.checkpoint_repository = checkpoint_repository
+    actual = scraper.run()
+
+    assert actual == [line_item_de, line_item_nl]
+    mock_scrape_models.assert_called_once_with("NL")
+    checkpoint_repository.save.assert_called_once_with(None, "NL", [line_item_nl])
+
+
+@patch("src.price_monitor.price_scraper.vendor_scraper.VendorScraper.scrape_models")
+def test_run_does_not_checkpoint_markets_falling_back_to_yesterday(mock_scrape_models):
+    scraped_line_item = create_test_line_item(
+        market=Market.DE, last_scraped_on=today_dashed_str()
+    )
+    fallback_line_item = create_test_line_item(
+        market=Market.NL, last_scraped_on=yesterday_dashed_str()
+    )
+    mock_scrape_models.side_effect = lambda market: (
+        [scraped_line_item] if market == Market.DE else [fallback_line_item]
+    )
+    checkpoint_repository = Mock()
+    checkpoint_repository.load.return_value = None
+
+    scraper = VendorScraper(None, None)
+    setattr(scraper, "markets", [Market.DE, Market.NL])
+    scraper.checkpoint_repository = checkpoint_repository
+    actual = scraper.run()
+
+    assert actual == [scraped_line_item, fallback_line_item]
+    checkpoint_repository.save.assert_called_once_with(
+        None, Market.DE, [scraped_line_item]
+    )